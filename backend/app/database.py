@@ -1,15 +1,37 @@
+from functools import lru_cache
+import os
+
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-# SQLite database URL
-DATABASE_URL = "sqlite:///./tasks.db"
+from .storage import StorageSettings, TimedQueuePool, apply_pragmas
+
+# Storage settings (DATABASE_URL, pool sizing, SQLite pragmas; see app.storage)
+storage_settings = StorageSettings.from_env()
+DATABASE_URL = storage_settings.url
+
+# Request path: "sync" (threadpool routes) or "async" (AsyncSession over aiosqlite)
+DB_MODE = os.getenv("DB_MODE", "sync")
+
+_pool = {} if storage_settings.is_memory else {"poolclass": TimedQueuePool}
+
+# Create engine (writes)
+engine = create_engine(DATABASE_URL, **storage_settings.engine_kwargs(), **_pool)
+apply_pragmas(engine, storage_settings)
 
-# Create engine
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Read-only engine with its own connection pool, so GET traffic never waits
+# for a connection a writer holds (WAL lets these read while a write commits).
+# An in-memory database only exists on its single connection, so share it.
+if storage_settings.is_memory:
+    read_engine = engine
+else:
+    read_engine = create_engine(DATABASE_URL, **storage_settings.engine_kwargs(read_only=True), **_pool)
+    apply_pragmas(read_engine, storage_settings, read_only=True)
 
-# Create session
+# Create sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Create base class
 Base = declarative_base()
@@ -20,4 +42,40 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
+        db.close()
+
+
+# Dependency to get a read-only database session (GET routes)
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@lru_cache
+def get_async_engine():
+    """Async engine over aiosqlite, created on first use (DB_MODE=async)."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    kwargs = storage_settings.engine_kwargs()
+    if not storage_settings.is_memory:
+        kwargs["poolclass"] = AsyncAdaptedQueuePool  # aiosqlite otherwise opens a connection per session
+    async_engine = create_async_engine(DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1), **kwargs)
+    apply_pragmas(async_engine.sync_engine, storage_settings)
+    return async_engine
+
+
+@lru_cache
+def get_async_sessionmaker():
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,151 @@
+"""In-process fan-out of committed task changes to WebSocket subscribers.
+
+Events are published from whatever thread committed them (request threads,
+the group-commit writer, the rescoring scheduler) and delivered on the event
+loop that owns each subscriber. Every subscriber has a bounded buffer; one that
+falls ``FEED_BUFFER_SIZE`` events behind is dropped and told to resync, so a
+slow client can never make the hub hold unbounded memory.
+
+The hub itself is per worker process. Each event carries the user's
+``data_version`` after the change, and every subscriber remembers the latest
+version it was sent. Changes committed by other workers (or other processes
+sharing the database) never reach this hub as events; ``FeedVersionWatcher``
+(``app.scheduler``) polls the subscribed users' versions and ``catch_up``
+sends a ``resync`` event to subscribers that are behind, so their clients
+refetch. Events at or below a subscriber's version are skipped: the client
+already has, or is refetching, that state.
+
+Settings:
+  FEED_BUFFER_SIZE  events buffered per subscriber before it is dropped (default 256)
+  FEED_POLL_MS      how often each worker checks its subscribers' data versions
+                    for changes made elsewhere, in milliseconds (default 500,
+                    0 disables)
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Optional
+
+FEED_BUFFER_SIZE = int(os.getenv("FEED_BUFFER_SIZE", 256))
+FEED_POLL_MS = int(os.getenv("FEED_POLL_MS", 500))
+
+# Queued in place of further events once a subscriber has overflowed
+OVERFLOW = object()
+# Event type for changes made elsewhere: the client should refetch
+RESYNC = "resync"
+
+
+class Subscriber:
+    __slots__ = ("user_id", "loop", "queue", "version")
+
+    def __init__(self, user_id: int, loop: asyncio.AbstractEventLoop, buffer_size: int, version: int = 0):
+        self.user_id = user_id
+        self.loop = loop
+        self.version = version  # latest data version sent (or known at subscribe time)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size + 1)  # +1 for OVERFLOW
+
+    async def next_event(self) -> Any:
+        return await self.queue.get()
+
+
+class ChangeHub:
+    """Per-user subscriber registry with bounded, loop-safe delivery."""
+
+    def __init__(self, buffer_size: int = FEED_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.published = 0
+        self.dropped = 0
+        self._subscribers: dict[int, set[Subscriber]] = defaultdict(set)
+        # Data version every subscriber of a user has been sent (or caught up to)
+        self._versions: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: int, version: int = 0) -> Subscriber:
+        """Register a subscriber on the running event loop.
+
+        ``version`` is the user's data version the client is known to be at;
+        later changes made elsewhere are caught up from there.
+        """
+        subscriber = Subscriber(user_id, asyncio.get_running_loop(), self.buffer_size, version)
+        with self._lock:
+            self._subscribers[user_id].add(subscriber)
+            # Not raised past older subscribers, so they still get caught up
+            self._versions.setdefault(user_id, version)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            subscribers = self._subscribers.get(subscriber.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[subscriber.user_id]
+                    self._versions.pop(subscriber.user_id, None)
+
+    def user_ids(self) -> list[int]:
+        """Users with at least one subscriber."""
+        with self._lock:
+            return list(self._subscribers)
+
+    def publish(self, user_id: int, event: dict):
+        """Queue ``event`` for every subscriber of ``user_id``; callable from any thread."""
+        with self._lock:
+            subscribers = tuple(self._subscribers.get(user_id, ()))
+            if subscribers and "version" in event:
+                self._versions[user_id] = max(self._versions.get(user_id, 0), event["version"])
+        if not subscribers:
+            return
+        self.published += 1
+        by_loop: dict[asyncio.AbstractEventLoop, list[Subscriber]] = defaultdict(list)
+        for subscriber in subscribers:
+            by_loop[subscriber.loop].append(subscriber)
+        for loop, group in by_loop.items():
+            if _running_loop() is loop:
+                self._deliver(group, event)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(self._deliver, group, event)
+
+    def catch_up(self, versions: dict[int, int]) -> int:
+        """Send ``resync`` to users whose stored data version (``versions``) is
+        ahead of what this hub published; returns the number of users."""
+        with self._lock:
+            behind = [(user_id, version) for user_id, version in versions.items()
+                      if version > self._versions.get(user_id, version)]
+        for user_id, version in behind:
+            self.publish(user_id, {"type": RESYNC, "version": version})
+        return len(behind)
+
+    def _deliver(self, subscribers: list[Subscriber], event: dict):
+        version = event.get("version")
+        for subscriber in subscribers:
+            if version is not None and version <= subscriber.version:
+                continue
+            queue = subscriber.queue
+            if queue.qsize() < self.buffer_size:
+                queue.put_nowait(event)
+                if version is not None:
+                    subscriber.version = version
+            elif queue.qsize() == self.buffer_size:
+                # Slow consumer: stop buffering and let it drain into a resync
+                queue.put_nowait(OVERFLOW)
+                self.unsubscribe(subscriber)
+                self.dropped += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscribers = sum(len(s) for s in self._subscribers.values())
+            return {"users": len(self._subscribers), "subscribers": subscribers,
+                    "published": self.published, "dropped": self.dropped}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+change_hub = ChangeHub()
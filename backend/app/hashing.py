@@ -0,0 +1,130 @@
+"""Password hashing on a dedicated, bounded process pool.
+
+bcrypt is deliberately CPU-heavy. Running it inside request handlers lets a
+burst of logins occupy FastAPI's shared threadpool and starve ordinary reads.
+Here hashes are computed in separate processes; at most ``max_pending``
+operations may be queued or running, and callers beyond that get an immediate
+503 instead of waiting. An operation that exceeds ``HASH_TIMEOUT_SECONDS`` also
+gets a 503; it keeps its slot until the worker actually finishes it.
+
+Settings:
+  BCRYPT_ROUNDS          bcrypt cost factor (default 12); existing hashes with
+                         a different cost are rehashed on the next login
+  HASH_POOL_WORKERS      worker processes (default min(4, CPUs); 0 hashes inline)
+  HASH_POOL_MAX_PENDING  queued + running operations before returning 503
+                         (default 4 per worker)
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", min(4, os.cpu_count() or 1)))
+HASH_POOL_MAX_PENDING = int(os.getenv("HASH_POOL_MAX_PENDING", max(1, HASH_POOL_WORKERS) * 4))
+HASH_TIMEOUT_SECONDS = 30
+
+
+@lru_cache
+def _context(rounds: int):
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed: str, rounds: int) -> tuple[bool, Optional[str]]:
+    return _context(rounds).verify_and_update(password, hashed)
+
+
+class PasswordHasher:
+    """Runs bcrypt operations on a lazily started process pool with backpressure."""
+
+    def __init__(self, workers: int = HASH_POOL_WORKERS, max_pending: int = HASH_POOL_MAX_PENDING,
+                 rounds: int = BCRYPT_ROUNDS):
+        self.workers = workers
+        self.rounds = rounds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    @staticmethod
+    def _busy() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service busy. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+    def _submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise self._busy()
+        try:
+            future = self._pool().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Freed when the work completes (or is cancelled while queued), not when
+        # the caller gives up waiting, so the slots count work still in flight
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _run(self, fn, *args):
+        if self.workers <= 0:
+            return fn(*args)
+        future = self._submit(fn, *args)
+        try:
+            return future.result(timeout=HASH_TIMEOUT_SECONDS)
+        except TimeoutError:
+            future.cancel()  # drops it if it hasn't started yet
+            raise self._busy()
+
+    async def _run_async(self, fn, *args):
+        if self.workers <= 0:
+            return await asyncio.to_thread(fn, *args)
+        future = self._submit(fn, *args)
+        try:
+            # Cancelling the wrapper on timeout also cancels a still-queued future
+            return await asyncio.wait_for(asyncio.wrap_future(future), HASH_TIMEOUT_SECONDS)
+        except TimeoutError:
+            raise self._busy()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.rounds)
+
+    def verify_and_update(self, password: str, hashed: str) -> tuple[bool, Optional[str]]:
+        """Verify ``password``; also returns a new hash if the stored one uses stale settings."""
+        return self._run(_verify_and_update, password, hashed, self.rounds)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(_hash, password, self.rounds)
+
+    async def verify_and_update_async(self, password: str, hashed: str) -> tuple[bool, Optional[str]]:
+        return await self._run_async(_verify_and_update, password, hashed, self.rounds)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hasher = PasswordHasher()
@@ -1,24 +1,59 @@
 """FastAPI application entrypoint for Eisenhower Matrix Todo API with SQLite backend."""
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
+import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
-from .routers import tasks, auth
-from .database import engine
+from .routers import tasks, auth, config, dashboard, feed
+from .database import DB_MODE, engine, get_async_engine, read_engine, ReadSessionLocal, SessionLocal, storage_settings
 from .models.task import Base
 from .models.user import User  # Import User model to ensure table creation
-from .security import rate_limit_middleware
+from .models.config import PriorityConfig  # noqa: F401 - shared priority config table
+from .models.lease import SchedulerLease  # noqa: F401 - background job leases
+from .hashing import password_hasher
+from .migrations import run_migrations
+from .scheduler import DueDateRescorer, FeedVersionWatcher, JobLease, PriorityConfigWatcher, TombstoneCompactor
+from .settings import RESCORE_INTERVAL_SECONDS, TOMBSTONE_COMPACT_INTERVAL_SECONDS
+from .storage import effective_settings, pool_stats
+from .writer import task_writer
+from .feed import change_hub
+from .security import rate_limit_middleware, token_cache, user_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown events."""
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
+    # Create missing tables and bring existing databases up to date under one
+    # write lock, so concurrently booting workers don't race; request handlers
+    # assume the current schema
+    run_migrations(engine, metadata=Base.metadata)
+    logging.getLogger("uvicorn.error").info("Storage: %s", effective_settings(engine, storage_settings))
+
+    # Rescoring and compaction run in whichever worker holds their lease; the
+    # watchers keep each worker's own config and feed current
+    rescore_lease = JobLease(SessionLocal, "due_date_rescoring", 2 * RESCORE_INTERVAL_SECONDS)
+    compact_lease = JobLease(SessionLocal, "tombstone_compaction", 2 * TOMBSTONE_COMPACT_INTERVAL_SECONDS)
+    background = [
+        asyncio.create_task(job.run())
+        for job in (DueDateRescorer(SessionLocal, lease=rescore_lease),
+                    TombstoneCompactor(SessionLocal, lease=compact_lease),
+                    PriorityConfigWatcher(SessionLocal), FeedVersionWatcher(ReadSessionLocal))
+        if job.interval_seconds > 0
+    ]
     yield
-    # Cleanup if needed
+    for job_task in background:
+        job_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await job_task
+    for lease in (rescore_lease, compact_lease):
+        lease.release()
+    task_writer.shutdown()
+    password_hasher.shutdown()
+    if DB_MODE == "async":
+        await get_async_engine().dispose()
 
 
 ENV = os.getenv("ENVIRONMENT", "development")
@@ -48,15 +83,12 @@ async def security_headers(request: Request, call_next):
 
 @app.middleware("http")
 async def rate_limiting(request: Request, call_next):
-    """Apply rate limiting to API endpoints."""
-    if request.url.path.startswith("/api/tasks"):
-        try:
-            rate_limit_middleware(request)
-        except Exception as e:
-            return JSONResponse(
-                status_code=429,
-                content={"detail": "Rate limit exceeded. Please try again later."}
-            )
+    """Apply rate limiting to API endpoints (rules per path prefix, see app.ratelimit)."""
+    try:
+        await rate_limit_middleware(request)
+    except HTTPException as e:
+        detail = "Rate limit exceeded. Please try again later." if e.status_code == 429 else e.detail
+        return JSONResponse(status_code=e.status_code, content={"detail": detail}, headers=e.headers)
     return await call_next(request)
 
 app.add_middleware(
@@ -67,9 +99,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/api")
-app.include_router(tasks.router, prefix="/api")
+# Include routers; DB_MODE=async serves auth and tasks on AsyncSession instead
+if DB_MODE == "async":
+    from .routers import auth_async, tasks_async
+    app.include_router(auth_async.router, prefix="/api")
+    app.include_router(tasks_async.router, prefix="/api")
+else:
+    app.include_router(auth.router, prefix="/api")
+    app.include_router(tasks.router, prefix="/api")
+app.include_router(config.router, prefix="/api")
+app.include_router(feed.router, prefix="/api")
+app.include_router(dashboard.router, prefix="/api")
 
 @app.get("/")
 async def root():
@@ -80,3 +120,10 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"message": "Eisenhower Matrix Todo API", "version": "1.0.0", "storage": "sqlite", "status": "healthy"}
+
+@app.get("/api/metrics")
+async def metrics():
+    """In-process cache, writer and connection pool counters for this worker."""
+    return {"user_cache": user_cache.stats(), "token_cache": token_cache.stats(),
+            "task_writer": task_writer.stats(), "change_feed": change_hub.stats(),
+            "db_pool": {"read": pool_stats(read_engine), "write": pool_stats(engine)}}
@@ -0,0 +1,214 @@
+"""Versioned schema migrations, applied once at application startup.
+
+Each migration has a unique, increasing version number and must be idempotent
+(safe to run against a schema that already has the change, e.g. a database
+freshly created by ``Base.metadata.create_all``). Applied versions are recorded
+in the ``schema_version`` table.
+
+On SQLite the runner holds a ``BEGIN IMMEDIATE`` write lock for the whole run,
+so when several workers boot at once the first one migrates and the others
+wait, then find nothing left to do. Passing ``metadata`` creates missing tables
+under the same lock first; a separate ``create_all`` would race between its
+existence checks and its CREATE statements.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple, Optional
+
+from sqlalchemy import MetaData
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+def _columns(conn: Connection, table: str) -> set[str]:
+    return {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """Parse a raw SQLite timestamp string (as written by SQLAlchemy)."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _add_columns(conn: Connection, table: str, columns: dict[str, str]):
+    existing = _columns(conn, table)
+    for name, ddl in columns.items():
+        if name not in existing:
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+
+
+def _add_task_scoring_columns(conn: Connection):
+    _add_columns(conn, "tasks", {
+        "impact": "INTEGER",
+        "value_alignment": "INTEGER",
+        "effort": "INTEGER",
+        "due_date": "TIMESTAMP",
+        "priority_score": "FLOAT",
+    })
+
+
+def _add_due_date_index(conn: Connection):
+    conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_tasks_due_date ON tasks (due_date)")
+
+
+def _add_ranking_index(conn: Connection):
+    from .scoring import score_rows
+
+    # Keyset pagination relies on every task having a score
+    rows = conn.exec_driver_sql(
+        "SELECT id, urgency, importance, impact, value_alignment, effort, due_date "
+        "FROM tasks WHERE priority_score IS NULL"
+    ).all()
+    if rows:
+        due_dates = [_parse_timestamp(row[6]) for row in rows]
+        scores = score_rows([(*row[1:6], due) for row, due in zip(rows, due_dates)])
+        conn.exec_driver_sql(
+            "UPDATE tasks SET priority_score = ? WHERE id = ?",
+            [(score, row[0]) for row, score in zip(rows, scores)],
+        )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_owner_score_id ON tasks (owner_id, priority_score, id)"
+    )
+
+
+def _add_quadrant_column(conn: Connection):
+    from .models.task import QUADRANT_THRESHOLD as t
+
+    _add_columns(conn, "tasks", {"quadrant": "INTEGER"})
+    conn.exec_driver_sql(
+        "UPDATE tasks SET quadrant = CASE "
+        f"WHEN urgency >= {t} AND importance >= {t} THEN 1 "
+        f"WHEN importance >= {t} THEN 2 "
+        f"WHEN urgency >= {t} THEN 3 "
+        "ELSE 4 END WHERE quadrant IS NULL"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_owner_quadrant_score "
+        "ON tasks (owner_id, quadrant, priority_score, id)"
+    )
+
+
+def _add_user_data_version(conn: Connection):
+    _add_columns(conn, "users", {"data_version": "INTEGER NOT NULL DEFAULT 0"})
+
+
+def _add_delta_sync(conn: Connection):
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS task_tombstones ("
+        "id INTEGER PRIMARY KEY, task_id INTEGER NOT NULL, owner_id INTEGER NOT NULL, "
+        "deleted_at DATETIME NOT NULL)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_task_tombstones_owner_deleted "
+        "ON task_tombstones (owner_id, deleted_at, id)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_task_tombstones_deleted_at ON task_tombstones (deleted_at)"
+    )
+    # Tasks never updated had no updated_at; give them one so every row is in the
+    # change log. SQL now() has no fractional seconds: pad to the microsecond
+    # format SQLAlchemy writes so values compare correctly as text.
+    conn.exec_driver_sql("UPDATE tasks SET updated_at = created_at WHERE updated_at IS NULL")
+    conn.exec_driver_sql(
+        "UPDATE tasks SET updated_at = updated_at || '.000000' WHERE length(updated_at) = 19"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_owner_updated ON tasks (owner_id, updated_at, id)"
+    )
+
+
+def _add_task_search(conn: Connection):
+    from .models.task import TASK_SEARCH_DDL
+
+    for statement in TASK_SEARCH_DDL:
+        conn.exec_driver_sql(statement)
+    # Index the rows that existed before the triggers
+    conn.exec_driver_sql("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+def _add_owner_due_date_index(conn: Connection):
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_owner_due_date ON tasks (owner_id, due_date)"
+    )
+
+
+def _add_priority_config(conn: Connection):
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS priority_config ("
+        "id INTEGER PRIMARY KEY, version INTEGER NOT NULL, overrides TEXT NOT NULL, updated_at DATETIME)"
+    )
+    conn.exec_driver_sql("INSERT OR IGNORE INTO priority_config (id, version, overrides) VALUES (1, 0, '{}')")
+
+
+def _add_priority_config_rescored(conn: Connection):
+    # Earlier versions were rescored by every worker that saw them
+    _add_columns(conn, "priority_config", {"rescored": "BOOLEAN NOT NULL DEFAULT 1"})
+
+
+def _add_scheduler_leases(conn: Connection):
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS scheduler_leases ("
+        "name VARCHAR PRIMARY KEY, holder VARCHAR NOT NULL, expires_at FLOAT NOT NULL)"
+    )
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "add_task_scoring_columns", _add_task_scoring_columns),
+    Migration(2, "add_due_date_index", _add_due_date_index),
+    Migration(3, "add_ranking_index", _add_ranking_index),
+    Migration(4, "add_quadrant_column", _add_quadrant_column),
+    Migration(5, "add_user_data_version", _add_user_data_version),
+    Migration(6, "add_delta_sync", _add_delta_sync),
+    Migration(7, "add_task_search", _add_task_search),
+    Migration(8, "add_owner_due_date_index", _add_owner_due_date_index),
+    Migration(9, "add_priority_config", _add_priority_config),
+    Migration(10, "add_priority_config_rescored", _add_priority_config_rescored),
+    Migration(11, "add_scheduler_leases", _add_scheduler_leases),
+]
+
+
+def _applied_versions(conn: Connection) -> set[int]:
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        "version INTEGER PRIMARY KEY, name VARCHAR NOT NULL, applied_at TIMESTAMP NOT NULL)"
+    )
+    return {row[0] for row in conn.exec_driver_sql("SELECT version FROM schema_version")}
+
+
+def run_migrations(engine: Engine, migrations: list[Migration] = MIGRATIONS,
+                   metadata: Optional[MetaData] = None) -> list[int]:
+    """Create missing ``metadata`` tables, then apply pending migrations in
+    version order; returns the versions applied."""
+    applied_now = []
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            if metadata is not None:
+                metadata.create_all(conn)
+            applied = _applied_versions(conn)
+            for migration in sorted(migrations, key=lambda m: m.version):
+                if migration.version in applied:
+                    continue
+                logger.info("Applying migration %d: %s", migration.version, migration.name)
+                migration.apply(conn)
+                conn.exec_driver_sql(
+                    "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                    (migration.version, migration.name, datetime.now(timezone.utc).isoformat()),
+                )
+                applied_now.append(migration.version)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return applied_now
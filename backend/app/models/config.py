@@ -0,0 +1,30 @@
+"""Shared priority scoring configuration."""
+from sqlalchemy import DDL, Boolean, Column, DateTime, Integer, Text, event
+
+from ..database import Base
+
+# The single configuration row
+PRIORITY_CONFIG_ID = 1
+
+
+class PriorityConfig(Base):
+    """Runtime priority overrides shared by every worker (see ``app.settings``).
+
+    ``version`` is bumped on every change; workers compare it with their
+    cached copy to know when to reload. ``rescored`` records whether the
+    stored task scores already reflect this version (see
+    ``PriorityConfigWatcher``).
+    """
+    __tablename__ = "priority_config"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    overrides = Column(Text, nullable=False, default="{}")  # JSON object of config keys
+    rescored = Column(Boolean, nullable=False, default=True, server_default="1")
+    updated_at = Column(DateTime(timezone=True))
+
+
+event.listen(
+    PriorityConfig.__table__, "after_create",
+    DDL(f"INSERT INTO priority_config (id, version, overrides) VALUES ({PRIORITY_CONFIG_ID}, 0, '{{}}')"),
+)
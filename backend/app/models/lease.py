@@ -0,0 +1,17 @@
+"""Leases electing the worker process that runs a background job."""
+from sqlalchemy import Column, Float, String
+
+from ..database import Base
+
+
+class SchedulerLease(Base):
+    """One row per leased job (see ``app.scheduler.JobLease``).
+
+    ``holder`` identifies the worker process running the job; another worker
+    may take the lease over once ``expires_at`` (Unix time) has passed.
+    """
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String, primary_key=True)
+    holder = Column(String, nullable=False)
+    expires_at = Column(Float, nullable=False)
@@ -1,13 +1,46 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
-from datetime import datetime, timezone
-from ..settings import get_priority_config
+from ..scoring import score_row
+
+# Eisenhower quadrants: urgency/importance >= 6 counts as urgent/important.
+# 1 = Do First (urgent + important), 2 = Schedule (important only),
+# 3 = Delegate (urgent only), 4 = Eliminate (neither).
+QUADRANT_THRESHOLD = 6
+QUADRANTS = (1, 2, 3, 4)
+
+
+def utcnow() -> datetime:
+    """Change timestamp for ``updated_at``/``deleted_at``.
+
+    Set in Python rather than with SQL ``now()`` so values carry microseconds
+    and sort reliably for delta sync (see ``GET /tasks/changes``).
+    """
+    return datetime.now(timezone.utc)
+
+
+def quadrant_for(urgency: int, importance: int) -> int:
+    """Return the Eisenhower quadrant (1-4) for the given ratings."""
+    if importance >= QUADRANT_THRESHOLD:
+        return 1 if urgency >= QUADRANT_THRESHOLD else 2
+    return 3 if urgency >= QUADRANT_THRESHOLD else 4
 
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves GET /tasks/ ranking and keyset pagination (see app.pagination)
+        Index("ix_tasks_owner_score_id", "owner_id", "priority_score", "id"),
+        # Serves per-quadrant counts and top-N for /tasks/matrix/data
+        Index("ix_tasks_owner_quadrant_score", "owner_id", "quadrant", "priority_score", "id"),
+        # Serves GET /tasks/changes
+        Index("ix_tasks_owner_updated", "owner_id", "updated_at", "id"),
+        # Serves the due-soon window scan of GET /tasks/top?as_of_now=true
+        Index("ix_tasks_owner_due_date", "owner_id", "due_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -17,15 +50,21 @@ class Task(Base):
     impact = Column(Integer, nullable=True)  # 1-10 scale
     value_alignment = Column(Integer, nullable=True)  # 1-10 scale
     effort = Column(Integer, nullable=True)  # 1-10 scale (higher = more cost)
-    due_date = Column(DateTime(timezone=True), nullable=True)
+    due_date = Column(DateTime(timezone=True), nullable=True, index=True)  # stored as UTC
     priority_score = Column(Float, nullable=True)  # 0-100 scaled
+    quadrant = Column(Integer, nullable=True)  # 1-4, derived from urgency/importance on write
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Set on insert as well, so new tasks show up in GET /tasks/changes
+    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
     
     # Relationship to user
     owner = relationship("User", back_populates="tasks")
     
+    def classify_quadrant(self):
+        """Eisenhower quadrant for the current urgency/importance."""
+        return quadrant_for(self.urgency, self.importance)
+
     def calculate_priority_score(self):
         """Compute advanced priority score.
 
@@ -33,46 +72,48 @@ class Task(Base):
         Effort: penalizes score
         Due date: bonus if within configured soon window
         Output scaled 0..100 and rounded to 2 decimals.
+        See ``app.scoring`` for the batch variant used when rescoring many rows.
         """
-        cfg = get_priority_config()
-
-        def norm(val):
-            if val is None:
-                return None
-            return (val - 1) / 9 if 1 <= val <= 10 else 0.0
-
-        u = norm(self.urgency)
-        imp = norm(self.importance)
-        impact = norm(self.impact)
-        value = norm(self.value_alignment)
-        eff = norm(self.effort)
-
-        weights = {
-            'urgency': cfg['weight_urgency'] if u is not None else 0,
-            'importance': cfg['weight_importance'] if imp is not None else 0,
-            'impact': cfg['weight_impact'] if impact is not None else 0,
-            'value': cfg['weight_value'] if value is not None else 0,
-        }
-        total_w = sum(weights.values()) or 1.0
-        base = 0.0
-        if u is not None: base += u * weights['urgency']
-        if imp is not None: base += imp * weights['importance']
-        if impact is not None: base += impact * weights['impact']
-        if value is not None: base += value * weights['value']
-        base /= total_w
-
-        if eff is not None:
-            base *= (1 - cfg['effort_penalty'] * eff)
-
-        if self.due_date and self.due_date.tzinfo is not None:
-            now = datetime.now(timezone.utc)
-            remaining = (self.due_date - now).total_seconds()
-            if remaining > 0:
-                days = remaining / 86400
-                if days <= cfg['due_soon_days']:
-                    bonus = (1 - days / cfg['due_soon_days']) * cfg['due_soon_max_bonus']
-                    if bonus > 0:
-                        base *= (1 + min(bonus, cfg['due_soon_max_bonus']))
-
-        score = max(0.0, min(base * 100, 100))
-        return round(score, 2)
+        return score_row(
+            self.urgency, self.importance, self.impact,
+            self.value_alignment, self.effort, self.due_date,
+        )
+
+
+class TaskTombstone(Base):
+    """Record of a deleted task, kept so delta sync can report the deletion.
+
+    Compacted after ``TOMBSTONE_RETENTION_DAYS`` (see ``app.scheduler``).
+    """
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_owner_deleted", "owner_id", "deleted_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    owner_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, index=True)
+
+
+# Full-text index over task titles and descriptions (SQLite FTS5, see
+# app.search). It is an external-content table: it stores only the index and
+# reads text from ``tasks``; the triggers keep it in sync with every write path.
+TASK_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END",
+)
+
+for _statement in TASK_SEARCH_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(Task.__table__, "before_drop", DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"))
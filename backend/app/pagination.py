@@ -0,0 +1,90 @@
+"""Keyset (cursor) pagination over the task ranking.
+
+Tasks are ranked by ``(priority_score DESC, id DESC)``, which the composite
+``(owner_id, priority_score, id)`` index serves with a single backward range
+scan. A cursor is the opaque, URL-safe encoding of the last row's sort key;
+the next page starts strictly after it.
+
+Every write path stores a score and migration 3 backfills legacy rows, so
+``priority_score`` is not expected to be NULL; such rows would sort last and
+are only reachable through a cursor taken from another unscored row.
+"""
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, tuple_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(priority_score: Optional[float], task_id: int) -> str:
+    raw = json.dumps([priority_score, task_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[Optional[float], int]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        score, task_id = json.loads(raw)
+        if score is not None:
+            score = float(score)
+        return score, int(task_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def ranking_order(task_cls):
+    """ORDER BY clause matching the composite ranking index."""
+    return (task_cls.priority_score.desc(), task_cls.id.desc())
+
+
+def after_cursor(task_cls, cursor: tuple[Optional[float], int]):
+    """WHERE clause selecting the rows ranked after ``cursor``."""
+    score, task_id = cursor
+    if score is None:
+        return and_(task_cls.priority_score.is_(None), task_cls.id < task_id)
+    return tuple_(task_cls.priority_score, task_cls.id) < tuple_(score, task_id)
+
+
+# Delta sync (GET /tasks/changes) walks two change logs in commit-time order:
+# tasks by (updated_at, id) and tombstones by (deleted_at, id). Its cursor holds
+# the last position reached in each.
+SyncKey = tuple[Optional[datetime], int]
+
+
+def encode_sync_cursor(tasks_key: SyncKey, deleted_key: SyncKey) -> str:
+    def pack(key: SyncKey):
+        ts, row_id = key
+        return [ts.isoformat() if ts else None, row_id]
+
+    raw = json.dumps({"t": pack(tasks_key), "d": pack(deleted_key)}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_sync_cursor(token: str) -> tuple[SyncKey, SyncKey]:
+    def unpack(key) -> SyncKey:
+        ts, row_id = key
+        if ts is not None:
+            # Stored timestamps are naive UTC (SQLite keeps no offset)
+            ts = datetime.fromisoformat(ts).replace(tzinfo=None)
+        return ts, int(row_id)
+
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        return unpack(raw["t"]), unpack(raw["d"])
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def after_sync_key(ts_column, id_column, key: SyncKey):
+    """WHERE clause selecting change-log rows after ``key`` (everything if unset)."""
+    ts, row_id = key
+    if ts is None:
+        return ts_column.is_not(None)
+    return tuple_(ts_column, id_column) > tuple_(ts, row_id)
@@ -0,0 +1,290 @@
+"""Sliding-window rate limiter with pluggable storage.
+
+Each client/route key keeps two counters: hits in the current fixed window and
+hits in the previous one. The request rate is estimated as
+``previous * (1 - elapsed_fraction) + current``, which approximates a true
+sliding window in O(1) time and constant memory per key.
+
+Stores:
+  memory  per-process, LRU-bounded (``RATE_LIMIT_MAX_KEYS``); idle clients are
+          evicted first
+  sqlite  a small SQLite file shared by all workers on the host
+          (``RATE_LIMIT_SQLITE_PATH``)
+  redis   shared across hosts (``REDIS_URL``); requires the ``redis`` package
+
+Limits are configured per path prefix with ``RATE_LIMIT_RULES``, e.g.
+``/api/tasks=100/60;/api/auth=20/60`` (requests / seconds). The longest
+matching prefix wins; paths without a rule are not limited. The default,
+``DEFAULT_RULES``, covers tasks and the priority config (whose updates rescore
+every task).
+
+The sqlite and redis stores block on I/O (a write lock, a network round trip),
+so the middleware runs them in the threadpool; memory checks stay inline.
+When a store fails, ``RATE_LIMIT_FAIL_OPEN`` decides: 1 (default) lets the
+request through, logging a warning at most once a minute; 0 rejects it with
+503 until the store is back.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimit(NamedTuple):
+    limit: int
+    window: float  # seconds
+
+
+class WindowState(NamedTuple):
+    index: int  # which fixed window ``current`` counts
+    current: int
+    previous: int
+
+
+def sliding_window_hit(state: Optional[WindowState], rule: RateLimit,
+                       now: float) -> tuple[WindowState, bool, float]:
+    """Apply one hit; returns ``(new_state, allowed, retry_after_seconds)``."""
+    index = int(now // rule.window)
+    if state is None or index > state.index + 1:
+        current, previous = 0, 0
+    elif index == state.index + 1:
+        current, previous = 0, state.current
+    else:
+        current, previous = state.current, state.previous
+
+    fraction = (now % rule.window) / rule.window
+    if previous * (1 - fraction) + current + 1 <= rule.limit:
+        return WindowState(index, current + 1, previous), True, 0.0
+
+    remaining = rule.window * (1 - fraction)
+    if current + 1 > rule.limit or previous == 0:
+        # Must wait for the next window (whose "previous" will be ``current``)
+        retry_after = remaining
+    else:
+        # Wait until the previous window's weight has decayed enough
+        needed = 1 - (rule.limit - current - 1) / previous
+        retry_after = max(0.0, (needed - fraction) * rule.window)
+    return WindowState(index, current, previous), False, min(retry_after, remaining)
+
+
+class StoreUnavailable(Exception):
+    """The rate-limit store failed and the limiter is configured to fail closed."""
+
+
+class MemoryStore:
+    """Per-process store holding at most ``max_keys`` keys (LRU eviction)."""
+
+    blocking = False
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._data: OrderedDict[str, WindowState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, rule: RateLimit, now: float) -> tuple[bool, float]:
+        with self._lock:
+            state, allowed, retry_after = sliding_window_hit(self._data.get(key), rule, now)
+            self._data[key] = state
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_keys:
+                self._data.popitem(last=False)
+        return allowed, retry_after
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SQLiteStore:
+    """Store shared between worker processes through a SQLite file."""
+
+    PRUNE_EVERY = 1000
+    blocking = True
+
+    def __init__(self, path: str, max_keys: int = 100_000):
+        self.path = path
+        self.max_keys = max_keys
+        self._local = threading.local()
+        self._hits = 0
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, idx INTEGER NOT NULL, curr INTEGER NOT NULL, "
+            "prev INTEGER NOT NULL, last_seen REAL NOT NULL)"
+        )
+        self._conn().execute(
+            "CREATE INDEX IF NOT EXISTS ix_rate_limits_last_seen ON rate_limits (last_seen)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # counters are disposable
+            self._local.conn = conn
+        return conn
+
+    def hit(self, key: str, rule: RateLimit, now: float) -> tuple[bool, float]:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT idx, curr, prev FROM rate_limits WHERE key = ?", (key,)).fetchone()
+            state, allowed, retry_after = sliding_window_hit(WindowState(*row) if row else None, rule, now)
+            conn.execute(
+                "INSERT INTO rate_limits (key, idx, curr, prev, last_seen) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET idx = excluded.idx, curr = excluded.curr, "
+                "prev = excluded.prev, last_seen = excluded.last_seen",
+                (key, state.index, state.current, state.previous, now),
+            )
+            self._hits += 1
+            if self._hits % self.PRUNE_EVERY == 0:
+                self._prune(conn, now - 2 * rule.window)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed, retry_after
+
+    def _prune(self, conn: sqlite3.Connection, idle_before: float):
+        # Keys idle for two windows carry no state worth keeping
+        conn.execute("DELETE FROM rate_limits WHERE last_seen < ?", (idle_before,))
+        conn.execute(
+            "DELETE FROM rate_limits WHERE key IN (SELECT key FROM rate_limits "
+            "ORDER BY last_seen DESC LIMIT -1 OFFSET ?)",
+            (self.max_keys,),
+        )
+
+    def clear(self):
+        self._conn().execute("DELETE FROM rate_limits")
+
+
+class RedisStore:
+    """Store shared across hosts; state lives in one Redis hash per key."""
+
+    blocking = True
+
+    _SCRIPT = """
+    local limit = tonumber(ARGV[1])
+    local window = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local index = math.floor(now / window)
+    local s = redis.call('HMGET', KEYS[1], 'idx', 'curr', 'prev')
+    local sidx = tonumber(s[1])
+    local curr = tonumber(s[2]) or 0
+    local prev = tonumber(s[3]) or 0
+    if sidx == nil or index > sidx + 1 then
+      curr = 0; prev = 0
+    elseif index == sidx + 1 then
+      prev = curr; curr = 0
+    end
+    local fraction = (now % window) / window
+    local allowed = 0
+    if prev * (1 - fraction) + curr + 1 <= limit then
+      curr = curr + 1
+      allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 'idx', index, 'curr', curr, 'prev', prev)
+    redis.call('PEXPIRE', KEYS[1], math.ceil(window * 2000))
+    return {allowed, tostring(curr), tostring(prev)}
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis  # optional dependency
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self._script = self.client.register_script(self._SCRIPT)
+
+    def hit(self, key: str, rule: RateLimit, now: float) -> tuple[bool, float]:
+        allowed, curr, prev = self._script(keys=[self.prefix + key], args=[rule.limit, rule.window, now])
+        if allowed:
+            return True, 0.0
+        # Recompute the wait locally from the returned counters
+        state = WindowState(int(now // rule.window), int(curr), int(prev))
+        return False, sliding_window_hit(state, rule, now)[2]
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + "*"):
+            self.client.delete(key)
+
+
+def parse_rules(spec: str) -> dict[str, RateLimit]:
+    """Parse ``prefix=limit/seconds;...`` into a rule table."""
+    rules = {}
+    for part in filter(None, (p.strip() for p in spec.split(";"))):
+        prefix, _, value = part.partition("=")
+        limit, _, window = value.partition("/")
+        rules[prefix.strip()] = RateLimit(int(limit), float(window or 60))
+    return rules
+
+
+class RateLimiter:
+    """Applies per-route rules to client keys using a store."""
+
+    ERROR_LOG_INTERVAL = 60.0
+
+    def __init__(self, store, rules: dict[str, RateLimit], clock=time.time, fail_open: bool = True):
+        self.store = store
+        self.clock = clock
+        self.fail_open = fail_open
+        self._last_error_log = -math.inf
+        # Longest prefix first so the most specific rule wins
+        self.rules = sorted(rules.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def rule_for(self, path: str) -> Optional[tuple[str, RateLimit]]:
+        for prefix, rule in self.rules:
+            if path.startswith(prefix):
+                return prefix, rule
+        return None
+
+    def check(self, client: str, path: str) -> tuple[bool, float]:
+        """Record a request; returns ``(allowed, retry_after_seconds)``."""
+        match = self.rule_for(path)
+        if match is None:
+            return True, 0.0
+        prefix, rule = match
+        try:
+            return self.store.hit(f"{prefix}|{client}", rule, self.clock())
+        except Exception as exc:
+            now = time.monotonic()
+            if now - self._last_error_log >= self.ERROR_LOG_INTERVAL:
+                self._last_error_log = now
+                logger.warning("Rate limit store failed (%s): %s", "allowing" if self.fail_open else "rejecting",
+                               exc, exc_info=True)
+            if self.fail_open:
+                return True, 0.0
+            raise StoreUnavailable from exc
+
+    def reset(self):
+        self.store.clear()
+
+
+DEFAULT_RULES = "/api/tasks=100/60;/api/config=20/60"
+
+
+def limiter_from_env() -> RateLimiter:
+    backend = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    max_keys = int(os.getenv("RATE_LIMIT_MAX_KEYS", 100_000))
+    if backend == "redis":
+        store = RedisStore(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    elif backend == "sqlite":
+        store = SQLiteStore(os.getenv("RATE_LIMIT_SQLITE_PATH", "./ratelimit.db"), max_keys=max_keys)
+    else:
+        store = MemoryStore(max_keys=max_keys)
+    return RateLimiter(store, parse_rules(os.getenv("RATE_LIMIT_RULES", DEFAULT_RULES)),
+                       fail_open=os.getenv("RATE_LIMIT_FAIL_OPEN", "1") != "0")
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
@@ -3,52 +3,64 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from ..database import get_db
 from ..models.user import User
 from ..schemas.user import UserCreate, UserResponse, Token
 from ..security import (
-    verify_password, 
-    get_password_hash, 
+    verify_and_update_password_async,
+    get_password_hash_async,
     create_access_token,
     get_current_user,
+    CurrentUser,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
+def _user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+
+def _save_user(db: Session, user: User) -> User:
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+# Register and login are async so that while bcrypt runs in the hashing pool
+# they hold no threadpool thread; only their short queries run in one.
 @router.post("/register", response_model=UserResponse)
-def register_user(user: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user: UserCreate, db: Session = Depends(get_db)):
     """Register a new user."""
     # Check if user already exists
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if db_user:
+    if await run_in_threadpool(_user_by_email, db, user.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Create new user
-    hashed_password = get_password_hash(user.password)
     db_user = User(
         email=user.email,
-        hashed_password=hashed_password
+        hashed_password=await get_password_hash_async(user.password)
     )
-    
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    
-    return db_user
+    return await run_in_threadpool(_save_user, db, db_user)
 
 
 @router.post("/login", response_model=Token)
-def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """Login user and return access token."""
     # Authenticate user
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await run_in_threadpool(_user_by_email, db, form_data.username)
+    verified, new_hash = (
+        await verify_and_update_password_async(form_data.password, user.hashed_password)
+        if user else (False, None)
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -61,6 +73,11 @@ def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = D
             detail="Inactive user"
         )
     
+    # Transparently upgrade hashes created with outdated cost settings
+    if new_hash:
+        user.hashed_password = new_hash
+        await run_in_threadpool(db.commit)
+    
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -71,6 +88,6 @@ def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = D
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(current_user: CurrentUser = Depends(get_current_user)):
     """Get current user information."""
     return current_user
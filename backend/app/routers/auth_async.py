@@ -0,0 +1,83 @@
+"""Async authentication routes (DB_MODE=async); same contract as ``routers.auth``."""
+from datetime import timedelta
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_async_db
+from ..models.user import User
+from ..schemas.user import UserCreate, UserResponse, Token
+from ..security import (
+    verify_and_update_password_async,
+    get_password_hash_async,
+    create_access_token,
+    get_current_user_async,
+    CurrentUser,
+    ACCESS_TOKEN_EXPIRE_MINUTES
+)
+
+router = APIRouter(prefix="/auth", tags=["authentication"])
+
+
+async def _user_by_email(db: AsyncSession, email: str):
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
+
+
+@router.post("/register", response_model=UserResponse)
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """Register a new user."""
+    if await _user_by_email(db, user.email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+
+    db_user = User(
+        email=user.email,
+        hashed_password=await get_password_hash_async(user.password)
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+
+    return db_user
+
+
+@router.post("/login", response_model=Token)
+async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    """Login user and return access token."""
+    user = await _user_by_email(db, form_data.username)
+    verified, new_hash = (
+        await verify_and_update_password_async(form_data.password, user.hashed_password)
+        if user else (False, None)
+    )
+    if not verified:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+
+    # Transparently upgrade hashes created with outdated cost settings
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
+    access_token = create_access_token(
+        data={"sub": user.email}, expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_current_user_info(current_user: CurrentUser = Depends(get_current_user_async)):
+    """Get current user information."""
+    return current_user
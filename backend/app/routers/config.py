@@ -1,5 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+
+from ..database import get_db
+from ..scoring import rescore_tasks
+from ..security import CurrentUser, get_current_user
 from ..settings import get_priority_config, set_priority_overrides, clear_priority_overrides
 
 router = APIRouter(prefix="/config", tags=["config"])
@@ -22,14 +27,25 @@ def get_priority_settings():
 
 
 @router.put("/priority")
-def update_priority_settings(payload: PriorityOverrides):
-    """Update (override) runtime priority scoring parameters. Persist only in memory until restart."""
+def update_priority_settings(payload: PriorityOverrides, db: Session = Depends(get_db),
+                             current_user: CurrentUser = Depends(get_current_user)):
+    """Update (override) runtime priority scoring parameters for all workers.
+
+    Requires authentication: the change rescores every user's tasks.
+
+    The overrides are stored with a new config version, and stored task scores
+    are recomputed in the same transaction so rankings reflect the new weights.
+    Other workers pick the change up within ``PRIORITY_CONFIG_CHECK_MS``."""
     overrides = payload.model_dump(exclude_unset=True)
-    cfg = set_priority_overrides(**overrides)
+    cfg = set_priority_overrides(db=db, rescored=True, **overrides)
+    rescore_tasks(db, cfg=cfg)
     return cfg
 
 
 @router.delete("/priority/overrides")
-def reset_priority_settings():
+def reset_priority_settings(db: Session = Depends(get_db),
+                            current_user: CurrentUser = Depends(get_current_user)):
     """Clear all runtime overrides, reverting to environment-variable configuration."""
-    return clear_priority_overrides()
+    cfg = clear_priority_overrides(db=db, rescored=True)
+    rescore_tasks(db, cfg=cfg)
+    return cfg
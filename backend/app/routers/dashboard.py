@@ -0,0 +1,89 @@
+"""Single round-trip dashboard: user, ranked task list and matrix together."""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..database import get_read_db
+from ..models.task import QUADRANTS, Task
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, ranking_order
+from ..security import get_current_user, CurrentUser
+from ..serialization import TASK_FIELDS, json_response
+from ..versioning import etag_headers, not_modified, task_etag
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+def _selected_fields(fields: Optional[str]) -> tuple[str, ...]:
+    if not fields:
+        return TASK_FIELDS
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = sorted(set(requested) - set(TASK_FIELDS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown task fields: {', '.join(unknown)}"
+        )
+    # id is always included so clients can key and update tasks
+    return ("id", *(f for f in TASK_FIELDS if f in requested and f != "id"))
+
+
+@router.get("/", response_model=dict)
+def get_dashboard(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated task fields to return (default: all)"),
+    db: Session = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """Everything the frontend needs after login, in one request.
+
+    One ranked scan of the user's tasks produces the first ``limit`` tasks of
+    the list (with ``total`` and a ``next_cursor`` for ``GET /tasks/``), the top
+    ``limit`` tasks of every quadrant and the quadrant counts, matching what
+    ``/auth/me``, ``/tasks/`` and ``/tasks/matrix/data`` return separately.
+    """
+    etag = task_etag(request, db, current_user.id)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    selected = _selected_fields(fields)
+    columns = [getattr(Task, name) for name in selected]
+    # priority_score and quadrant are needed for the cursor and grouping
+    rows = db.execute(
+        select(*columns, Task.priority_score.label("_score"), Task.quadrant.label("_quadrant"))
+        .where(Task.owner_id == current_user.id)
+        .order_by(*ranking_order(Task))
+    )
+
+    tasks = []
+    quadrants = {q: [] for q in QUADRANTS}
+    counts = {q: 0 for q in QUADRANTS}
+    total = 0
+    last = None
+    for row in rows:
+        total += 1
+        quadrant = row[-1]
+        counts[quadrant] = counts.get(quadrant, 0) + 1
+        in_list = total <= limit
+        in_quadrant = quadrant in quadrants and len(quadrants[quadrant]) < limit
+        if not (in_list or in_quadrant):
+            continue
+        task = dict(zip(selected, row))
+        if in_list:
+            tasks.append(task)
+            last = row
+        if in_quadrant:
+            quadrants[quadrant].append(task)
+
+    next_cursor = encode_cursor(last[-2], last[0]) if total > limit else None
+    matrix = {f"quadrant_{q}": quadrants[q] for q in QUADRANTS}
+    matrix["counts"] = {f"quadrant_{q}": counts[q] for q in QUADRANTS}
+    user = {"email": current_user.email, "id": current_user.id,
+            "is_active": current_user.is_active, "created_at": current_user.created_at}
+    return json_response(
+        {"user": user, "tasks": tasks, "total": total, "next_cursor": next_cursor, "matrix": matrix},
+        headers=etag_headers(etag),
+    )
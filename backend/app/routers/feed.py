@@ -0,0 +1,83 @@
+"""Per-user change feed over WebSocket.
+
+Connect to ``/api/tasks/feed?token=<access token>`` (browsers can't set an
+Authorization header on WebSockets). The server sends one JSON message per
+committed change::
+
+    {"type": "created" | "updated", "version": 7, "task": {...}}
+    {"type": "deleted", "version": 8, "ids": [3]}
+    {"type": "changed", "version": 9, "ids": [4, 5]}   # bulk create/update: refetch these
+    {"type": "rescored", "version": 10}                # scores changed: refetch
+    {"type": "resync", "version": 12}                  # changed through another worker: refetch
+
+``version`` is the user's data version after the change; a gap means events
+were missed and the client should refetch. A client that falls too far behind
+is closed with code 4008 and should reconnect and refetch.
+
+Changes made through the worker a client is connected to arrive as full
+events; changes made through other workers arrive, within ``FEED_POLL_MS``,
+as ``resync`` (see ``app.feed``).
+"""
+import asyncio
+
+from fastapi import APIRouter, HTTPException, WebSocket
+from starlette.concurrency import run_in_threadpool
+
+from ..database import ReadSessionLocal
+from ..feed import OVERFLOW, change_hub
+from ..security import get_current_user
+from ..versioning import data_version
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+SLOW_CONSUMER_CLOSE_CODE = 4008
+UNAUTHORIZED_CLOSE_CODE = 4401
+
+
+def _authenticate(token: str):
+    """The token's user and their current data version."""
+    db = ReadSessionLocal()
+    try:
+        user = get_current_user(token, db)
+        return user, data_version(db, user.id)
+    finally:
+        db.close()
+
+
+async def _push_events(websocket: WebSocket, subscriber):
+    while True:
+        event = await subscriber.next_event()
+        if event is OVERFLOW:
+            await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="slow consumer")
+            return
+        await websocket.send_json(event)
+
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    # Idle subscribers are only written to when something changes, so watch
+    # the receive side to release them as soon as the client goes away.
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+@router.websocket("/feed")
+async def task_feed(websocket: WebSocket, token: str = ""):
+    """Push the current user's committed task changes."""
+    try:
+        user, version = await run_in_threadpool(_authenticate, token)
+    except HTTPException:
+        await websocket.close(code=UNAUTHORIZED_CLOSE_CODE)
+        return
+
+    await websocket.accept()
+    subscriber = change_hub.subscribe(user.id, version)
+    tasks = [asyncio.create_task(_push_events(websocket, subscriber)),
+             asyncio.create_task(_wait_for_disconnect(websocket))]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        change_hub.unsubscribe(subscriber)
+        for task in tasks:
+            task.cancel()
+        # A send racing a disconnect may fail; the connection is gone either way
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,46 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
-from typing import List
-
-from ..database import get_db
-from ..models.task import Task
-from ..models.user import User
-from ..schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskList
-from ..security import validate_task_input, validate_priority_values, get_current_user
-from sqlalchemy import inspect
-
-def _ensure_new_columns(db: Session):
-    """Runtime lightweight migration for new nullable columns (SQLite only)."""
-    inspector = inspect(db.bind)
-    cols = {c['name'] for c in inspector.get_columns('tasks')}
-    new_cols = {
-        'impact': 'INTEGER',
-        'value_alignment': 'INTEGER',
-        'effort': 'INTEGER',
-        'due_date': 'TIMESTAMP',
-    }
-    for name, ddl in new_cols.items():
-        if name not in cols:
-            db.execute(f'ALTER TABLE tasks ADD COLUMN {name} {ddl}')
-    if 'priority_score' not in cols:
-        db.execute('ALTER TABLE tasks ADD COLUMN priority_score FLOAT')
-    db.commit()
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import List, Optional
+
+from ..database import get_read_db
+from ..models.task import QUADRANTS, Task, TaskTombstone, quadrant_for, utcnow
+from ..pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, after_cursor, after_sync_key, decode_cursor,
+    decode_sync_cursor, encode_cursor, encode_sync_cursor, ranking_order,
+)
+from ..schemas.task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskList, TaskChanges,
+    TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete, BulkItemResult, BulkResult,
+)
+from ..scoring import SCORE_COLUMNS, score_rows
+from ..search import after_rank, search_select
+from ..serialization import json_response, rows_to_dicts, task_columns
+from ..settings import TOMBSTONE_RETENTION_DAYS
+from ..topk import top_tasks, top_tasks_as_of
+from ..versioning import bump_data_version, etag_headers, not_modified, task_etag
+from ..writer import task_writer
+from ..scanner import content_scanner
+from ..security import (
+    INVALID_CONTENT_DETAIL, validate_task_input, validate_priority_values, get_current_user, CurrentUser,
+)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Change timestamps are taken just before a write acquires SQLite's lock, so a
+# slow transaction can commit a slightly older timestamp than one already
+# synced. Caught-up sync cursors therefore trail "now" by this much; clients
+# receive those recent changes again, which is harmless (upserts/deletes).
+CHANGES_OVERLAP = timedelta(seconds=5)
 
-@router.post("/", response_model=TaskResponse)
-def create_task(task: TaskCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Create a new task"""
-    _ensure_new_columns(db)
-    
+
+def _validate_new_task(task: TaskCreate):
     # Validate input for security
     validate_task_input(task.title, task.description)
     validate_priority_values(
         task.urgency, task.importance, 
         task.impact, task.value_alignment, task.effort
     )
-    
+
+
+def _insert_task(task: TaskCreate, owner_id: int, db: Session) -> TaskResponse:
+    """Writer mutation: insert ``task`` for ``owner_id`` (see app.writer)."""
     db_task = Task(
         title=task.title.strip(),
         description=task.description.strip() if task.description else None,
@@ -50,52 +56,395 @@ def create_task(task: TaskCreate, db: Session = Depends(get_db), current_user: U
         value_alignment=task.value_alignment,
         effort=task.effort,
         due_date=task.due_date,
-        owner_id=current_user.id  # Associate task with current user
+        owner_id=owner_id  # Associate task with current user
     )
     
-    # Calculate priority score
+    # Calculate priority score and matrix quadrant
     db_task.priority_score = db_task.calculate_priority_score()
+    db_task.quadrant = db_task.classify_quadrant()
     
     db.add(db_task)
-    db.commit()
+    db.flush()
     db.refresh(db_task)
-    
-    return db_task
+    created = TaskResponse.model_validate(db_task)
+    bump_data_version(db, [owner_id], {"type": "created", "task": created.model_dump(mode="json")})
+    return created
+
+
+@router.post("/", response_model=TaskResponse)
+def create_task(task: TaskCreate, current_user: CurrentUser = Depends(get_current_user)):
+    """Create a new task"""
+    _validate_new_task(task)
+    return task_writer.execute(partial(_insert_task, task, current_user.id))
+
+
+def _validation_error(title, description, *priority_values, scanned: bool = False) -> Optional[str]:
+    """Run the single-task security checks, returning the error instead of raising."""
+    try:
+        validate_task_input(title, description, scanned=scanned)
+        validate_priority_values(*priority_values)
+    except HTTPException as e:
+        return e.detail
+    return None
+
+
+# Optional in TaskUpdate (omit to keep the value) but can't be set to null
+NON_NULLABLE_FIELDS = ("title", "urgency", "importance")
+
+
+def _null_field_error(update_data: dict) -> Optional[str]:
+    nulled = [field for field in NON_NULLABLE_FIELDS if field in update_data and update_data[field] is None]
+    return f"{', '.join(nulled)} cannot be null" if nulled else None
+
+
+def _bulk_result(results: list[BulkItemResult]) -> BulkResult:
+    failed = sum(1 for r in results if r.status == "error")
+    return BulkResult(results=results, succeeded=len(results) - failed, failed=failed)
+
+
+def _insert_tasks_bulk(rows: list[dict], owner_id: int, db: Session) -> list[int]:
+    """Writer mutation: insert scored ``rows`` for ``owner_id``; returns the new ids in row order."""
+    # executemany with RETURNING (insertmanyvalues). SQLAlchemy 2.0.0 can't
+    # order the returned rows by parameter (sort_by_parameter_order is
+    # 2.0.10+), but new rowids ascend in insertion order, so sorting does.
+    ids = sorted(db.scalars(insert(Task.__table__).returning(Task.__table__.c.id), rows).all())
+    bump_data_version(db, [owner_id], {"type": "changed", "ids": ids})
+    return ids
+
+
+def _bulk_create_rows(payload: TaskBulkCreate, owner_id: int):
+    """Validate and score ``payload``'s items.
+
+    Returns the result for every item, the scored rows to insert and the
+    results of those rows (which get their ids once inserted).
+    """
+    results: list[BulkItemResult] = []
+    rows, row_results = [], []
+    findings = content_scanner.scan_many((task.title, task.description) for task in payload.tasks)
+    for index, (task, finding) in enumerate(zip(payload.tasks, findings)):
+        error = _validation_error(task.title, task.description, task.urgency, task.importance,
+                                  task.impact, task.value_alignment, task.effort, scanned=True)
+        if error is None and finding is not None:
+            error = INVALID_CONTENT_DETAIL
+        result = BulkItemResult(index=index, status="error" if error else "created", error=error)
+        results.append(result)
+        if error:
+            continue
+        rows.append({
+            "title": task.title.strip(),
+            "description": task.description.strip() if task.description else None,
+            "urgency": task.urgency,
+            "importance": task.importance,
+            "impact": task.impact,
+            "value_alignment": task.value_alignment,
+            "effort": task.effort,
+            "due_date": task.due_date,
+            "owner_id": owner_id,
+            "quadrant": quadrant_for(task.urgency, task.importance),
+        })
+        row_results.append(result)
+
+    scores = score_rows([tuple(row[c] for c in SCORE_COLUMNS) for row in rows]) if rows else []
+    for row, result, score in zip(rows, row_results, scores):
+        row["priority_score"] = result.priority_score = score
+    return results, rows, row_results
+
+
+@router.post("/bulk", response_model=BulkResult)
+def create_tasks_bulk(payload: TaskBulkCreate, current_user: CurrentUser = Depends(get_current_user)):
+    """Create many tasks in one transaction.
+
+    Every item is validated before anything is written (content for the whole
+    batch in one scanner pass); invalid items are reported per index and the
+    rest are scored in one batch and inserted by the group-commit writer with
+    a single executemany.
+    """
+    results, rows, row_results = _bulk_create_rows(payload, current_user.id)
+    if rows:
+        ids = task_writer.execute(partial(_insert_tasks_bulk, rows, current_user.id))
+        for result, task_id in zip(row_results, ids):
+            result.id = task_id
+    return _bulk_result(results)
+
+
+def _update_tasks_bulk(payload: TaskBulkUpdate, owner_id: int, db: Session) -> list[BulkItemResult]:
+    """Writer mutation: apply ``payload``'s updates to ``owner_id``'s tasks."""
+    ids = {item.id for item in payload.tasks}
+    fields = ("title", "description", *SCORE_COLUMNS)
+    existing = {
+        row.id: row._asdict()
+        for row in db.execute(
+            select(Task.id, *(getattr(Task, f) for f in fields))
+            .where(Task.owner_id == owner_id, Task.id.in_(ids))
+        )
+    }
+
+    results: list[BulkItemResult] = []
+    changes = []
+    for index, item in enumerate(payload.tasks):
+        current = existing.get(item.id)
+        if current is None:
+            results.append(BulkItemResult(index=index, id=item.id, status="error", error="Task not found"))
+            continue
+        update_data = item.model_dump(exclude_unset=True, exclude={"id"})
+        merged = {**current, **update_data}
+        error = _null_field_error(update_data) or _validation_error(
+            merged["title"], merged["description"], merged["urgency"], merged["importance"],
+            merged["impact"], merged["value_alignment"], merged["effort"])
+        if error:
+            results.append(BulkItemResult(index=index, id=item.id, status="error", error=error))
+            continue
+        # Later items for the same id see earlier ones
+        existing[item.id] = merged
+        result = BulkItemResult(index=index, id=item.id, status="updated")
+        results.append(result)
+        changes.append((result, merged, update_data))
+
+    if changes:
+        scores = score_rows([tuple(merged[c] for c in SCORE_COLUMNS) for _, merged, _ in changes])
+        params = []
+        stamp = utcnow()
+        for (result, merged, update_data), score in zip(changes, scores):
+            result.priority_score = score
+            params.append({
+                **update_data,
+                "id": merged["id"],
+                "priority_score": score,
+                "quadrant": quadrant_for(merged["urgency"], merged["importance"]),
+                "updated_at": stamp,
+            })
+        db.execute(update(Task), params)
+        bump_data_version(db, [owner_id], {"type": "changed", "ids": sorted({p["id"] for p in params})})
+    return results
+
+
+@router.put("/bulk", response_model=BulkResult)
+def update_tasks_bulk(payload: TaskBulkUpdate, current_user: CurrentUser = Depends(get_current_user)):
+    """Update many tasks in one transaction; unknown ids are reported per item."""
+    return _bulk_result(task_writer.execute(partial(_update_tasks_bulk, payload, current_user.id)))
+
+
+def _delete_tasks_bulk(task_ids: list[int], owner_id: int, db: Session) -> list[BulkItemResult]:
+    """Writer mutation: delete those of ``task_ids`` that ``owner_id`` owns."""
+    found = set(db.scalars(
+        select(Task.id).where(Task.owner_id == owner_id, Task.id.in_(set(task_ids)))
+    ))
+    results = [
+        BulkItemResult(index=index, id=task_id, status="deleted")
+        if task_id in found else
+        BulkItemResult(index=index, id=task_id, status="error", error="Task not found")
+        for index, task_id in enumerate(task_ids)
+    ]
+    if found:
+        db.execute(delete(Task).where(Task.owner_id == owner_id, Task.id.in_(found)))
+        db.execute(insert(TaskTombstone.__table__),
+                   [{"task_id": task_id, "owner_id": owner_id} for task_id in sorted(found)])
+        bump_data_version(db, [owner_id], {"type": "deleted", "ids": sorted(found)})
+    return results
+
+
+@router.delete("/bulk", response_model=BulkResult)
+def delete_tasks_bulk(payload: TaskBulkDelete, current_user: CurrentUser = Depends(get_current_user)):
+    """Delete many tasks in one statement; unknown ids are reported per item."""
+    return _bulk_result(task_writer.execute(partial(_delete_tasks_bulk, payload.ids, current_user.id)))
 
 
 @router.get("/", response_model=TaskList)
-def get_tasks(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Get all tasks ranked by priority score"""
-    _ensure_new_columns(db)
-    tasks = db.query(Task).filter(Task.owner_id == current_user.id).order_by(Task.priority_score.desc()).all()
-    return TaskList(tasks=tasks, total=len(tasks))
+def get_tasks(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """Get a page of tasks ranked by priority score.
+
+    Follow ``next_cursor`` for subsequent pages. ``total`` is only counted with
+    ``include_total=true`` (a separate count over all the user's tasks), so by
+    default the first page costs the same for any backlog size.
+    Responses carry an ETag; see ``app.versioning``.
+    """
+    etag = task_etag(request, db, current_user.id)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    query = db.query(*task_columns(Task)).filter(Task.owner_id == current_user.id)
+    if cursor:
+        query = query.filter(after_cursor(Task, decode_cursor(cursor)))
+    rows = query.order_by(*ranking_order(Task)).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].priority_score, rows[-1].id)
+
+    total = None
+    if include_total:
+        total = db.query(func.count(Task.id)).filter(Task.owner_id == current_user.id).scalar()
+    return json_response({"tasks": rows_to_dicts(rows), "total": total, "next_cursor": next_cursor},
+                         headers=etag_headers(etag))
+
+
+@router.get("/top", response_model=TaskList)
+def get_top_tasks(
+    request: Request,
+    k: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    quadrant: Optional[int] = Query(None, ge=1, le=4),
+    due_before: Optional[datetime] = None,
+    as_of_now: bool = False,
+    db: Session = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """The ``k`` highest-priority tasks, optionally by quadrant or due before a date.
+
+    Served from the ranking index with ``LIMIT k``. With ``as_of_now=true``
+    scores include due-date bonus drift since they were stored (see
+    ``app.topk``); those responses depend on the clock and carry no ETag.
+    """
+    if due_before is not None and due_before.tzinfo is not None:
+        due_before = due_before.astimezone(timezone.utc)
+    if as_of_now:
+        return json_response({"tasks": top_tasks_as_of(db, current_user.id, k, quadrant, due_before)})
+
+    etag = task_etag(request, db, current_user.id)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    return json_response({"tasks": top_tasks(db, current_user.id, k, quadrant, due_before)},
+                         headers=etag_headers(etag))
+
+
+@router.get("/search", response_model=TaskList)
+def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """Search task titles and descriptions.
+
+    Every word in ``q`` must match; end a word with ``*`` for a prefix match.
+    Results are ranked by text relevance blended with priority score (see
+    ``app.search``); follow ``next_cursor`` for more.
+    """
+    query, rank = search_select(Task, q, *task_columns(Task))
+    query = query.where(Task.owner_id == current_user.id)
+    if cursor:
+        query = query.where(after_rank(rank, Task, decode_cursor(cursor)))
+    rows = db.execute(query.order_by(rank.desc(), Task.id.desc()).limit(limit + 1)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][-1], rows[-1].id)
+    # _rank is the trailing column; rows_to_dicts ignores it
+    return json_response({"tasks": rows_to_dicts(rows), "next_cursor": next_cursor})
+
+
+@router.get("/changes", response_model=TaskChanges)
+def get_task_changes(
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """Tasks created, updated or deleted since the ``since`` cursor.
+
+    Without ``since``, or with a cursor older than ``TOMBSTONE_RETENTION_DAYS``
+    (the deletions it needs may have been compacted), the response has
+    ``reset: true`` and replays every task from the start. Call again with
+    ``next_cursor`` while ``has_more`` is true; each page holds up to ``limit``
+    changed tasks and ``limit`` deleted ids.
+    """
+    now = utcnow().replace(tzinfo=None)  # stored timestamps are naive UTC
+    caught_up = (now - CHANGES_OVERLAP, 0)
+    reset = since is None
+    if since:
+        tasks_key, deleted_key = decode_sync_cursor(since)
+        oldest = now - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        reset = deleted_key[0] is None or deleted_key[0] < oldest
+    if reset:
+        tasks_key, deleted_key = (None, 0), caught_up
+
+    # updated_at is appended for the cursor; rows_to_dicts ignores extra columns
+    changed = db.execute(
+        select(*task_columns(Task), Task.updated_at)
+        .where(Task.owner_id == current_user.id, after_sync_key(Task.updated_at, Task.id, tasks_key))
+        .order_by(Task.updated_at, Task.id)
+        .limit(limit + 1)
+    ).all()
+    tombstones = db.execute(
+        select(TaskTombstone.deleted_at, TaskTombstone.id, TaskTombstone.task_id)
+        .where(TaskTombstone.owner_id == current_user.id,
+               after_sync_key(TaskTombstone.deleted_at, TaskTombstone.id, deleted_key))
+        .order_by(TaskTombstone.deleted_at, TaskTombstone.id)
+        .limit(limit + 1)
+    ).all()
+
+    has_more = len(changed) > limit or len(tombstones) > limit
+    if len(changed) > limit:
+        changed = changed[:limit]
+        tasks_key = (changed[-1][-1], changed[-1].id)
+    else:
+        tasks_key = caught_up
+    if len(tombstones) > limit:
+        tombstones = tombstones[:limit]
+        deleted_key = (tombstones[-1].deleted_at, tombstones[-1].id)
+    else:
+        deleted_key = caught_up
+
+    deleted = [row.task_id for row in tombstones]
+    if deleted:
+        # SQLite may hand a deleted id to a newer task; that task is live, not deleted
+        live = set(db.scalars(select(Task.id).where(Task.owner_id == current_user.id, Task.id.in_(deleted))))
+        deleted = [task_id for task_id in deleted if task_id not in live]
+    return json_response({
+        "changed": rows_to_dicts(changed),
+        "deleted": deleted,
+        "next_cursor": encode_sync_cursor(tasks_key, deleted_key),
+        "has_more": has_more,
+        "reset": reset,
+    })
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task(task_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_task(task_id: int, request: Request, response: Response, db: Session = Depends(get_read_db), current_user: CurrentUser = Depends(get_current_user)):
     """Get a specific task by ID"""
+    etag = task_etag(request, db, current_user.id)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
     task = db.query(Task).filter(Task.id == task_id, Task.owner_id == current_user.id).first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
+    response.headers.update(etag_headers(etag))
     return task
 
 
-@router.put("/{task_id}", response_model=TaskResponse)
-def update_task(task_id: int, task_update: TaskUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Update a task"""
-    _ensure_new_columns(db)
-    task = db.query(Task).filter(Task.id == task_id, Task.owner_id == current_user.id).first()
+def _task_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Task not found"
+    )
+
+
+def _update_task(task_id: int, task_update: TaskUpdate, owner_id: int, db: Session) -> TaskResponse:
+    """Writer mutation: apply ``task_update`` to one of ``owner_id``'s tasks."""
+    task = db.query(Task).filter(Task.id == task_id, Task.owner_id == owner_id).first()
     if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
+        raise _task_not_found()
     
     # Validate input for security if fields are being updated
     update_data = task_update.model_dump(exclude_unset=True)
+    null_error = _null_field_error(update_data)
+    if null_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=null_error)
     if 'title' in update_data or 'description' in update_data:
         validate_task_input(
             update_data.get('title', task.title),
@@ -113,65 +462,79 @@ def update_task(task_id: int, task_update: TaskUpdate, db: Session = Depends(get
         )
     
     # Update fields if provided
-    update_data = task_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(task, field, value)
     
     # Recalculate priority score if urgency or importance changed
     if any(k in update_data for k in ["urgency","importance","impact","value_alignment","effort","due_date"]):
         task.priority_score = task.calculate_priority_score()
+    if 'urgency' in update_data or 'importance' in update_data:
+        task.quadrant = task.classify_quadrant()
     
-    db.commit()
+    db.flush()
     db.refresh(task)
-    
-    return task
+    updated = TaskResponse.model_validate(task)
+    bump_data_version(db, [owner_id], {"type": "updated", "task": updated.model_dump(mode="json")})
+    return updated
+
+
+@router.put("/{task_id}", response_model=TaskResponse)
+def update_task(task_id: int, task_update: TaskUpdate, current_user: CurrentUser = Depends(get_current_user)):
+    """Update a task"""
+    return task_writer.execute(partial(_update_task, task_id, task_update, current_user.id))
+
+
+def _delete_task(task_id: int, owner_id: int, db: Session) -> dict:
+    """Writer mutation: delete one of ``owner_id``'s tasks."""
+    deleted = db.execute(delete(Task).where(Task.id == task_id, Task.owner_id == owner_id)).rowcount
+    if not deleted:
+        raise _task_not_found()
+    db.add(TaskTombstone(task_id=task_id, owner_id=owner_id))
+    bump_data_version(db, [owner_id], {"type": "deleted", "ids": [task_id]})
+    return {"message": "Task deleted successfully"}
 
 
 @router.delete("/{task_id}")
-def delete_task(task_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def delete_task(task_id: int, current_user: CurrentUser = Depends(get_current_user)):
     """Delete a task"""
-    task = db.query(Task).filter(Task.id == task_id, Task.owner_id == current_user.id).first()
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
-    
-    db.delete(task)
-    db.commit()
-    
-    return {"message": "Task deleted successfully"}
+    return task_writer.execute(partial(_delete_task, task_id, current_user.id))
 
 
 @router.get("/matrix/data", response_model=dict)
-def get_matrix_data(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Get tasks organized by Eisenhower Matrix quadrants"""
-    _ensure_new_columns(db)
-    tasks = db.query(Task).filter(Task.owner_id == current_user.id).all()
-    
-    # Organize tasks by quadrants
-    # Quadrant 1: Urgent + Important (urgency >= 6, importance >= 6)
-    # Quadrant 2: Not Urgent + Important (urgency < 6, importance >= 6)
-    # Quadrant 3: Urgent + Not Important (urgency >= 6, importance < 6)
-    # Quadrant 4: Not Urgent + Not Important (urgency < 6, importance < 6)
-    
-    matrix_data = {
-        "quadrant_1": [],  # Do First (Urgent + Important)
-        "quadrant_2": [],  # Schedule (Not Urgent + Important)
-        "quadrant_3": [],  # Delegate (Urgent + Not Important)
-        "quadrant_4": []   # Eliminate (Not Urgent + Not Important)
-    }
-    
-    for task in tasks:
-        task_data = TaskResponse.model_validate(task)
-        
-        if task.urgency >= 6 and task.importance >= 6:
-            matrix_data["quadrant_1"].append(task_data)
-        elif task.urgency < 6 and task.importance >= 6:
-            matrix_data["quadrant_2"].append(task_data)
-        elif task.urgency >= 6 and task.importance < 6:
-            matrix_data["quadrant_3"].append(task_data)
-        else:
-            matrix_data["quadrant_4"].append(task_data)
-    
-    return matrix_data
+def get_matrix_data(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """Get tasks organized by Eisenhower Matrix quadrants.
+
+    Each quadrant holds its ``limit`` highest-ranked tasks; ``counts`` gives the
+    full size of every quadrant. Membership is the stored ``quadrant`` column:
+    1 = Do First (urgent + important), 2 = Schedule (important, not urgent),
+    3 = Delegate (urgent, not important), 4 = Eliminate (neither).
+    """
+    etag = task_etag(request, db, current_user.id)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    owned = Task.owner_id == current_user.id
+    counts = dict(
+        db.query(Task.quadrant, func.count(Task.id)).filter(owned).group_by(Task.quadrant).all()
+    )
+
+    matrix_data = {}
+    for quadrant in QUADRANTS:
+        rows = []
+        if counts.get(quadrant):
+            rows = (
+                db.query(*task_columns(Task))
+                .filter(owned, Task.quadrant == quadrant)
+                .order_by(*ranking_order(Task))
+                .limit(limit)
+                .all()
+            )
+        matrix_data[f"quadrant_{quadrant}"] = rows_to_dicts(rows)
+    matrix_data["counts"] = {f"quadrant_{q}": counts.get(q, 0) for q in QUADRANTS}
+    return json_response(matrix_data, headers=etag_headers(etag))
@@ -0,0 +1,139 @@
+"""Async task routes (DB_MODE=async).
+
+Same paths, parameters and responses as ``routers.tasks``. Each handler runs the
+sync implementation through ``AsyncSession.run_sync``: the ORM code executes on
+the event loop and every database round trip is awaited on aiosqlite, so a
+request waiting on SQLite doesn't occupy a threadpool slot. Single-task
+and bulk mutations are awaited on the group-commit writer (``app.writer``).
+"""
+from datetime import datetime
+from functools import partial
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_async_db
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ..schemas.task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskList, TaskChanges,
+    TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete, BulkResult,
+)
+from ..security import get_current_user_async, CurrentUser
+from ..writer import task_writer
+from . import tasks
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.post("/", response_model=TaskResponse)
+async def create_task(task: TaskCreate, current_user: CurrentUser = Depends(get_current_user_async)):
+    """Create a new task"""
+    tasks._validate_new_task(task)
+    return await task_writer.execute_async(partial(tasks._insert_task, task, current_user.id))
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def create_tasks_bulk(payload: TaskBulkCreate, current_user: CurrentUser = Depends(get_current_user_async)):
+    """Create up to ``MAX_BULK_ITEMS`` tasks in one transaction."""
+    results, rows, row_results = tasks._bulk_create_rows(payload, current_user.id)
+    if rows:
+        ids = await task_writer.execute_async(partial(tasks._insert_tasks_bulk, rows, current_user.id))
+        for result, task_id in zip(row_results, ids):
+            result.id = task_id
+    return tasks._bulk_result(results)
+
+
+@router.put("/bulk", response_model=BulkResult)
+async def update_tasks_bulk(payload: TaskBulkUpdate, current_user: CurrentUser = Depends(get_current_user_async)):
+    """Update several tasks by id in one transaction."""
+    return tasks._bulk_result(
+        await task_writer.execute_async(partial(tasks._update_tasks_bulk, payload, current_user.id)))
+
+
+@router.delete("/bulk", response_model=BulkResult)
+async def delete_tasks_bulk(payload: TaskBulkDelete, current_user: CurrentUser = Depends(get_current_user_async)):
+    """Delete several tasks by id in one statement."""
+    return tasks._bulk_result(
+        await task_writer.execute_async(partial(tasks._delete_tasks_bulk, payload.ids, current_user.id)))
+
+
+@router.get("/", response_model=TaskList)
+async def get_tasks(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user_async),
+):
+    """Get a page of tasks ranked by priority score."""
+    return await db.run_sync(lambda s: tasks.get_tasks(request, limit, cursor, include_total, s, current_user))
+
+
+@router.get("/top", response_model=TaskList)
+async def get_top_tasks(
+    request: Request,
+    k: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    quadrant: Optional[int] = Query(None, ge=1, le=4),
+    due_before: Optional[datetime] = None,
+    as_of_now: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user_async),
+):
+    """The ``k`` highest-priority tasks, optionally by quadrant or due before a date."""
+    return await db.run_sync(
+        lambda s: tasks.get_top_tasks(request, k, quadrant, due_before, as_of_now, s, current_user)
+    )
+
+
+@router.get("/search", response_model=TaskList)
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user_async),
+):
+    """Search task titles and descriptions."""
+    return await db.run_sync(lambda s: tasks.search_tasks(q, limit, cursor, s, current_user))
+
+
+@router.get("/changes", response_model=TaskChanges)
+async def get_task_changes(
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user_async),
+):
+    """Tasks created, updated or deleted since the ``since`` cursor."""
+    return await db.run_sync(lambda s: tasks.get_task_changes(since, limit, s, current_user))
+
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(task_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db), current_user: CurrentUser = Depends(get_current_user_async)):
+    """Get a specific task by ID"""
+    return await db.run_sync(lambda s: tasks.get_task(task_id, request, response, s, current_user))
+
+
+@router.put("/{task_id}", response_model=TaskResponse)
+async def update_task(task_id: int, task_update: TaskUpdate, current_user: CurrentUser = Depends(get_current_user_async)):
+    """Update a task"""
+    return await task_writer.execute_async(partial(tasks._update_task, task_id, task_update, current_user.id))
+
+
+@router.delete("/{task_id}")
+async def delete_task(task_id: int, current_user: CurrentUser = Depends(get_current_user_async)):
+    """Delete a task"""
+    return await task_writer.execute_async(partial(tasks._delete_task, task_id, current_user.id))
+
+
+@router.get("/matrix/data", response_model=dict)
+async def get_matrix_data(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user_async),
+):
+    """Get tasks organized by Eisenhower Matrix quadrants."""
+    return await db.run_sync(lambda s: tasks.get_matrix_data(request, limit, s, current_user))
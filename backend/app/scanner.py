@@ -0,0 +1,162 @@
+"""Precompiled content scanner for task input validation.
+
+The dangerous-content rules are compiled once, at import time, and a task's
+title and description are scanned together as one text, so every rule runs a
+single pass over the payload instead of one search per rule and field.
+``scan_many`` checks a whole batch of payloads (bulk imports) with one pass
+over their concatenation. Results name the rule that matched.
+
+Two properties of Python's regex engine shape the compiled form:
+
+* A plain alternation of every rule is *slower* than separate searches,
+  because the engine tries each branch at every position and loses its
+  literal-prefix fast path. Rules are therefore grouped by **trigger**: a
+  character without case variants that every match of the rule contains
+  (``<`` for tags, ``=`` for event handlers). Rules sharing a trigger form one
+  alternation, with their common literal prefix factored out (``<(?:script...|
+  iframe...)``). The scanner runs only the groups whose trigger occurs in the
+  text, which a substring test finds cheaply. Ordinary prose usually contains
+  no trigger and skips the regex entirely.
+* ``IGNORECASE`` searches are several times slower than case-sensitive ones.
+  ASCII text (checked in O(1)) is lowercased once and searched
+  case-sensitively, which matches exactly what ``IGNORECASE`` would. Other
+  text uses the ``IGNORECASE`` patterns. Rule patterns must therefore be
+  written in lowercase.
+
+Fields are joined with ``FIELD_SEPARATOR`` (newline + NUL). None of the rules
+can match across it: ``.`` stops at the newline and neither ``\\s`` nor ``\\w``
+nor any literal matches the NUL, so a match never spans two fields. New rules
+must keep that property.
+"""
+from __future__ import annotations
+
+import os
+import re
+from bisect import bisect_right
+from typing import Iterable, NamedTuple, Optional
+
+
+class Rule(NamedTuple):
+    name: str
+    pattern: str  # lowercase; matched case-insensitively
+    trigger: str  # character every match contains
+
+
+class Finding(NamedTuple):
+    rule: str  # name of the matching rule
+    field: str  # "title" or "description"
+    offset: int  # position of the match within the field
+
+
+# Potential XSS payloads rejected in task titles and descriptions
+DANGEROUS_RULES: tuple[Rule, ...] = (
+    Rule("script_tag", r"<script.*?>.*?</script>", "<"),
+    Rule("javascript_url", r"javascript:", ":"),
+    Rule("event_handler", r"on\w+\s*=", "="),
+    Rule("iframe_tag", r"<iframe.*?>", "<"),
+    Rule("object_tag", r"<object.*?>", "<"),
+    Rule("embed_tag", r"<embed.*?>", "<"),
+)
+
+FIELD_SEPARATOR = "\n\x00"
+_FIELDS = ("title", "description")
+
+# Characters that are literal in a pattern and can be factored out as a prefix
+_LITERAL_PREFIX = re.compile(r"[\w<>:=/!@#%&;,'\"~` -]*")
+_QUANTIFIERS = "*+?{"
+
+
+def _factored(rules: list[Rule]) -> str:
+    """Alternation of ``rules`` with their shared literal prefix pulled out."""
+    patterns = [rule.pattern for rule in rules]
+    prefix = _LITERAL_PREFIX.match(os.path.commonprefix(patterns)).group()
+    # Don't split a quantifier from the character it applies to
+    while prefix and any(p[len(prefix):len(prefix) + 1] in _QUANTIFIERS and len(p) > len(prefix)
+                         for p in patterns):
+        prefix = prefix[:-1]
+    branches = "|".join(f"(?P<{rule.name}>{rule.pattern[len(prefix):]})" for rule in rules)
+    return f"{re.escape(prefix)}(?:{branches})"
+
+
+class _Group(NamedTuple):
+    trigger: str
+    folded: re.Pattern  # case-sensitive, for lowercased ASCII text
+    ignorecase: re.Pattern
+
+
+class ContentScanner:
+    """Matches text against a set of rules, one pass per trigger group."""
+
+    def __init__(self, rules: Iterable[Rule] = DANGEROUS_RULES):
+        self.rules = tuple(rules)
+        by_trigger: dict[str, list[Rule]] = {}
+        for rule in self.rules:
+            literals = re.sub(r"\\.", "", rule.pattern)  # escapes like \S keep their case
+            if literals != literals.lower():
+                raise ValueError(f"Rule {rule.name!r}: patterns must be lowercase")
+            by_trigger.setdefault(rule.trigger, []).append(rule)
+        self._groups = []
+        for trigger, group in by_trigger.items():
+            pattern = _factored(group)
+            self._groups.append(_Group(trigger, re.compile(pattern), re.compile(pattern, re.IGNORECASE)))
+        self._order = {rule.name: index for index, rule in enumerate(self.rules)}
+
+    def _matches(self, text: str) -> list[Iterable[re.Match]]:
+        """Lazy match iterators for every group whose trigger occurs in ``text``."""
+        groups = [group for group in self._groups if group.trigger in text]
+        if not groups:
+            return []
+        if text.isascii():
+            lowered = text.lower()
+            return [group.folded.finditer(lowered) for group in groups]
+        return [group.ignorecase.finditer(text) for group in groups]
+
+    def _first(self, matches: list[Iterable[re.Match]]) -> Optional[re.Match]:
+        found = [match for match in (next(iter(m), None) for m in matches) if match is not None]
+        if not found:
+            return None
+        # Leftmost match wins; ties go to the rule listed first
+        return min(found, key=lambda match: (match.start(), self._order[match.lastgroup]))
+
+    def scan(self, title: str, description: Optional[str] = None) -> Optional[Finding]:
+        """Return the first rule match in ``title`` or ``description``, or None."""
+        text = title + FIELD_SEPARATOR + description if description else title
+        match = self._first(self._matches(text))
+        if match is None:
+            return None
+        if match.start() > len(title):
+            return Finding(match.lastgroup, "description", match.start() - len(title) - len(FIELD_SEPARATOR))
+        return Finding(match.lastgroup, "title", match.start())
+
+    def scan_many(self, payloads: Iterable[tuple[str, Optional[str]]]) -> list[Optional[Finding]]:
+        """Scan ``(title, description)`` pairs; returns one result per pair, in order."""
+        parts: list[str] = []
+        starts: list[int] = []  # offset of every field in the joined text
+        position = 0
+        for title, description in payloads:
+            for text in (title, description or ""):
+                starts.append(position)
+                parts.append(text)
+                position += len(text) + len(FIELD_SEPARATOR)
+
+        # Earliest match per payload across all groups
+        first: list[Optional[re.Match]] = [None] * (len(starts) // 2)
+        for matches in self._matches(FIELD_SEPARATOR.join(parts)):
+            for match in matches:
+                payload_index = (bisect_right(starts, match.start()) - 1) // 2
+                current = first[payload_index]
+                if current is None or (match.start(), self._order[match.lastgroup]) < (
+                        current.start(), self._order[current.lastgroup]):
+                    first[payload_index] = match
+
+        findings: list[Optional[Finding]] = []
+        for match in first:
+            if match is None:
+                findings.append(None)
+                continue
+            field_index = bisect_right(starts, match.start()) - 1
+            findings.append(Finding(match.lastgroup, _FIELDS[field_index % 2], match.start() - starts[field_index]))
+        return findings
+
+
+content_scanner = ContentScanner()
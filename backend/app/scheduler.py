@@ -0,0 +1,276 @@
+"""Periodic background jobs: rescoring, config watching and tombstone compaction.
+
+Only tasks whose due date lies inside the ``due_soon_days`` window (their bonus
+grows as time passes) or that crossed their due date since the previous tick
+(their bonus dropped to zero) can change score over time. Each tick therefore
+range-scans the ``due_date`` index for ``(last_tick, now + due_soon_days]``
+and writes back only the scores that changed.
+
+The config watcher adopts new versions of the shared priority configuration.
+``PUT /config/priority`` rescores every task in the transaction that stores
+the version, so watchers normally have nothing else to do. A version stored
+without that rescore (``rescored`` unset on the row) is rescored by the first
+worker that claims it.
+
+Rescoring and compaction write shared tables, so under prefork only one
+worker process should run them: each tick first takes or renews a
+``JobLease`` row, and the workers that don't hold it skip the tick. The
+lease expires after two intervals, so another worker takes over when the
+holder exits. Config and feed watchers run in every worker; they keep that
+worker's own state current.
+
+The feed version watcher polls the data versions of users subscribed to this
+worker's change feed, so changes committed by other workers reach them as
+``resync`` events (see ``app.feed``).
+
+Deleted tasks leave tombstones for ``GET /tasks/changes``; the compactor drops
+those older than ``TOMBSTONE_RETENTION_DAYS`` (sync cursors that old get a
+full resync instead).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+
+from .feed import FEED_POLL_MS, ChangeHub, change_hub
+from .scoring import SCORE_COLUMNS, rescore_tasks, score_rows
+from .settings import (
+    PRIORITY_CONFIG_CHECK_MS, RESCORE_INTERVAL_SECONDS, TOMBSTONE_COMPACT_INTERVAL_SECONDS,
+    TOMBSTONE_RETENTION_DAYS, SharedPriorityConfig, get_priority_config, priority_config,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_every(interval_seconds: int, tick, description: str):
+    while True:
+        try:
+            count = await asyncio.to_thread(tick)
+            if count:
+                logger.debug("%s: %d rows", description, count)
+        except Exception:  # keep the scheduler alive across transient DB errors
+            logger.exception("%s tick failed", description)
+        await asyncio.sleep(interval_seconds)
+
+
+class JobLease:
+    """A ``scheduler_leases`` row electing the one process that runs a job."""
+
+    def __init__(self, session_factory, name: str, ttl_seconds: float,
+                 holder: Optional[str] = None, clock=time.time):
+        self.session_factory = session_factory
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        # Identifies this worker process (on this host) in the lease row
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}"
+        self.clock = clock
+
+    def acquire(self) -> bool:
+        """Take the lease, or renew it if held; False while another holder's is valid."""
+        from sqlalchemy.dialects.sqlite import insert
+        from .models.lease import SchedulerLease
+
+        now = self.clock()
+        stmt = insert(SchedulerLease).values(name=self.name, holder=self.holder, expires_at=now + self.ttl_seconds)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SchedulerLease.name],
+            set_={"holder": stmt.excluded.holder, "expires_at": stmt.excluded.expires_at},
+            where=(SchedulerLease.holder == stmt.excluded.holder) | (SchedulerLease.expires_at < now),
+        )
+        db = self.session_factory()
+        try:
+            acquired = db.execute(stmt).rowcount == 1
+            db.commit()
+        finally:
+            db.close()
+        return acquired
+
+    def release(self):
+        """Give the lease up now (e.g. at shutdown) instead of letting it expire."""
+        from .models.lease import SchedulerLease
+
+        db = self.session_factory()
+        try:
+            db.execute(delete(SchedulerLease).where(SchedulerLease.name == self.name,
+                                                    SchedulerLease.holder == self.holder))
+            db.commit()
+        finally:
+            db.close()
+
+
+def _leased(lease: Optional[JobLease], tick):
+    """``tick`` run only while ``lease`` (if any) is held by this process."""
+    if lease is None:
+        return tick
+    return lambda: tick() if lease.acquire() else 0
+
+
+class DueDateRescorer:
+    """Incrementally rescores tasks in or leaving the due-soon window."""
+
+    def __init__(self, session_factory, interval_seconds: int = RESCORE_INTERVAL_SECONDS,
+                 lease: Optional[JobLease] = None):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.lease = lease
+        self.last_tick: Optional[datetime] = None
+
+    def _window(self, now: datetime, cfg: dict) -> tuple[datetime, datetime]:
+        # On the first tick we don't know when scores were last refreshed, so
+        # look back one full window to clear bonuses of recently overdue tasks.
+        lower = self.last_tick or now - timedelta(days=cfg['due_soon_days'])
+        upper = now + timedelta(days=cfg['due_soon_days'])
+        return lower, upper
+
+    def tick(self, now: Optional[datetime] = None) -> int:
+        """Rescore the affected tasks once; returns the number of rows updated."""
+        from .models.task import Task, utcnow
+        from .versioning import bump_data_version
+
+        now = now or datetime.now(timezone.utc)
+        cfg = get_priority_config()
+        lower, upper = self._window(now, cfg)
+        columns = [getattr(Task, name) for name in SCORE_COLUMNS]
+        db = self.session_factory()
+        try:
+            rows = db.execute(
+                select(Task.id, Task.owner_id, Task.priority_score, *columns)
+                .where(Task.due_date > lower, Task.due_date <= upper)
+                .order_by(Task.due_date)
+            ).all()
+            scores = score_rows([row[3:] for row in rows], cfg=cfg, now=now)
+            changed = [(row, score) for row, score in zip(rows, scores) if row[2] != score]
+            if changed:
+                stamp = utcnow()
+                db.execute(update(Task), [{"id": row[0], "priority_score": score, "updated_at": stamp}
+                                          for row, score in changed])
+                bump_data_version(db, (row[1] for row, _ in changed), {"type": "rescored"})
+            db.commit()
+        finally:
+            db.close()
+        self.last_tick = now
+        return len(changed)
+
+    async def run(self):
+        """Tick forever at ``interval_seconds``; meant to run as an asyncio task."""
+        await _run_every(self.interval_seconds, _leased(self.lease, self.tick), "Due-date rescoring")
+
+
+class PriorityConfigWatcher:
+    """Adopts new shared priority config versions, rescoring those not yet rescored."""
+
+    def __init__(self, session_factory, config: Optional[SharedPriorityConfig] = None,
+                 interval_seconds: float = PRIORITY_CONFIG_CHECK_MS / 1000):
+        self.session_factory = session_factory
+        self.config = config or priority_config
+        self.interval_seconds = interval_seconds
+        self.config.refresh()
+        self.seen_version = self.config.version
+
+    def _claim_rescore(self, db, version: int) -> bool:
+        """Mark ``version`` rescored; False if it already was (or was replaced)."""
+        from .models.config import PRIORITY_CONFIG_ID, PriorityConfig
+
+        row = PriorityConfig.id == PRIORITY_CONFIG_ID
+        # Read first: the common, already-rescored case takes no write lock
+        if db.scalar(select(PriorityConfig.rescored).where(row, PriorityConfig.version == version)) is not False:
+            return False
+        return db.execute(
+            update(PriorityConfig)
+            .where(row, PriorityConfig.version == version, PriorityConfig.rescored.is_(False))
+            .values(rescored=True)
+        ).rowcount == 1
+
+    def tick(self) -> int:
+        """Check the version once; returns the number of rescored rows."""
+        self.config.refresh()
+        version = self.config.version
+        if version == self.seen_version:
+            return 0
+        db = self.session_factory()
+        try:
+            # The claim commits with the rescore, so exactly one worker does it
+            updated = rescore_tasks(db, cfg=self.config.get()) if self._claim_rescore(db, version) else 0
+        finally:
+            db.close()
+        self.seen_version = version
+        return updated
+
+    async def run(self):
+        """Tick forever at ``interval_seconds``; meant to run as an asyncio task."""
+        # Take over the config's periodic checks from request handlers
+        self.config.watched = True
+        try:
+            await _run_every(self.interval_seconds, self.tick, "Priority config rescoring")
+        finally:
+            self.config.watched = False
+
+
+class FeedVersionWatcher:
+    """Catches feed subscribers up on changes committed by other processes."""
+
+    # Users per version query, well below SQLite's bound-parameter limit
+    CHUNK_SIZE = 500
+
+    def __init__(self, session_factory, hub: Optional[ChangeHub] = None,
+                 interval_seconds: float = FEED_POLL_MS / 1000):
+        self.session_factory = session_factory
+        self.hub = hub or change_hub
+        self.interval_seconds = interval_seconds
+
+    def tick(self) -> int:
+        """Poll once; returns the number of users sent a resync."""
+        from .models.user import User
+
+        user_ids = self.hub.user_ids()
+        if not user_ids:
+            return 0
+        versions = {}
+        db = self.session_factory()
+        try:
+            for start in range(0, len(user_ids), self.CHUNK_SIZE):
+                chunk = user_ids[start:start + self.CHUNK_SIZE]
+                versions.update(db.execute(select(User.id, User.data_version).where(User.id.in_(chunk))).all())
+        finally:
+            db.close()
+        return self.hub.catch_up(versions)
+
+    async def run(self):
+        """Tick forever at ``interval_seconds``; meant to run as an asyncio task."""
+        await _run_every(self.interval_seconds, self.tick, "Feed version polling")
+
+
+class TombstoneCompactor:
+    """Deletes task tombstones that have aged out of the delta-sync window."""
+
+    def __init__(self, session_factory, retention_days: int = TOMBSTONE_RETENTION_DAYS,
+                 interval_seconds: int = TOMBSTONE_COMPACT_INTERVAL_SECONDS,
+                 lease: Optional[JobLease] = None):
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+        self.interval_seconds = interval_seconds
+        self.lease = lease
+
+    def tick(self, now: Optional[datetime] = None) -> int:
+        """Compact once; returns the number of tombstones removed."""
+        from .models.task import TaskTombstone
+
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=self.retention_days)
+        db = self.session_factory()
+        try:
+            removed = db.execute(delete(TaskTombstone).where(TaskTombstone.deleted_at < cutoff)).rowcount
+            db.commit()
+        finally:
+            db.close()
+        return removed
+
+    async def run(self):
+        """Tick forever at ``interval_seconds``; meant to run as an asyncio task."""
+        await _run_every(self.interval_seconds, _leased(self.lease, self.tick), "Tombstone compaction")
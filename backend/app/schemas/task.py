@@ -1,6 +1,17 @@
-from pydantic import BaseModel, Field
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, Field, field_validator
+from typing import Literal, Optional
+from datetime import datetime, timezone
+import os
+
+# Upper bound on items accepted by the /tasks/bulk endpoints
+MAX_BULK_ITEMS = int(os.getenv("MAX_BULK_ITEMS", 1000))
+
+
+def _due_date_to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Store due dates in UTC so they can be range-compared in SQL."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc)
+    return value
 
 
 class TaskCreate(BaseModel):
@@ -13,6 +24,8 @@ class TaskCreate(BaseModel):
     effort: Optional[int] = Field(5, ge=1, le=10)
     due_date: Optional[datetime] = None
 
+    normalize_due_date = field_validator("due_date")(_due_date_to_utc)
+
 
 class TaskUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
@@ -24,6 +37,8 @@ class TaskUpdate(BaseModel):
     effort: Optional[int] = Field(None, ge=1, le=10)
     due_date: Optional[datetime] = None
 
+    normalize_due_date = field_validator("due_date")(_due_date_to_utc)
+
 
 class TaskResponse(BaseModel):
     id: int
@@ -45,4 +60,43 @@ class TaskResponse(BaseModel):
 
 class TaskList(BaseModel):
     tasks: list[TaskResponse]
-    total: int
+    total: Optional[int] = None  # only counted with include_total=true
+    next_cursor: Optional[str] = None  # pass back as ?cursor= for the next page
+
+
+class TaskChanges(BaseModel):
+    changed: list[TaskResponse]  # created or updated since the cursor
+    deleted: list[int]  # ids deleted since the cursor; apply before ``changed``
+    next_cursor: str  # pass back as ?since= on the next sync
+    has_more: bool  # more changes are waiting; sync again right away
+    reset: bool  # full resync: replace the local task list with what follows
+
+
+class TaskBulkCreate(BaseModel):
+    tasks: list[TaskCreate] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+
+class TaskBulkUpdate(BaseModel):
+    tasks: list[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class TaskBulkDelete(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    index: int  # position in the request array
+    id: Optional[int] = None
+    status: Literal["created", "updated", "deleted", "error"]
+    priority_score: Optional[float] = None
+    error: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    results: list[BulkItemResult]
+    succeeded: int
+    failed: int
@@ -0,0 +1,185 @@
+"""Batch priority scoring engine.
+
+Scores whole columns of task attributes in one pass instead of one ORM object
+at a time. The configuration and the reference time are resolved once per
+batch. When NumPy is installed the arithmetic is vectorized; otherwise a plain
+Python loop over the columns is used, producing identical results. NumPy is
+imported on the first batch rather than with this module, since it is the
+largest single cost of importing the app.
+
+Naive datetimes (as loaded back from SQLite) are interpreted as UTC.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from sqlalchemy import select, update
+
+from .settings import get_priority_config
+
+# Columns required to score a task, in the order used throughout this module.
+SCORE_COLUMNS = ("urgency", "importance", "impact", "value_alignment", "effort", "due_date")
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def score_row(urgency, importance, impact=None, value_alignment=None, effort=None,
+              due_date=None, cfg: Optional[dict] = None, now: Optional[datetime] = None) -> float:
+    """Score a single task from its raw attribute values."""
+    cfg = cfg or get_priority_config()
+
+    def norm(val):
+        if val is None:
+            return None
+        return (val - 1) / 9 if 1 <= val <= 10 else 0.0
+
+    drivers = (
+        (norm(urgency), cfg['weight_urgency']),
+        (norm(importance), cfg['weight_importance']),
+        (norm(impact), cfg['weight_impact']),
+        (norm(value_alignment), cfg['weight_value']),
+    )
+    total_w = sum(w for v, w in drivers if v is not None) or 1.0
+    base = sum(v * w for v, w in drivers if v is not None) / total_w
+
+    eff = norm(effort)
+    if eff is not None:
+        base *= (1 - cfg['effort_penalty'] * eff)
+
+    due_date = _as_utc(due_date)
+    if due_date is not None:
+        now = now or datetime.now(timezone.utc)
+        remaining = (due_date - now).total_seconds()
+        if remaining > 0:
+            days = remaining / 86400
+            if days <= cfg['due_soon_days']:
+                bonus = (1 - days / cfg['due_soon_days']) * cfg['due_soon_max_bonus']
+                if bonus > 0:
+                    base *= (1 + min(bonus, cfg['due_soon_max_bonus']))
+
+    score = max(0.0, min(base * 100, 100))
+    return round(score, 2)
+
+
+@lru_cache
+def _numpy():
+    """The numpy module (optional acceleration), or None when it isn't installed."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - exercised when numpy is absent
+        return None
+    return numpy
+
+
+def _score_columns_numpy(urgency, importance, impact, value_alignment, effort, due_date, cfg, now):
+    np = _numpy()
+    n = len(urgency)
+
+    def norm(col):
+        arr = np.array([np.nan if v is None else v for v in col], dtype=np.float64)
+        present = ~np.isnan(arr)
+        in_range = (arr >= 1) & (arr <= 10)
+        out = np.where(in_range, (arr - 1) / 9, 0.0)
+        return np.where(present, out, 0.0), present
+
+    base = np.zeros(n)
+    total_w = np.zeros(n)
+    for col, weight in (
+        (urgency, cfg['weight_urgency']),
+        (importance, cfg['weight_importance']),
+        (impact, cfg['weight_impact']),
+        (value_alignment, cfg['weight_value']),
+    ):
+        values, present = norm(col)
+        base += values * weight
+        total_w += np.where(present, weight, 0.0)
+    base /= np.where(total_w == 0, 1.0, total_w)
+
+    eff, eff_present = norm(effort)
+    base *= np.where(eff_present, 1 - cfg['effort_penalty'] * eff, 1.0)
+
+    now_ts = now.timestamp()
+    remaining = np.array(
+        [np.nan if d is None else _as_utc(d).timestamp() - now_ts for d in due_date],
+        dtype=np.float64,
+    )
+    days = remaining / 86400
+    with np.errstate(invalid="ignore"):
+        in_window = (remaining > 0) & (days <= cfg['due_soon_days'])
+    bonus = (1 - days / cfg['due_soon_days']) * cfg['due_soon_max_bonus']
+    bonus = np.where(in_window & (bonus > 0), np.minimum(bonus, cfg['due_soon_max_bonus']), 0.0)
+    base *= 1 + bonus
+
+    scores = np.clip(base * 100, 0.0, 100.0)
+    return [round(float(s), 2) for s in scores]
+
+
+def score_columns(urgency: Sequence, importance: Sequence, impact: Sequence,
+                  value_alignment: Sequence, effort: Sequence, due_date: Sequence,
+                  cfg: Optional[dict] = None, now: Optional[datetime] = None) -> list[float]:
+    """Score equally sized attribute columns; returns one score per row."""
+    cfg = cfg or get_priority_config()
+    now = now or datetime.now(timezone.utc)
+    if len(urgency) > 0 and _numpy() is not None:
+        return _score_columns_numpy(urgency, importance, impact, value_alignment, effort, due_date, cfg, now)
+    return [
+        score_row(u, i, imp, val, eff, due, cfg=cfg, now=now)
+        for u, i, imp, val, eff, due in zip(urgency, importance, impact, value_alignment, effort, due_date)
+    ]
+
+
+def score_rows(rows: Sequence[Sequence], cfg: Optional[dict] = None, now: Optional[datetime] = None) -> list[float]:
+    """Score row tuples laid out as ``SCORE_COLUMNS``."""
+    if not rows:
+        return []
+    return score_columns(*zip(*rows), cfg=cfg, now=now)
+
+
+def rescore_tasks(db, owner_id: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  now: Optional[datetime] = None, cfg: Optional[dict] = None) -> int:
+    """Recompute and persist ``priority_score`` for stored tasks.
+
+    Rows are streamed from the ``tasks`` table in primary-key order, ``chunk_size``
+    at a time, scored in one batch per chunk and written back with a bulk UPDATE.
+    Only rows whose score actually changed are written. Returns the number of
+    updated rows. Owners of changed tasks get their data version bumped. The
+    caller's session is committed once at the end.
+    """
+    from .models.task import Task, utcnow
+    from .versioning import bump_data_version
+
+    cfg = cfg or get_priority_config()
+    now = now or datetime.now(timezone.utc)
+    columns = [getattr(Task, name) for name in SCORE_COLUMNS]
+    updated = 0
+    owners: set[int] = set()
+    last_id = 0
+    while True:
+        stmt = select(Task.id, Task.owner_id, Task.priority_score, *columns).where(Task.id > last_id)
+        if owner_id is not None:
+            stmt = stmt.where(Task.owner_id == owner_id)
+        rows = db.execute(stmt.order_by(Task.id).limit(chunk_size)).all()
+        if not rows:
+            break
+        scores = score_rows([row[3:] for row in rows], cfg=cfg, now=now)
+        changed = [(row, score) for row, score in zip(rows, scores) if row[2] != score]
+        if changed:
+            stamp = utcnow()
+            db.execute(update(Task), [{"id": row[0], "priority_score": score, "updated_at": stamp}
+                                      for row, score in changed])
+            owners.update(row[1] for row, _ in changed)
+            updated += len(changed)
+        last_id = rows[-1][0]
+    bump_data_version(db, owners, {"type": "rescored"})
+    db.commit()
+    return updated
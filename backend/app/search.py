@@ -0,0 +1,72 @@
+"""Full-text task search over the ``tasks_fts`` FTS5 index.
+
+Results are ranked by a blend of text relevance and priority::
+
+    rank = -bm25(tasks_fts, TITLE_WEIGHT, 1.0) + SEARCH_PRIORITY_WEIGHT * priority_score / 100
+
+bm25 is negated so that higher is better for both terms; title matches count
+``TITLE_WEIGHT`` times as much as description matches. Pages are ordered by
+``(rank DESC, id DESC)`` and continue from a cursor like ``GET /tasks/``.
+
+Queries are plain words, all of which must match. A word ending in ``*`` is a
+prefix query (``rep*`` matches "report" and "repair"); the index keeps 2- and
+3-character prefixes so short prefixes don't scan the whole vocabulary.
+
+Settings:
+  SEARCH_PRIORITY_WEIGHT  rank points a priority_score of 100 is worth (default 2.0)
+"""
+from __future__ import annotations
+
+import os
+import re
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import column, func, literal_column, select, table, tuple_
+
+SEARCH_PRIORITY_WEIGHT = float(os.getenv("SEARCH_PRIORITY_WEIGHT", 2.0))
+TITLE_WEIGHT = 4.0
+
+# Created by TASK_SEARCH_DDL (app.models.task); not part of the ORM metadata.
+tasks_fts = table("tasks_fts", column("rowid"))
+
+_TERM = re.compile(r"(\w+)(\*?)")
+
+
+def match_expression(query: str) -> str:
+    """Translate user input into an FTS5 query that can't raise a syntax error.
+
+    Every word is quoted, so FTS5 operators and punctuation in the input are
+    treated as text.
+    """
+    terms = [f'"{word}"{star}' for word, star in _TERM.findall(query)]
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query must contain at least one word"
+        )
+    return " ".join(terms)
+
+
+def search_rank(task_cls, weight: Optional[float] = None):
+    """Blended relevance/priority rank; higher is better."""
+    weight = SEARCH_PRIORITY_WEIGHT if weight is None else weight
+    relevance = -func.bm25(literal_column("tasks_fts"), TITLE_WEIGHT, 1.0)
+    return relevance + weight * func.coalesce(task_cls.priority_score, 0.0) / 100.0
+
+
+def search_select(task_cls, query: str, *columns):
+    """SELECT ``columns`` and the rank (labelled ``_rank``, last) of rows matching ``query``."""
+    rank = search_rank(task_cls)
+    stmt = (
+        select(*columns, rank.label("_rank"))
+        .select_from(tasks_fts)
+        .join(task_cls, task_cls.id == tasks_fts.c.rowid)
+        .where(literal_column("tasks_fts").op("MATCH")(match_expression(query)))
+    )
+    return stmt, rank
+
+
+def after_rank(rank, task_cls, cursor: tuple[float, int]):
+    """WHERE clause selecting results ranked after ``cursor``."""
+    return tuple_(rank, task_cls.id) < tuple_(*cursor)
@@ -1,42 +1,86 @@
 """Security utilities for authentication and input validation."""
-import re
+import hashlib
+import os
 import time
-from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
 from fastapi import HTTPException, Request, Depends, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
-from .database import get_db
+from .cache import TTLCache
+from .database import get_async_db, get_read_db
+from .hashing import password_hasher
+from .ratelimit import StoreUnavailable, limiter_from_env, retry_after_header
+from .scanner import content_scanner
 
 # JWT Configuration
 SECRET_KEY = "your-secret-key-change-this-in-production-use-environment-variable"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# Tolerated clock skew when checking exp, both by jwt.decode and the token cache
+JWT_LEEWAY_SECONDS = int(os.getenv("JWT_LEEWAY_SECONDS", 0))
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing runs on a bounded process pool (see app.hashing)
+
+INVALID_CONTENT_DETAIL = "Invalid characters detected in input"
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
-# Rate limiting storage
-rate_limit_storage = defaultdict(list)
+# Rate limiting (see app.ratelimit for backends and RATE_LIMIT_* settings)
+rate_limiter = limiter_from_env()
+
+# Authenticated-user cache (token subject -> CurrentUser)
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 60))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", 10000))
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """Snapshot of the authenticated user's identity, safe to share across requests."""
+    id: int
+    email: str
+    is_active: bool
+    created_at: Optional[datetime]
+
+
+user_cache = TTLCache(max_size=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+# Verified-token cache (sha256(token) -> subject). Uses wall-clock time because
+# entries are bounded by the token's own exp claim.
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", 10000))
+token_cache = TTLCache(max_size=TOKEN_CACHE_MAX_SIZE, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60, clock=time.time)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify_and_update(plain_password, hashed_password)[0]
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """Verify a password; the second item is a replacement hash when the cost settings changed."""
+    return password_hasher.verify_and_update(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """Awaitable ``verify_and_update_password`` that doesn't hold a thread while hashing."""
+    return await password_hasher.verify_and_update_async(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Awaitable ``get_password_hash``."""
+    return await password_hasher.hash_async(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
+    # jose and its cryptography backend are imported on first use, not at startup
+    from jose import jwt
+
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -47,9 +91,21 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def verify_token(token: str):
-    """Verify and decode a JWT token."""
+    """Verify and decode a JWT token.
+
+    Successfully verified tokens are remembered by digest until their ``exp``
+    (plus the configured leeway), so a token presented repeatedly is only
+    signature-checked once.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    username = token_cache.get(key)
+    if username is not None:
+        return username
+    from jose import JWTError, jwt
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM],
+                             options={"leeway": JWT_LEEWAY_SECONDS})
         username: str = payload.get("sub")
         if username is None:
             raise HTTPException(
@@ -57,6 +113,8 @@ def verify_token(token: str):
                 detail="Invalid authentication credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        exp = payload.get("exp")
+        token_cache.set(key, username, expires_at=exp + JWT_LEEWAY_SECONDS if exp is not None else None)
         return username
     except JWTError:
         raise HTTPException(
@@ -65,22 +123,100 @@ def verify_token(token: str):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    """Get the current authenticated user."""
-    from .models.user import User  # Import here to avoid circular imports
-    
-    username = verify_token(token)
-    user = db.query(User).filter(User.email == username).first()
-    if user is None:
+def _remember_user(username: str, db_user) -> CurrentUser:
+    """Snapshot a freshly loaded user into the cache (401 if it doesn't exist)."""
+    if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    user = CurrentUser(db_user.id, db_user.email, bool(db_user.is_active), db_user.created_at)
+    user_cache.set(username, user)
+    return user
+
+
+def _require_active(user: CurrentUser) -> CurrentUser:
+    if not user.is_active:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
     return user
 
-def validate_task_input(title: str, description: Optional[str] = None):
-    """Validate task input for security."""
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_read_db)) -> CurrentUser:
+    """Get the current authenticated user.
+
+    Served from ``user_cache`` when possible; the database is only queried on a
+    miss. Cached entries are dropped whenever the user row changes.
+    """
+    from .models.user import User  # Import here to avoid circular imports
+    
+    username = verify_token(token)
+    user = user_cache.get(username)
+    if user is None:
+        user = _remember_user(username, db.query(User).filter(User.email == username).first())
+    return _require_active(user)
+
+
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db=Depends(get_async_db)) -> CurrentUser:
+    """Async variant of ``get_current_user`` for the DB_MODE=async routes."""
+    from .models.user import User  # Import here to avoid circular imports
+
+    username = verify_token(token)
+    user = user_cache.get(username)
+    if user is None:
+        result = await db.execute(select(User).where(User.email == username))
+        user = _remember_user(username, result.scalars().first())
+    return _require_active(user)
+
+
+def invalidate_user(email: str):
+    """Drop a user from the authenticated-user cache."""
+    user_cache.invalidate(email)
+
+
+# session.info key: emails whose cache entries to drop once the session commits
+_PENDING_INVALIDATIONS = "invalidate_users"
+
+
+def _invalidate_changed_user(mapper, connection, target):
+    from sqlalchemy import inspect
+    from sqlalchemy.orm import object_session
+
+    # Also drop the entry under the previous address if the email changed
+    emails = {target.email, *(inspect(target).attrs.email.history.deleted or ())}
+    session = object_session(target)
+    if session is None:
+        for email in emails:
+            invalidate_user(email)
+        return
+    # Flush runs before commit: invalidating now would let a concurrent request
+    # re-cache the still-committed old row, so wait for the commit
+    session.info.setdefault(_PENDING_INVALIDATIONS, set()).update(emails)
+
+
+def _invalidate_committed_users(session):
+    for email in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        invalidate_user(email)
+
+
+def _discard_rolled_back_invalidations(session, _previous_transaction):
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+def _register_user_cache_listeners():
+    from .models.user import User  # Import here to avoid circular imports
+
+    for event_name in ("after_update", "after_delete"):
+        event.listen(User, event_name, _invalidate_changed_user)
+    event.listen(Session, "after_commit", _invalidate_committed_users)
+    event.listen(Session, "after_soft_rollback", _discard_rolled_back_invalidations)
+
+def validate_task_input(title: str, description: Optional[str] = None, scanned: bool = False):
+    """Validate task input for security.
+
+    Pass ``scanned=True`` when the content was already checked with
+    ``content_scanner.scan_many`` (bulk endpoints); only lengths are checked then.
+    """
     if not title or len(title.strip()) == 0:
         raise HTTPException(status_code=400, detail="Title cannot be empty")
     
@@ -90,19 +226,9 @@ def validate_task_input(title: str, description: Optional[str] = None):
     if description and len(description) > 1000:
         raise HTTPException(status_code=400, detail="Description too long (max 1000 characters)")
     
-    # Check for potential XSS patterns
-    dangerous_patterns = [
-        r'<script.*?>.*?</script>',
-        r'javascript:',
-        r'on\w+\s*=',
-        r'<iframe.*?>',
-        r'<object.*?>',
-        r'<embed.*?>'
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, title, re.IGNORECASE) or (description and re.search(pattern, description, re.IGNORECASE)):
-            raise HTTPException(status_code=400, detail="Invalid characters detected in input")
+    # Check for potential XSS patterns (see app.scanner)
+    if not scanned and content_scanner.scan(title, description) is not None:
+        raise HTTPException(status_code=400, detail=INVALID_CONTENT_DETAIL)
 
 def validate_priority_values(*values):
     """Validate priority values are within acceptable range."""
@@ -110,24 +236,31 @@ def validate_priority_values(*values):
         if value is not None and (value < 1 or value > 10):
             raise HTTPException(status_code=400, detail="Priority values must be between 1 and 10")
 
-def rate_limit_middleware(request: Request, max_requests: int = 100, window_minutes: int = 1):
-    """Simple rate limiting middleware."""
-    client_ip = request.client.host
-    now = time.time()
-    window_start = now - (window_minutes * 60)
-    
-    # Clean old entries
-    rate_limit_storage[client_ip] = [
-        timestamp for timestamp in rate_limit_storage[client_ip] 
-        if timestamp > window_start
-    ]
-    
-    # Check rate limit
-    if len(rate_limit_storage[client_ip]) >= max_requests:
+async def rate_limit_middleware(request: Request):
+    """Rate limit a request by client IP according to the per-route rules.
+
+    Stores doing I/O (sqlite, redis) run in the threadpool so they don't block
+    the event loop.
+    """
+    args = (request.client.host, request.url.path)
+    if rate_limiter.rule_for(request.url.path) is None:
+        return
+    try:
+        if rate_limiter.store.blocking:
+            allowed, retry_after = await run_in_threadpool(rate_limiter.check, *args)
+        else:
+            allowed, retry_after = rate_limiter.check(*args)
+    except StoreUnavailable:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Rate limiting unavailable, retry later",
+        )
+    if not allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Rate limit exceeded"
+            detail="Rate limit exceeded",
+            headers={"Retry-After": retry_after_header(retry_after)},
         )
-    
-    # Add current request
-    rate_limit_storage[client_ip].append(now)
+
+
+_register_user_cache_listeners()
@@ -0,0 +1,53 @@
+"""Fast JSON read path for task responses.
+
+List endpoints select only the columns ``TaskResponse`` exposes, as plain row
+tuples, and encode them straight to JSON bytes. This skips ORM object
+construction, Pydantic validation and FastAPI's response re-validation while
+producing the same wire format. ``orjson`` is used when installed, otherwise
+the standard library encoder.
+"""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Sequence
+
+from fastapi import Response
+
+from .schemas.task import TaskResponse
+
+try:  # optional acceleration
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+# TaskResponse fields, in declaration order; each maps to a Task column.
+TASK_FIELDS: tuple[str, ...] = tuple(TaskResponse.model_fields)
+
+
+def task_columns(task_cls) -> list:
+    """Columns to select for ``TASK_FIELDS`` rows."""
+    return [getattr(task_cls, name) for name in TASK_FIELDS]
+
+
+def rows_to_dicts(rows: Iterable[Sequence[Any]]) -> list[dict]:
+    fields = TASK_FIELDS
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_default, separators=(",", ":")).encode()
+
+
+def json_response(payload, status_code: int = 200, headers: dict | None = None) -> Response:
+    """Encoded JSON response that bypasses ``response_model`` validation."""
+    return Response(content=dumps(payload), status_code=status_code,
+                    headers=headers, media_type="application/json")
@@ -5,53 +5,237 @@ Environment overrides (optional):
   EFFORT_PENALTY, DUE_SOON_DAYS, DUE_SOON_MAX_BONUS
 
 Weights need not sum to 1; they'll be normalized in scoring.
+
+Runtime overrides (PUT /config/priority) are stored in the ``priority_config``
+table and shared by all worker processes (see ``SharedPriorityConfig``):
+  PRIORITY_CONFIG_CHECK_MS  how often a worker checks the stored config
+                            version, in milliseconds (default 1000); a change
+                            is picked up within about this interval
+
+Background rescoring (optional):
+  RESCORE_INTERVAL_SECONDS  seconds between due-date window rescoring ticks
+                            (default 300, 0 disables the scheduler)
+
+Delta sync tombstones (optional):
+  TOMBSTONE_RETENTION_DAYS           how long deletions stay visible to
+                                     GET /tasks/changes (default 30); older
+                                     sync cursors get a reset
+  TOMBSTONE_COMPACT_INTERVAL_SECONDS seconds between compaction runs
+                                     (default 3600, 0 disables compaction)
 """
 from __future__ import annotations
 from functools import lru_cache
+from typing import Optional
+import json
+import logging
 import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+RESCORE_INTERVAL_SECONDS = _env_int("RESCORE_INTERVAL_SECONDS", 300)
+TOMBSTONE_RETENTION_DAYS = _env_int("TOMBSTONE_RETENTION_DAYS", 30)
+TOMBSTONE_COMPACT_INTERVAL_SECONDS = _env_int("TOMBSTONE_COMPACT_INTERVAL_SECONDS", 3600)
+PRIORITY_CONFIG_CHECK_MS = _env_int("PRIORITY_CONFIG_CHECK_MS", 1000)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
 
-# In-memory runtime overrides (not persisted). These override env values if set.
-_RUNTIME_OVERRIDES: dict[str, float | int] = {}
 
 @lru_cache
-def get_priority_config():
-    def _f(name: str, default: float) -> float:
-        try:
-            return float(os.getenv(name, default))
-        except ValueError:
-            return default
-    base = {
-        "weight_urgency": _f("WEIGHT_URGENCY", 0.30),
-        "weight_importance": _f("WEIGHT_IMPORTANCE", 0.30),
-        "weight_impact": _f("WEIGHT_IMPACT", 0.20),
-        "weight_value": _f("WEIGHT_VALUE", 0.20),
-        "effort_penalty": _f("EFFORT_PENALTY", 0.15),  # factor per normalized effort unit
-        "due_soon_days": int(os.getenv("DUE_SOON_DAYS", 5)),
-        "due_soon_max_bonus": _f("DUE_SOON_MAX_BONUS", 0.15),  # multiplicative bonus cap
+def _env_priority_config() -> dict:
+    return {
+        "weight_urgency": _env_float("WEIGHT_URGENCY", 0.30),
+        "weight_importance": _env_float("WEIGHT_IMPORTANCE", 0.30),
+        "weight_impact": _env_float("WEIGHT_IMPACT", 0.20),
+        "weight_value": _env_float("WEIGHT_VALUE", 0.20),
+        "effort_penalty": _env_float("EFFORT_PENALTY", 0.15),  # factor per normalized effort unit
+        "due_soon_days": _env_int("DUE_SOON_DAYS", 5),
+        "due_soon_max_bonus": _env_float("DUE_SOON_MAX_BONUS", 0.15),  # multiplicative bonus cap
     }
-    # Apply runtime overrides
-    for k, v in _RUNTIME_OVERRIDES.items():
-        if k in base:
-            base[k] = v
-    return base
-
-def refresh_priority_config():  # pragma: no cover
-    get_priority_config.cache_clear()
-    return get_priority_config()
-
-
-def set_priority_overrides(**overrides):  # pragma: no cover - simple helper
-    """Set runtime overrides for priority configuration.
-    Only known keys are accepted. Call refresh_priority_config afterwards to apply."""
-    valid = get_priority_config().keys()  # ensures base initialized
-    for k, v in overrides.items():
-        if k in valid and v is not None:
-            _RUNTIME_OVERRIDES[k] = v
-    refresh_priority_config()
-    return get_priority_config()
-
-
-def clear_priority_overrides():  # pragma: no cover
-    _RUNTIME_OVERRIDES.clear()
-    refresh_priority_config()
-    return get_priority_config()
+
+
+class SharedPriorityConfig:
+    """Environment defaults plus runtime overrides stored in ``priority_config``.
+
+    The overrides live in one database row with a version number, so every
+    worker process sees the same configuration. Each process caches the merged
+    config and, at most once per ``check_interval_ms``, reads the stored
+    version (a primary-key lookup); the overrides are reloaded only when it
+    changed. Between checks ``get`` is a plain memory read.
+
+    While a ``PriorityConfigWatcher`` runs for it (``watched``), the checks
+    happen on the watcher's thread only and ``get`` never queries, so callers
+    on the event loop (the async routes) don't block on the database.
+    """
+
+    def __init__(self, session_factory=None, check_interval_ms: int = PRIORITY_CONFIG_CHECK_MS):
+        self._session_factory = session_factory
+        self.check_interval = check_interval_ms / 1000
+        self.version: Optional[int] = None
+        self.watched = False
+        self._config: Optional[dict] = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def _session(self, read_only: bool = False):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from .database import ReadSessionLocal, SessionLocal
+        return ReadSessionLocal() if read_only else SessionLocal()
+
+    @staticmethod
+    def _merged(overrides: dict) -> dict:
+        config = dict(_env_priority_config())
+        config.update((k, v) for k, v in overrides.items() if k in config and v is not None)
+        return config
+
+    def _apply(self, version: int, overrides: dict):
+        self._config, self.version = self._merged(overrides), version
+        self._checked_at = time.monotonic()
+
+    def _committed(self, version: int, overrides: dict):
+        """Adopt a config this process stored, once its transaction has committed."""
+        with self._lock:
+            if self.version is None or version > self.version:
+                self._apply(version, overrides)
+
+    def get(self) -> dict:
+        if self._config is None or (
+            not self.watched and time.monotonic() - self._checked_at >= self.check_interval
+        ):
+            self.refresh()
+        return self._config
+
+    def refresh(self, force: bool = False) -> dict:
+        """Check the stored version now, reloading the overrides if it changed."""
+        from sqlalchemy import select
+        from sqlalchemy.exc import SQLAlchemyError
+        from .models.config import PRIORITY_CONFIG_ID, PriorityConfig
+
+        with self._lock:
+            db = self._session(read_only=True)
+            try:
+                version = db.scalar(select(PriorityConfig.version).where(PriorityConfig.id == PRIORITY_CONFIG_ID)) or 0
+                if force or version != self.version or self._config is None:
+                    overrides = db.scalar(
+                        select(PriorityConfig.overrides).where(PriorityConfig.id == PRIORITY_CONFIG_ID)
+                    )
+                    self._apply(version, json.loads(overrides or "{}"))
+                else:
+                    self._checked_at = time.monotonic()
+            except SQLAlchemyError:
+                # e.g. a database without the table yet: keep what we have
+                logger.warning("Could not read the shared priority config", exc_info=True)
+                if self._config is None:
+                    self._apply(0, {})
+                else:
+                    self._checked_at = time.monotonic()
+            finally:
+                db.close()
+            return self._config
+
+    def update(self, overrides: dict, db=None, clear: bool = False, rescored: bool = False) -> dict:
+        """Merge ``overrides`` into the stored ones (replace them with ``clear``) and bump the version.
+
+        Runs in ``db``'s transaction when one is given (the caller commits, e.g.
+        after rescoring), otherwise in its own. Returns the new merged config;
+        this process only starts using it once the transaction commits. Pass
+        ``rescored=True`` when the caller rescores all tasks with it in the same
+        transaction; the flag is stored with the version so no worker's
+        ``PriorityConfigWatcher`` rescores them again.
+        """
+        from datetime import datetime, timezone
+        from sqlalchemy import select, update
+        from .models.config import PRIORITY_CONFIG_ID, PriorityConfig
+
+        own_session = db is None
+        db = db or self._session()
+        try:
+            # Bumping first takes the write lock, so concurrent updates from
+            # other workers serialize and none of their overrides is lost.
+            version = db.execute(
+                update(PriorityConfig)
+                .where(PriorityConfig.id == PRIORITY_CONFIG_ID)
+                .values(version=PriorityConfig.version + 1, updated_at=datetime.now(timezone.utc))
+                .returning(PriorityConfig.version)
+            ).scalar()
+            if version is None:
+                version = 1
+                db.add(PriorityConfig(id=PRIORITY_CONFIG_ID, version=version, overrides="{}",
+                                      updated_at=datetime.now(timezone.utc)))
+                db.flush()
+            stored = {} if clear else json.loads(db.scalar(
+                select(PriorityConfig.overrides).where(PriorityConfig.id == PRIORITY_CONFIG_ID)
+            ))
+            valid = _env_priority_config().keys()
+            stored.update((k, v) for k, v in overrides.items() if k in valid and v is not None)
+            db.execute(update(PriorityConfig).where(PriorityConfig.id == PRIORITY_CONFIG_ID)
+                       .values(overrides=json.dumps(stored), rescored=rescored))
+            if own_session:
+                db.commit()
+                self._committed(version, stored)
+            else:
+                db.info.setdefault(_PENDING_CONFIGS, []).append((self, version, stored))
+        finally:
+            if own_session:
+                db.close()
+        return self._merged(stored)
+
+
+# session.info key: configs stored in the session's transaction, adopted on commit
+_PENDING_CONFIGS = "priority_configs"
+
+
+@event.listens_for(Session, "after_commit")
+def _adopt_committed_configs(session):
+    for config, version, overrides in session.info.pop(_PENDING_CONFIGS, ()):
+        config._committed(version, overrides)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_configs(session, _previous_transaction):
+    session.info.pop(_PENDING_CONFIGS, None)
+
+
+priority_config = SharedPriorityConfig()
+
+
+def get_priority_config() -> dict:
+    return priority_config.get()
+
+
+def refresh_priority_config():
+    """Re-read environment defaults and stored overrides now."""
+    _env_priority_config.cache_clear()
+    return priority_config.refresh(force=True)
+
+
+def set_priority_overrides(db=None, rescored: bool = False, **overrides):
+    """Store overrides for the priority configuration, shared by all workers.
+
+    Only known keys are accepted. Pass ``db`` to make the change part of that
+    session's transaction (e.g. together with ``rescore_tasks``; see
+    ``SharedPriorityConfig.update`` for ``rescored``).
+    """
+    return priority_config.update(overrides, db, rescored=rescored)
+
+
+def clear_priority_overrides(db=None, rescored: bool = False):
+    """Drop all stored overrides, reverting to environment-variable configuration."""
+    return priority_config.update({}, db, clear=True, rescored=rescored)
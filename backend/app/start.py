@@ -1,42 +1,189 @@
 """Runtime sanitation and app launcher.
 
-Removes UTF BOMs, UTF-16 encodings, and embedded null bytes from all .py files
-before starting Uvicorn. This offsets any editor / OS encoding corruption while
-developing with a bind mount.
+Development (the default) removes UTF BOMs, UTF-16 encodings, and embedded null
+bytes from all .py files before starting Uvicorn with the reloader. This
+offsets any editor / OS encoding corruption while developing with a bind
+mount. File sizes and mtimes are recorded in a cache file, so later boots only
+re-read files that changed since.
+
+Production (``python -m app.start --production`` or START_MODE=production)
+prefork-starts one Uvicorn worker per available CPU on the fast loop and HTTP
+parser (uvloop, httptools) when they are installed, without the reloader.
+Sources are not sanitized: the image is fixed at build time. A worker that
+exits, e.g. after WORKER_MAX_REQUESTS requests, is replaced by a fresh one;
+with a single worker, requests arriving while it restarts fail.
+
+Workers share their state through the database: the change feed catches
+clients up on other workers' changes, and background rescoring and compaction
+run in the one worker holding their lease (see ``app.scheduler``). With
+several workers the rate limiter defaults to the shared SQLite store
+(RATE_LIMIT_BACKEND=sqlite) so limits apply across workers. The
+authenticated-user cache stays per worker: a change made through one worker
+reaches the others' caches within USER_CACHE_TTL_SECONDS.
+
+Settings:
+  START_MODE           development (default) or production
+  HOST, PORT           bind address (default 0.0.0.0:8000)
+  WEB_WORKERS          production worker processes (default: CPUs available)
+  WORKER_MAX_REQUESTS  requests a production worker serves before it is
+                       recycled (default 0, never)
+  SANITIZE_SOURCES     1/0 forces sanitization on or off (default: on in
+                       development, off in production)
+  SANITIZE_CACHE       cache of already-checked sources (default
+                       .sanitize-cache.json in the current directory)
 """
 from __future__ import annotations
+import importlib.util
+import json
+import logging
+import os
 import pathlib
+import sys
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Directories never holding application sources; not walked
+SKIP_DIRS = {"__pycache__", "node_modules", "venv"}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _clean(raw: bytes) -> Optional[bytes]:
+    """``raw`` with BOM, UTF-16 and NULs fixed, or None if it was already clean."""
+    changed = False
+    if raw.startswith(b'\xef\xbb\xbf'):
+        raw = raw[3:]; changed = True
+    elif raw.startswith(b'\xff\xfe'):
+        try:
+            raw = raw[2:].decode('utf-16-le').encode('utf-8'); changed = True
+        except Exception:
+            pass
+    elif raw.startswith(b'\xfe\xff'):
+        try:
+            raw = raw[2:].decode('utf-16-be').encode('utf-8'); changed = True
+        except Exception:
+            pass
+    if b'\x00' in raw:
+        raw = raw.replace(b'\x00', b''); changed = True
+    return raw if changed else None
+
+
+def _sources(root: pathlib.Path):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in SKIP_DIRS]
+        for name in filenames:
+            if name.endswith('.py'):
+                yield pathlib.Path(dirpath, name)
 
 
-def sanitize_py(root: pathlib.Path):
-    for path in root.rglob('*.py'):
+def _load_cache(cache: Optional[pathlib.Path]) -> dict:
+    if cache is None:
+        return {}
+    try:
+        return json.loads(cache.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: pathlib.Path, seen: dict):
+    tmp = cache.with_name(cache.name + '.tmp')
+    try:
+        tmp.write_text(json.dumps(seen))
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # read-only checkout: next boot just checks everything again
+
+
+def sanitize_py(root: pathlib.Path, cache: Optional[pathlib.Path] = None) -> list[pathlib.Path]:
+    """Fix encoding damage in the .py files under ``root``; returns the files rewritten.
+
+    With ``cache``, files whose mtime and size match the previous run are
+    skipped without being read.
+    """
+    known = _load_cache(cache)
+    seen = {}
+    fixed = []
+    for path in _sources(root):
         try:
-            raw = path.read_bytes()
+            stat = path.stat()
+            key = str(path)
+            if known.get(key) == [stat.st_mtime_ns, stat.st_size]:
+                seen[key] = known[key]
+                continue
+            cleaned = _clean(path.read_bytes())
+            if cleaned is not None:
+                path.write_bytes(cleaned)
+                fixed.append(path)
+                stat = path.stat()
         except Exception:
             continue
-        changed = False
-        if raw.startswith(b'\xef\xbb\xbf'):
-            raw = raw[3:]; changed = True
-        elif raw.startswith(b'\xff\xfe'):
-            try:
-                raw = raw[2:].decode('utf-16-le').encode('utf-8'); changed = True
-            except Exception:
-                pass
-        elif raw.startswith(b'\xfe\xff'):
-            try:
-                raw = raw[2:].decode('utf-16-be').encode('utf-8'); changed = True
-            except Exception:
-                pass
-        if b'\x00' in raw:
-            raw = raw.replace(b'\x00', b''); changed = True
-        if changed:
-            path.write_bytes(raw)
-
-
-def main():
-    sanitize_py(pathlib.Path('.'))
+        seen[key] = [stat.st_mtime_ns, stat.st_size]
+    if cache is not None and seen != known:
+        _save_cache(cache, seen)
+    return fixed
+
+
+def _cpu_count() -> int:
+    # CPUs this process may run on, which respects container CPU sets
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def uvicorn_options(production: bool) -> dict:
+    """Keyword arguments for ``uvicorn.run`` in the given mode."""
+    options = {"host": os.getenv("HOST", "0.0.0.0"), "port": _env_int("PORT", 8000)}
+    if not production:
+        return {**options, "reload": True}
+    max_requests = _env_int("WORKER_MAX_REQUESTS", 0)
+    return {
+        **options,
+        "workers": max(1, _env_int("WEB_WORKERS", _cpu_count())),
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+        "limit_max_requests": max_requests if max_requests > 0 else None,
+        "reload": False,
+    }
+
+
+def share_state(workers: int):
+    """Point per-process state at shared stores before ``workers`` processes start."""
+    if workers <= 1:
+        return
+    # Inherited by the workers; an explicit RATE_LIMIT_BACKEND (e.g. redis) wins
+    backend = os.environ.setdefault("RATE_LIMIT_BACKEND", "sqlite")
+    if backend == "memory":
+        logger.warning("%d workers with RATE_LIMIT_BACKEND=memory: each worker enforces its own limits",
+                       workers)
+
+
+def main(argv: Optional[list[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    production = "--production" in argv or os.getenv("START_MODE", "development") == "production"
+    if _env_int("SANITIZE_SOURCES", 0 if production else 1):
+        sanitize_py(pathlib.Path('.'), pathlib.Path(os.getenv("SANITIZE_CACHE", ".sanitize-cache.json")))
+    options = uvicorn_options(production)
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    if options.get("workers") == 1 and options.get("limit_max_requests"):
+        # uvicorn.run only supervises two or more workers; a lone recycled
+        # worker would just exit, so run it under the supervisor too
+        from uvicorn.supervisors import Multiprocess
+        config = uvicorn.Config("app.main:app", **options)
+        server = uvicorn.Server(config)
+        Multiprocess(config, target=server.run, sockets=[config.bind_socket()]).run()
+        return
+    share_state(options.get("workers", 1))
+    uvicorn.run("app.main:app", **options)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+"""Storage engine configuration.
+
+Settings (environment):
+  DATABASE_URL            SQLAlchemy URL (default ``sqlite:///./tasks.db``)
+  DB_POOL_SIZE            write connections kept open (default 5)
+  DB_MAX_OVERFLOW         extra write connections allowed under load (default 10)
+  DB_READ_POOL_SIZE       connections kept open by the read-only engine (default 10)
+  DB_READ_MAX_OVERFLOW    extra read connections allowed under load (default 10)
+  DB_POOL_TIMEOUT         seconds to wait for a free connection (default 30)
+  DB_PROFILE              ``tuned`` (default) applies the pragmas below to every
+                          new SQLite connection; ``default`` keeps SQLite's
+                          built-in behaviour (rollback journal, FULL sync)
+
+SQLite pragmas (``tuned`` profile):
+  SQLITE_JOURNAL_MODE     default WAL, so readers don't block behind a writer
+  SQLITE_SYNCHRONOUS      default NORMAL (durable in WAL mode except on power loss)
+  SQLITE_CACHE_SIZE       page cache; negative values are KiB (default -64000)
+  SQLITE_MMAP_SIZE        bytes of the file to memory-map (default 268435456)
+  SQLITE_BUSY_TIMEOUT_MS  wait for locks instead of failing (default 5000)
+  SQLITE_TEMP_STORE       default MEMORY
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+# Pragma name -> (environment variable, tuned default), applied in this order;
+# journal_mode comes first because it can't change inside a transaction
+PRAGMA_SETTINGS = {
+    "journal_mode": ("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": ("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "cache_size": ("SQLITE_CACHE_SIZE", "-64000"),
+    "mmap_size": ("SQLITE_MMAP_SIZE", "268435456"),
+    "busy_timeout": ("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+    "temp_store": ("SQLITE_TEMP_STORE", "MEMORY"),
+}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class StorageSettings:
+    url: str = "sqlite:///./tasks.db"
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    read_pool_size: int = 10
+    read_max_overflow: int = 10
+    profile: str = "tuned"
+    pragmas: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_env(cls) -> "StorageSettings":
+        profile = os.getenv("DB_PROFILE", "tuned")
+        pragmas = {}
+        if profile == "tuned":
+            pragmas = {name: os.getenv(var, default) for name, (var, default) in PRAGMA_SETTINGS.items()}
+        return cls(
+            url=os.getenv("DATABASE_URL", cls.url),
+            pool_size=_env_int("DB_POOL_SIZE", cls.pool_size),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", cls.max_overflow),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", cls.pool_timeout),
+            read_pool_size=_env_int("DB_READ_POOL_SIZE", cls.read_pool_size),
+            read_max_overflow=_env_int("DB_READ_MAX_OVERFLOW", cls.read_max_overflow),
+            profile=profile,
+            pragmas=pragmas,
+        )
+
+    @property
+    def is_sqlite(self) -> bool:
+        return make_url(self.url).get_backend_name() == "sqlite"
+
+    @property
+    def is_memory(self) -> bool:
+        return self.is_sqlite and make_url(self.url).database in (None, "", ":memory:")
+
+    def engine_kwargs(self, read_only: bool = False) -> dict:
+        """Keyword arguments for ``create_engine`` / ``create_async_engine``."""
+        kwargs = {}
+        if self.is_sqlite:
+            kwargs["connect_args"] = {"check_same_thread": False}
+        if not self.is_memory:  # in-memory SQLite needs its single-connection pool
+            kwargs.update(
+                pool_size=self.read_pool_size if read_only else self.pool_size,
+                max_overflow=self.read_max_overflow if read_only else self.max_overflow,
+                pool_timeout=self.pool_timeout,
+            )
+        return kwargs
+
+
+class PoolWaitStats:
+    """Thread-safe count/total/max of connection checkout waits."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def stats(self) -> dict:
+        with self._lock:
+            avg = self.total / self.checkouts if self.checkouts else 0.0
+            return {"checkouts": self.checkouts, "wait_avg_ms": round(avg * 1000, 3),
+                    "wait_max_ms": round(self.max * 1000, 3), "wait_total_ms": round(self.total * 1000, 3)}
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats  # keep counting across engine.dispose()
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - start)
+
+
+def pool_stats(engine: Engine) -> dict:
+    """Checkout wait metrics and current occupancy of ``engine``'s pool."""
+    pool = engine.pool
+    stats = pool.wait_stats.stats() if isinstance(pool, TimedQueuePool) else {}
+    if isinstance(pool, QueuePool):
+        stats.update(size=pool.size(), checked_out=pool.checkedout(), overflow=pool.overflow())
+    return stats
+
+
+def apply_pragmas(engine: Engine, settings: StorageSettings, read_only: bool = False):
+    """Run the configured pragmas on every new DBAPI connection of ``engine``.
+
+    ``read_only`` connections also get ``query_only`` so a write routed to the
+    read engine by mistake fails instead of taking the write lock.
+    """
+    if not settings.is_sqlite:
+        return
+    statements = [f"PRAGMA {name}={value}" for name, value in settings.pragmas.items()]
+    if read_only:
+        statements.append("PRAGMA query_only=ON")
+    if not statements:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def effective_settings(engine: Engine, settings: StorageSettings) -> dict:
+    """Settings as a live connection actually sees them (for the startup report)."""
+    report = {
+        "url": make_url(settings.url).render_as_string(hide_password=True),
+        "profile": settings.profile,
+        "pool": type(engine.pool).__name__,
+    }
+    if not settings.is_memory:
+        report.update(pool_size=settings.pool_size, max_overflow=settings.max_overflow,
+                      pool_timeout=settings.pool_timeout)
+    if settings.is_sqlite:
+        with engine.connect() as conn:
+            report["pragmas"] = {
+                name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in PRAGMA_SETTINGS
+            }
+    return report
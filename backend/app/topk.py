@@ -0,0 +1,109 @@
+"""Top-K task selection for ``GET /tasks/top``.
+
+The default mode reads the first K rows of the ``(owner_id, priority_score,
+id)`` ranking index (or the ``(owner_id, quadrant, priority_score, id)`` index
+when filtering by quadrant), so its cost depends on K, not on backlog size.
+
+"As of now" mode ranks by scores recomputed at the current time, without
+rescoring the whole backlog. Stored scores go stale only through the due-soon
+bonus, so there are two cases:
+
+* Tasks due inside ``(now, now + due_soon_days]`` have an active bonus and may
+  now score *higher* than stored. They are found by a range scan of the
+  ``(owner_id, due_date)`` index and all rescored.
+* Every other task has no bonus now. Its fresh score is its base score, which
+  is at most the stored score. These are walked in stored-score order
+  (threshold algorithm): each row is rescored, and the walk stops once the
+  K-th best fresh score beats the next row's stored score, since no later row
+  can do better.
+
+Without due-date drift the walk reads about K rows. The bound assumes stored
+scores match the current weights, which ``rescore_tasks`` maintains.
+"""
+from __future__ import annotations
+
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import and_, not_, or_, select
+
+from .models.task import Task
+from .pagination import after_cursor, ranking_order
+from .scoring import SCORE_COLUMNS, score_rows
+from .serialization import rows_to_dicts, task_columns
+from .settings import get_priority_config
+
+# Rows fetched per step of the as-of-now walk, at least
+MIN_WALK_BATCH = 50
+
+
+def _filters(owner_id: int, quadrant: Optional[int], due_before: Optional[datetime]) -> list:
+    clauses = [Task.owner_id == owner_id]
+    if quadrant is not None:
+        clauses.append(Task.quadrant == quadrant)
+    if due_before is not None:
+        clauses.append(Task.due_date < due_before)
+    return clauses
+
+
+def top_tasks(db, owner_id: int, k: int, quadrant: Optional[int] = None,
+              due_before: Optional[datetime] = None) -> list[dict]:
+    """The ``k`` highest stored-score tasks, straight from the ranking index."""
+    rows = db.execute(
+        select(*task_columns(Task))
+        .where(*_filters(owner_id, quadrant, due_before))
+        .order_by(*ranking_order(Task))
+        .limit(k)
+    ).all()
+    return rows_to_dicts(rows)
+
+
+def _rescored(tasks: list[dict], cfg: dict, now: datetime) -> list[dict]:
+    scores = score_rows([tuple(task[c] for c in SCORE_COLUMNS) for task in tasks], cfg=cfg, now=now)
+    for task, score in zip(tasks, scores):
+        task["priority_score"] = score
+    return tasks
+
+
+def top_tasks_as_of(db, owner_id: int, k: int, quadrant: Optional[int] = None,
+                    due_before: Optional[datetime] = None, now: Optional[datetime] = None,
+                    cfg: Optional[dict] = None) -> list[dict]:
+    """The ``k`` highest-scoring tasks with scores recomputed as of ``now``."""
+    now = now or datetime.now(timezone.utc)
+    cfg = cfg or get_priority_config()
+    filters = _filters(owner_id, quadrant, due_before)
+    bonus_active = and_(Task.due_date > now, Task.due_date <= now + timedelta(days=cfg["due_soon_days"]))
+
+    # Min-heap of the best k (score, id, task) seen so far
+    best: list[tuple] = []
+
+    def offer(task: dict):
+        entry = (task["priority_score"], task["id"], task)
+        if len(best) < k:
+            heapq.heappush(best, entry)
+        elif entry[:2] > best[0][:2]:
+            heapq.heapreplace(best, entry)
+
+    window = db.execute(select(*task_columns(Task)).where(*filters, bonus_active)).all()
+    for task in _rescored(rows_to_dicts(window), cfg, now):
+        offer(task)
+
+    rest = select(*task_columns(Task)).where(*filters, or_(Task.due_date.is_(None), not_(bonus_active)))
+    batch = max(k, MIN_WALK_BATCH)
+    cursor = None
+    while True:
+        query = rest if cursor is None else rest.where(after_cursor(Task, cursor))
+        rows = db.execute(query.order_by(*ranking_order(Task)).limit(batch)).all()
+        for row, task in zip(rows, _rescored(rows_to_dicts(rows), cfg, now)):
+            # Fresh scores here never exceed the stored ones: stop at the threshold
+            if len(best) == k and (row.priority_score is None or best[0][:2] > (row.priority_score, row.id)):
+                return _ranked(best)
+            offer(task)
+        if len(rows) < batch:
+            return _ranked(best)
+        cursor = (rows[-1].priority_score, rows[-1].id)
+
+
+def _ranked(best: list[tuple]) -> list[dict]:
+    return [task for _, _, task in sorted(best, key=lambda entry: entry[:2], reverse=True)]
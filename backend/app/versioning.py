@@ -0,0 +1,86 @@
+"""Per-user data versions and ETags for task reads.
+
+Every write that can change what a user's task reads return (task mutations,
+rescoring) bumps ``users.data_version`` in the same transaction. Read
+endpoints derive a strong ETag from that version plus the request URL, so a
+client revalidating with ``If-None-Match`` gets ``304 Not Modified`` after a
+primary-key lookup on ``users``, without the tasks table being queried.
+``Cache-Control: no-cache`` makes browsers revalidate on their own, so the
+frontend's refetches become conditional requests without code changes.
+
+Bumps can carry a change-feed event, which is published (``app.feed``) only
+after the transaction commits.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable, Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event as sa_event, select, update
+from sqlalchemy.orm import Session
+
+from .feed import change_hub
+from .models.user import User
+
+# Session.info key for change-feed events waiting for their transaction to commit
+_PENDING_EVENTS = "pending_change_events"
+
+
+def bump_data_version(db, owner_ids: Iterable[int], event: Optional[dict] = None):
+    """Increment the data version of every user in ``owner_ids``.
+
+    ``event`` (e.g. ``{"type": "deleted", "ids": [...]}``) is published to the
+    users' change feeds, tagged with their new version, once ``db`` commits.
+    """
+    ids = set(owner_ids)
+    if not ids:
+        return
+    versions = db.execute(
+        update(User)
+        .where(User.id.in_(ids))
+        # keep updated_at for account changes, not task activity
+        .values(data_version=User.data_version + 1, updated_at=User.updated_at)
+        .returning(User.id, User.data_version)
+    ).all()
+    if event is not None:
+        pending = db.info.setdefault(_PENDING_EVENTS, [])
+        pending.extend((user_id, {**event, "version": version}) for user_id, version in versions)
+
+
+def data_version(db, user_id: int) -> int:
+    return db.execute(select(User.data_version).where(User.id == user_id)).scalar() or 0
+
+
+def task_etag(request: Request, db, user_id: int) -> str:
+    """Strong ETag for this representation of ``user_id``'s current task data."""
+    url = request.url.path + "?" + request.url.query
+    digest = hashlib.sha1(url.encode()).hexdigest()[:12]
+    return f'"{user_id}-{data_version(db, user_id)}-{digest}"'
+
+
+def etag_headers(etag: str) -> dict:
+    # no-cache: browsers may store the response but must revalidate every time
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A 304 response when ``If-None-Match`` matches ``etag``, else ``None``."""
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+    candidates = {tag.strip() for tag in header.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=304, headers=etag_headers(etag))
+    return None
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_committed_events(session):
+    for user_id, event in session.info.pop(_PENDING_EVENTS, ()):
+        change_hub.publish(user_id, event)
+
+
+@sa_event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_events(session, _previous_transaction):
+    session.info.pop(_PENDING_EVENTS, None)
@@ -0,0 +1,165 @@
+"""Single writer thread with group commit for task mutations.
+
+SQLite allows one writer at a time, so request handlers that each open their
+own write transaction just queue up on the database lock (and fsync once per
+request). Instead, routers submit mutations here as ``fn(session) -> result``.
+One thread drains the queue, runs every mutation that arrived within
+``WRITE_BATCH_WINDOW_MS`` (up to ``WRITE_BATCH_MAX``) in a single transaction
+and commits once; each caller then receives its own result or exception.
+
+A mutation that raises is dropped from the batch and the rest are replayed in a
+fresh transaction, so one failing request never affects the others. Mutations
+must therefore only touch the database through the session they are given and
+return plain data (not ORM instances bound to that session).
+
+Settings:
+  WRITE_BATCH_MAX        mutations per transaction (default 64)
+  WRITE_BATCH_WINDOW_MS  how long to wait for more mutations after the first
+                         one arrives (default 2)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+from .database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+WRITE_BATCH_MAX = int(os.getenv("WRITE_BATCH_MAX", 64))
+WRITE_BATCH_WINDOW_MS = float(os.getenv("WRITE_BATCH_WINDOW_MS", 2))
+WRITE_TIMEOUT_SECONDS = 30
+
+Mutation = Callable[[Any], Any]
+
+
+class GroupCommitWriter:
+    """Runs submitted mutations on one thread, committing them in batches."""
+
+    def __init__(self, session_factory, max_batch: int = WRITE_BATCH_MAX,
+                 window_ms: float = WRITE_BATCH_WINDOW_MS):
+        self.session_factory = session_factory
+        self.max_batch = max(1, max_batch)
+        self.window = window_ms / 1000
+        self.batches = 0
+        self.mutations = 0
+        self._queue: queue.Queue[Optional[tuple[Mutation, Future]]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="task-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, fn: Mutation) -> Future:
+        future: Future = Future()
+        self._ensure_started()
+        self._queue.put((fn, future))
+        return future
+
+    def execute(self, fn: Mutation):
+        """Submit ``fn`` and block until its batch has committed."""
+        future = self.submit(fn)
+        try:
+            return future.result(timeout=WRITE_TIMEOUT_SECONDS)
+        except FutureTimeout:
+            # Skipped by the writer if still queued, so a retry can't apply it twice
+            # (execute_async gets the same through wrap_future cancellation)
+            future.cancel()
+            raise self._busy()
+
+    async def execute_async(self, fn: Mutation):
+        """Awaitable ``execute`` for async routes."""
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(self.submit(fn)), WRITE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            raise self._busy()
+
+    @staticmethod
+    def _busy() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database busy. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+    def _next_batch(self) -> Optional[list[tuple[Mutation, Future]]]:
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # stop after this batch
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            pending = [(fn, future) for fn, future in batch if future.set_running_or_notify_cancel()]
+            if pending:
+                self._commit(pending)
+
+    def _commit(self, pending: list[tuple[Mutation, Future]]):
+        while pending:
+            db = self.session_factory()
+            failed = None
+            results = []
+            try:
+                for index, (fn, _) in enumerate(pending):
+                    try:
+                        results.append(fn(db))
+                    except Exception as exc:
+                        failed = index, exc
+                        break
+                if failed is None:
+                    db.commit()
+            except Exception as exc:  # the commit itself failed: nothing was written
+                logger.exception("Group commit of %d mutations failed", len(pending))
+                for _, future in pending:
+                    future.set_exception(exc)
+                return
+            finally:
+                db.close()  # rolls back whatever a failed batch left behind
+
+            if failed is None:
+                self.batches += 1
+                self.mutations += len(pending)
+                for (_, future), result in zip(pending, results):
+                    future.set_result(result)
+                return
+            index, exc = failed
+            pending[index][1].set_exception(exc)
+            pending = pending[:index] + pending[index + 1:]
+
+    def shutdown(self, timeout: float = 5):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {"batches": self.batches, "mutations": self.mutations, "queued": self._queue.qsize()}
+
+
+task_writer = GroupCommitWriter(SessionLocal)
@@ -0,0 +1,67 @@
+"""Benchmark: sync vs async request path under many concurrent connections.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_async [seconds] [connections]
+
+Starts a real uvicorn server twice in a scratch directory, once with
+``DB_MODE=sync`` (routes run in FastAPI's threadpool, 40 threads by default)
+and once with ``DB_MODE=async`` (AsyncSession over aiosqlite). ``connections``
+concurrent clients each loop on ``GET /api/tasks/``; throughput and p50/p99
+latency are reported for both.
+"""
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+
+from .bench_login_storm import _percentile, _start_server
+
+
+async def _load(base: str, headers: dict, seconds: float, connections: int) -> list[float]:
+    latencies: list[float] = []
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=base, headers=headers, timeout=60, limits=limits) as c:
+        deadline = time.perf_counter() + seconds
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                await c.get("/api/tasks/", params={"limit": 20})
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(worker() for _ in range(connections)))
+    return latencies
+
+
+def run(mode: str, seconds: float, connections: int):
+    proc, base = _start_server({"DB_MODE": mode, "HASH_POOL_WORKERS": "0", "BCRYPT_ROUNDS": "4"})
+    try:
+        creds = {"username": "bench@example.com", "password": "bench-password"}
+        httpx.post(f"{base}/api/auth/register", json={"email": creds["username"], "password": creds["password"]})
+        token = httpx.post(f"{base}/api/auth/login", data=creds).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        httpx.post(f"{base}/api/tasks/bulk", headers=headers, json={"tasks": [
+            {"title": f"t{i}", "urgency": i % 10 + 1, "importance": (i * 7) % 10 + 1} for i in range(500)
+        ]})
+
+        latencies = asyncio.run(_load(base, headers, seconds, connections))
+        print(f"{mode:>5}: {len(latencies) / seconds:8.0f} req/s  "
+              f"p50 {statistics.median(latencies):7.1f} ms  p99 {_percentile(latencies, 99):7.1f} ms  "
+              f"({connections} connections)")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main(seconds: float = 10, connections: int = 200):
+    for mode in ("sync", "async"):
+        run(mode, seconds, connections)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 10, int(args[1]) if len(args) > 1 else 200)
@@ -0,0 +1,63 @@
+"""Benchmark: per-request authentication overhead with and without caches.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_auth [iterations]
+
+Times ``verify_token`` alone (JWT decode + HMAC check vs token-cache hit) and
+the full ``get_current_user`` dependency (token check + user lookup) against
+an in-memory database, with both caches disabled and enabled.
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.task import Task  # noqa: F401 - register the Task mapper
+from app.models.user import User
+from app.security import create_access_token, get_current_user, token_cache, user_cache, verify_token
+
+
+def _per_call(fn, n):
+    fn()  # warm up / populate caches
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def _set_caches(enabled: bool):
+    for cache, size in ((token_cache, 10000), (user_cache, 10000)):
+        cache.clear()
+        cache.max_size = size if enabled else 0
+
+
+def main(n: int = 20_000):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(User(email="bench@example.com", hashed_password="x"))
+    db.commit()
+    token = create_access_token({"sub": "bench@example.com"})
+
+    results = {}
+    for enabled in (False, True):
+        _set_caches(enabled)
+        results[enabled] = (
+            _per_call(lambda: verify_token(token), n),
+            _per_call(lambda: get_current_user(token=token, db=db), n),
+        )
+
+    print(f"iterations: {n}")
+    print(f"{'':22} {'no cache':>10} {'cached':>10}")
+    print(f"{'verify_token':22} {results[False][0]:>8.1f}us {results[True][0]:>8.1f}us")
+    print(f"{'get_current_user':22} {results[False][1]:>8.1f}us {results[True][1]:>8.1f}us")
+    print(f"token cache: {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,78 @@
+"""Benchmark: cold start to the first healthy ``GET /api/health``.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_cold_start [runs] [workers]
+
+Launches ``python -m app.start`` ``runs`` times per mode and reports the
+median and worst time from spawning the launcher to the first 200 from
+``/api/health``:
+
+* development, first boot: sanitizes every source file, starts the reloader
+* development, cached: the sanitize cache from the previous boot is reused
+* production with 1 and with ``workers`` workers (default: CPUs available)
+
+Each run uses a fresh scratch database, so startup includes schema creation
+and migrations.
+"""
+from __future__ import annotations
+
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from app.start import _cpu_count
+from benchmarks.bench_login_storm import BACKEND, _free_port
+
+
+def cold_start(args: list[str], env_overrides: dict) -> float:
+    """Seconds from spawning ``app.start`` to the first healthy response."""
+    port = _free_port()
+    scratch = tempfile.mkdtemp()
+    env = dict(os.environ, PYTHONPATH=BACKEND, PORT=str(port), HOST="127.0.0.1", RESCORE_INTERVAL_SECONDS="0",
+               DATABASE_URL=f"sqlite:///{scratch}/cold.db", **env_overrides)
+    start = time.perf_counter()
+    # Own session so the reloader / worker children are stopped with it
+    proc = subprocess.Popen([sys.executable, "-m", "app.start", *args], cwd=BACKEND, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    try:
+        while time.perf_counter() - start < 60:
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/api/health").status_code == 200:
+                    return time.perf_counter() - start
+            except httpx.TransportError:
+                time.sleep(0.01)
+        raise RuntimeError("server did not start")
+    finally:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait()
+
+
+def report(label: str, samples: list[float]):
+    print(f"{label:<28} median {statistics.median(samples) * 1000:6.0f} ms  "
+          f"worst {max(samples) * 1000:6.0f} ms")
+
+
+def main(runs: int = 5, workers: int = _cpu_count()):
+    cache_dir = tempfile.mkdtemp()
+    first, cached = [], []
+    for n in range(runs):
+        cache = os.path.join(cache_dir, f"sanitize-{n}.json")
+        first.append(cold_start([], {"SANITIZE_CACHE": cache}))
+        cached.append(cold_start([], {"SANITIZE_CACHE": cache}))
+    report("development, first boot", first)
+    report("development, cached", cached)
+    report("production, 1 worker", [cold_start(["--production"], {"WEB_WORKERS": "1"}) for _ in range(runs)])
+    if workers > 1:
+        report(f"production, {workers} workers",
+               [cold_start(["--production"], {"WEB_WORKERS": str(workers)}) for _ in range(runs)])
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,69 @@
+"""Benchmark: change-feed hub with many idle subscribers.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_feed [subscribers] [events]
+
+Registers ``subscribers`` subscribers (one per user) on an event loop, then
+publishes ``events`` events from a separate thread, as the group-commit writer
+does, and reports publish throughput, end-to-end delivery time and the memory
+held per idle subscriber.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import tracemalloc
+
+from app.feed import ChangeHub
+
+
+async def scenario(subscribers: int, events: int):
+    hub = ChangeHub()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    subs = [hub.subscribe(user_id) for user_id in range(subscribers)]
+    per_subscriber = (tracemalloc.get_traced_memory()[0] - before) / subscribers
+    tracemalloc.stop()
+
+    received = 0
+    done = asyncio.Event()
+
+    async def consume(sub):
+        nonlocal received
+        while True:
+            await sub.next_event()
+            received += 1
+            if received == events:
+                done.set()
+
+    consumers = [asyncio.create_task(consume(sub)) for sub in subs]
+    event = {"type": "updated", "version": 1, "task": {"id": 1, "title": "x", "priority_score": 50.0}}
+
+    def publisher():
+        for n in range(events):
+            hub.publish(n % subscribers, event)
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=publisher)
+    thread.start()
+    await asyncio.to_thread(thread.join)
+    published = time.perf_counter() - start
+    await done.wait()
+    delivered = time.perf_counter() - start
+    for task in consumers:
+        task.cancel()
+
+    print(f"{subscribers} idle subscribers: ~{per_subscriber / 1024:.1f} KiB each; "
+          f"{events} events published in {published * 1000:.0f} ms "
+          f"({events / published:,.0f}/s), all delivered after {delivered * 1000:.0f} ms")
+
+
+def main(subscribers: int = 10_000, events: int = 50_000):
+    asyncio.run(scenario(subscribers, events))
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,77 @@
+"""Benchmark: import-time report for the application.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_imports [top] [module] [runs]
+
+Imports ``module`` (default ``app.main``) in ``runs`` fresh interpreters with
+``python -X importtime`` and prints, from the fastest run per module:
+
+* the ``top`` modules by cumulative import time (the module and everything it
+  imported first), with their own (self) time
+* self time summed per top-level package, which splits the total between
+  packages without double counting
+
+plus the wall-clock time of the whole import. Deferred dependencies (jose,
+passlib, numpy) should not appear; see ``tests/test_import_time.py`` for the
+regression check.
+"""
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+
+from benchmarks.bench_login_storm import BACKEND
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def import_times(module: str) -> tuple[dict[str, tuple[int, int]], float]:
+    """``{name: (self_us, cumulative_us)}`` and the wall-clock seconds for one fresh import."""
+    code = (f"import time; t = time.perf_counter(); import {module}; "
+            "print(time.perf_counter() - t)")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=BACKEND,
+                          env=dict(os.environ, PYTHONPATH=BACKEND), capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            own, cumulative, name = match.groups()
+            times[name] = (int(own), int(cumulative))
+    return times, float(proc.stdout.strip().splitlines()[-1])
+
+
+def by_package(times: dict[str, tuple[int, int]]) -> dict[str, int]:
+    """Self microseconds summed per top-level package."""
+    totals: dict[str, int] = {}
+    for name, (own, _) in times.items():
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + own
+    return totals
+
+
+def main(top: int = 25, module: str = "app.main", runs: int = 5):
+    best: dict[str, tuple[int, int]] = {}
+    walls = []
+    for _ in range(runs):
+        times, wall = import_times(module)
+        walls.append(wall)
+        for name, entry in times.items():
+            if name not in best or entry[1] < best[name][1]:
+                best[name] = entry
+
+    print(f"import {module}: best {min(walls) * 1000:.0f} ms of {runs} runs\n")
+    print(f"{'cumulative ms':>13} {'self ms':>8}  module")
+    for name, (own, cumulative) in sorted(best.items(), key=lambda kv: kv[1][1], reverse=True)[:top]:
+        print(f"{cumulative / 1000:13.1f} {own / 1000:8.1f}  {name}")
+
+    print(f"\n{'self ms':>13}  package")
+    for package, own in sorted(by_package(best).items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"{own / 1000:13.1f}  {package}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 25, args[1] if len(args) > 1 else "app.main",
+         int(args[2]) if len(args) > 2 else 5)
@@ -0,0 +1,111 @@
+"""Benchmark: GET /tasks/ latency during a concurrent login storm.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_login_storm [seconds] [login_threads]
+
+Starts a real uvicorn server twice in a scratch directory: once hashing
+inline (``HASH_POOL_WORKERS=0``, bcrypt runs in FastAPI's threadpool) and once
+with the dedicated process pool. While ``login_threads`` clients hammer
+``/api/auth/login``, a reader measures ``GET /api/tasks/`` latency and the
+p50/p99 are reported together with login throughput and 503 rejections.
+"""
+from __future__ import annotations
+
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(env_overrides: dict) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = dict(os.environ, PYTHONPATH=BACKEND, RATE_LIMIT_RULES="", RESCORE_INTERVAL_SECONDS="0",
+               **env_overrides)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=tempfile.mkdtemp(), env=env,
+    )
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            if httpx.get(f"{base}/api/health").status_code == 200:
+                return proc, base
+        except httpx.TransportError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(label: str, env_overrides: dict, seconds: float, login_threads: int):
+    proc, base = _start_server(env_overrides)
+    try:
+        creds = {"username": "storm@example.com", "password": "storm-password"}
+        httpx.post(f"{base}/api/auth/register", json={"email": creds["username"], "password": creds["password"]})
+        token = httpx.post(f"{base}/api/auth/login", data=creds).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        for i in range(50):
+            httpx.post(f"{base}/api/tasks/", json={"title": f"t{i}", "urgency": i % 10 + 1, "importance": 5},
+                       headers=headers)
+
+        stop = threading.Event()
+        logins = {"ok": 0, "busy": 0}
+        lock = threading.Lock()
+
+        def storm():
+            with httpx.Client(base_url=base, timeout=60) as c:
+                while not stop.is_set():
+                    code = c.post("/api/auth/login", data=creds).status_code
+                    with lock:
+                        logins["ok" if code == 200 else "busy"] += 1
+
+        threads = [threading.Thread(target=storm) for _ in range(login_threads)]
+        for t in threads:
+            t.start()
+        time.sleep(0.5)  # let the storm build up
+
+        latencies = []
+        deadline = time.perf_counter() + seconds
+        with httpx.Client(base_url=base, headers=headers, timeout=60) as c:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                c.get("/api/tasks/")
+                latencies.append((time.perf_counter() - start) * 1000)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        print(f"{label:>14}: GET /tasks/ p50 {statistics.median(latencies):7.1f} ms  "
+              f"p99 {_percentile(latencies, 99):7.1f} ms  ({len(latencies)} reads)  "
+              f"logins ok {logins['ok']}, 503 {logins['busy']}")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main(seconds: float = 10, login_threads: int = 64):
+    run("inline bcrypt", {"HASH_POOL_WORKERS": "0"}, seconds, login_threads)
+    run("process pool", {}, seconds, login_threads)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 10, int(args[1]) if len(args) > 1 else 64)
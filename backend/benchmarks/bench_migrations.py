@@ -0,0 +1,108 @@
+"""Benchmark: per-request schema check vs startup migrations.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_migrations [requests]
+
+Before the migration runner, every task request called ``_ensure_new_columns``,
+which ran a ``PRAGMA table_info`` via SQLAlchemy ``inspect`` and a ``commit()``.
+This times ``GET /api/tasks/`` through the ASGI app with and without that
+check on a file database, so the difference is the latency saved per request.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session, sessionmaker
+
+
+def _legacy_ensure_new_columns(db: Session):
+    """The per-request check removed from routers/tasks.py."""
+    inspector = inspect(db.bind)
+    cols = {c['name'] for c in inspector.get_columns('tasks')}
+    new_cols = {
+        'impact': 'INTEGER',
+        'value_alignment': 'INTEGER',
+        'effort': 'INTEGER',
+        'due_date': 'TIMESTAMP',
+    }
+    for name, ddl in new_cols.items():
+        if name not in cols:
+            db.execute(text(f'ALTER TABLE tasks ADD COLUMN {name} {ddl}'))
+    if 'priority_score' not in cols:
+        db.execute(text('ALTER TABLE tasks ADD COLUMN priority_score FLOAT'))
+    db.commit()
+
+
+def _time_requests(client, headers, n):
+    from app.security import rate_limiter
+
+    client.get("/api/tasks/", headers=headers)  # warm up
+    start = time.perf_counter()
+    for _ in range(n):
+        rate_limiter.reset()  # stay under the per-IP limit
+        assert client.get("/api/tasks/", headers=headers).status_code == 200
+    return (time.perf_counter() - start) / n
+
+
+def main(n: int = 500):
+    from app.database import Base, get_db, get_read_db
+    from app.main import app
+    from app.migrations import run_migrations
+    from app.security import create_access_token
+    from app.models.user import User
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    run_migrations(engine, metadata=Base.metadata)
+    SessionLocal = sessionmaker(bind=engine)
+
+    db = SessionLocal()
+    db.add(User(email="bench@example.com", hashed_password="x"))
+    db.commit()
+    db.close()
+
+    def plain_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def legacy_db():
+        db = SessionLocal()
+        try:
+            _legacy_ensure_new_columns(db)
+            yield db
+        finally:
+            db.close()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench@example.com'})}"}
+    client = TestClient(app)
+
+    # Reads (including the current-user lookup) go through get_read_db
+    app.dependency_overrides[get_db] = app.dependency_overrides[get_read_db] = legacy_db
+    legacy = _time_requests(client, headers, n)
+    app.dependency_overrides[get_db] = app.dependency_overrides[get_read_db] = plain_db
+    migrated = _time_requests(client, headers, n)
+    app.dependency_overrides.clear()
+
+    start = time.perf_counter()
+    for _ in range(n):
+        db = SessionLocal()
+        _legacy_ensure_new_columns(db)
+        db.close()
+    check_only = (time.perf_counter() - start) / n
+
+    print(f"requests: {n}")
+    print(f"with per-request check : {legacy * 1e3:7.3f} ms/request")
+    print(f"startup migrations     : {migrated * 1e3:7.3f} ms/request")
+    print(f"saved per request      : {(legacy - migrated) * 1e3:7.3f} ms ({check_only * 1e3:.3f} ms check alone)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
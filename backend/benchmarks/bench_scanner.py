@@ -0,0 +1,79 @@
+"""Benchmark: content-scanner throughput on 1 KB task descriptions.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_scanner [payloads] [repeats]
+
+Validates ``payloads`` (title, 1 KB description) pairs three ways: the
+previous per-rule ``re.search`` loop over each field, ``ContentScanner.scan``
+per payload, and one ``ContentScanner.scan_many`` batch. Each runs on plain
+prose, prose with trigger characters (``:``, ``=``, ``<``) that forces the
+regex pass, and a mix where one payload in ten is malicious.
+"""
+from __future__ import annotations
+
+import random
+import re
+import sys
+import time
+
+from app.scanner import DANGEROUS_RULES, content_scanner
+
+WORDS = ("the project onboarding review of quarterly budget and contract renewal on monday "
+         "with notes action items for the team follow up once approved").split()
+
+
+def _per_rule(title, description):
+    for rule in DANGEROUS_RULES:
+        if re.search(rule.pattern, title, re.IGNORECASE) or (
+                description and re.search(rule.pattern, description, re.IGNORECASE)):
+            return True
+    return False
+
+
+def _text(rng: random.Random, size: int, extras=()) -> str:
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS) if not extras or rng.random() > 0.05 else rng.choice(extras)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def _corpus(kind: str, payloads: int) -> list[tuple[str, str]]:
+    rng = random.Random(7)
+    extras = ("note:", "a=b", "x<y", "https://example.com/?q=1") if kind != "plain" else ()
+    corpus = [(_text(rng, 60, extras), _text(rng, 1024, extras)) for _ in range(payloads)]
+    if kind == "malicious":
+        for i in range(0, payloads, 10):
+            title, description = corpus[i]
+            corpus[i] = (title, description[:900] + "<img src=x onerror=alert(1)>")
+    return corpus
+
+
+def _rate(fn, corpus, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(corpus)
+        best = min(best, time.perf_counter() - start)
+    return len(corpus) / best
+
+
+def main(payloads: int = 5000, repeats: int = 3):
+    variants = {
+        "per-rule re.search": lambda corpus: [_per_rule(t, d) for t, d in corpus],
+        "scan": lambda corpus: [content_scanner.scan(t, d) for t, d in corpus],
+        "scan_many": content_scanner.scan_many,
+    }
+    for kind in ("plain", "triggers", "malicious"):
+        corpus = _corpus(kind, payloads)
+        rates = {name: _rate(fn, corpus, repeats) for name, fn in variants.items()}
+        baseline = rates["per-rule re.search"]
+        summary = "  ".join(f"{name} {rate:9,.0f}/s ({rate / baseline:5.1f}x)" for name, rate in rates.items())
+        print(f"{kind:>9}: {summary}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,96 @@
+"""Benchmark: batch rescoring vs the per-row ORM loop.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_scoring [rows]
+
+Builds an in-memory SQLite database with ``rows`` tasks (default 50,000),
+then times
+
+* per-row: load every Task through the ORM, call ``calculate_priority_score``
+  and commit (what rescoring looks like without the batch engine);
+* batch:   ``app.scoring.rescore_tasks`` (chunked column reads + bulk UPDATE);
+* scoring only: ``score_columns`` over in-memory columns, without any I/O.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+from app.scoring import rescore_tasks, score_columns, score_row
+from app.settings import set_priority_overrides, clear_priority_overrides
+
+
+def _populate(db, n: int):
+    rnd = random.Random(42)
+    now = datetime.now(timezone.utc)
+    user = User(email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    db.bulk_insert_mappings(Task, [
+        {
+            "title": f"task {i}",
+            "urgency": rnd.randint(1, 10),
+            "importance": rnd.randint(1, 10),
+            "impact": rnd.randint(1, 10),
+            "value_alignment": rnd.randint(1, 10),
+            "effort": rnd.randint(1, 10),
+            "due_date": now + timedelta(hours=rnd.randint(-48, 24 * 20)),
+            "priority_score": 0.0,
+            "owner_id": user.id,
+        }
+        for i in range(n)
+    ])
+    db.commit()
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def per_row(db):
+    for task in db.query(Task).all():
+        task.priority_score = task.calculate_priority_score()
+    db.commit()
+
+
+def main(n: int = 50_000):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    _populate(db, n)
+
+    set_priority_overrides(weight_urgency=0.5)
+    loop_s, _ = _timed(lambda: per_row(db))
+    db.expunge_all()
+
+    set_priority_overrides(weight_urgency=0.6)
+    batch_s, updated = _timed(lambda: rescore_tasks(db))
+    clear_priority_overrides()
+
+    rnd = random.Random(1)
+    now = datetime.now(timezone.utc)
+    cols = [[rnd.randint(1, 10) for _ in range(n)] for _ in range(5)]
+    cols.append([now + timedelta(hours=rnd.randint(-48, 480)) for _ in range(n)])
+    cols_s, _ = _timed(lambda: score_columns(*cols, now=now))
+    rows_s, _ = _timed(lambda: [score_row(*row, now=now) for row in zip(*cols)])
+
+    print(f"rows: {n}")
+    print(f"per-row ORM rescore : {loop_s:8.3f}s  ({n / loop_s:,.0f} rows/s)")
+    print(f"batch rescore       : {batch_s:8.3f}s  ({n / batch_s:,.0f} rows/s, {updated} updated)")
+    print(f"score_row loop      : {rows_s:8.3f}s")
+    print(f"score_columns       : {cols_s:8.3f}s")
+    print(f"speedup (rescore)   : {loop_s / batch_s:6.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
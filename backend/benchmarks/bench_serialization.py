@@ -0,0 +1,105 @@
+"""Benchmark: ORM + Pydantic list responses vs the column/bytes fast path.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_serialization [rows ...]
+
+For each size (default 1k, 10k, 100k tasks) this builds an in-memory SQLite
+database and times producing the JSON body of a task list response:
+
+* ORM path:  load Task objects, validate each through ``TaskResponse`` and
+  encode the way FastAPI's ``response_model`` handling does;
+* fast path: select the ``TaskResponse`` columns as tuples and encode them
+  with ``app.serialization.dumps``.
+"""
+from __future__ import annotations
+
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+from app.pagination import ranking_order
+from app.schemas.task import TaskList
+from app.serialization import dumps, rows_to_dicts, task_columns
+
+
+def _populate(db, n: int):
+    rnd = random.Random(42)
+    now = datetime.now(timezone.utc)
+    user = User(email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    db.bulk_insert_mappings(Task, [
+        {
+            "title": f"task {i}",
+            "description": "benchmark task description",
+            "urgency": rnd.randint(1, 10),
+            "importance": rnd.randint(1, 10),
+            "impact": rnd.randint(1, 10),
+            "value_alignment": rnd.randint(1, 10),
+            "effort": rnd.randint(1, 10),
+            "due_date": now + timedelta(hours=rnd.randint(-48, 480)),
+            "priority_score": round(rnd.uniform(0, 100), 2),
+            "owner_id": user.id,
+            "created_at": now,
+        }
+        for i in range(n)
+    ])
+    db.commit()
+    return user.id
+
+
+def orm_path(db, owner_id):
+    tasks = db.query(Task).filter(Task.owner_id == owner_id).order_by(*ranking_order(Task)).all()
+    body = TaskList(tasks=tasks, total=len(tasks))
+    return json.dumps(jsonable_encoder(body)).encode()
+
+
+def fast_path(db, owner_id):
+    rows = (
+        db.query(*task_columns(Task))
+        .filter(Task.owner_id == owner_id)
+        .order_by(*ranking_order(Task))
+        .all()
+    )
+    return dumps({"tasks": rows_to_dicts(rows), "total": len(rows), "next_cursor": None})
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes=(1_000, 10_000, 100_000)):
+    print(f"{'rows':>8} {'orm+pydantic':>14} {'fast path':>12} {'rows/s (fast)':>15} {'speedup':>8}")
+    for n in sizes:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        owner_id = _populate(db, n)
+        repeat = 3 if n >= 100_000 else 5
+
+        def run_orm():
+            db.expunge_all()
+            orm_path(db, owner_id)
+
+        orm_s = _best_of(run_orm, repeat)
+        fast_s = _best_of(lambda: fast_path(db, owner_id), repeat)
+        print(f"{n:>8} {orm_s:>13.3f}s {fast_s:>11.3f}s {n / fast_s:>15,.0f} {orm_s / fast_s:>7.1f}x")
+        db.close()
+
+
+if __name__ == "__main__":
+    main(tuple(int(a) for a in sys.argv[1:]) or (1_000, 10_000, 100_000))
@@ -0,0 +1,106 @@
+"""Benchmark: default vs tuned SQLite profile under concurrent reads and writes.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_storage [seconds] [readers] [writers]
+
+For each profile a scratch database is seeded with 5,000 tasks, then
+``writers`` threads insert tasks one commit at a time while ``readers``
+threads page through the ranking. Reported: write commits/s, reads/s, reader
+p50/p99 latency and "database is locked" errors.
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+from app.pagination import ranking_order
+from app.storage import StorageSettings, apply_pragmas
+
+from .bench_login_storm import _percentile
+
+
+def _engine(profile: str, path: str):
+    os.environ.update(DATABASE_URL=f"sqlite:///{path}", DB_PROFILE=profile)
+    settings = StorageSettings.from_env()
+    engine = create_engine(settings.url, **settings.engine_kwargs())
+    apply_pragmas(engine, settings)
+    return engine
+
+
+def _task(i: int) -> dict:
+    return {"title": f"t{i}", "urgency": i % 10 + 1, "importance": (i * 7) % 10 + 1,
+            "priority_score": (i * 37 % 1000) / 1000, "quadrant": 1 + i % 4, "owner_id": 1}
+
+
+def run(profile: str, seconds: float, readers: int, writers: int):
+    engine = _engine(profile, os.path.join(tempfile.mkdtemp(), "bench.db"))
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": 1, "email": "bench@example.com", "hashed_password": "x"}])
+        conn.execute(insert(Task), [_task(i) for i in range(5000)])
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    latencies: list[float] = []
+    counts = {"writes": 0, "locked": 0}
+
+    def writer(n: int):
+        i = 0
+        while not stop.is_set():
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(Task), [_task(n * 1_000_000 + i)])
+                with lock:
+                    counts["writes"] += 1
+            except OperationalError:
+                with lock:
+                    counts["locked"] += 1
+            i += 1
+
+    def reader():
+        query = select(Task.id, Task.priority_score).where(Task.owner_id == 1).order_by(*ranking_order(Task)).limit(100)
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(query).all()
+            except OperationalError:
+                with lock:
+                    counts["locked"] += 1
+                continue
+            with lock:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    engine.dispose()
+
+    print(f"{profile:>8}: writes {counts['writes'] / seconds:7.0f}/s  reads {len(latencies) / seconds:7.0f}/s  "
+          f"read p50 {statistics.median(latencies):6.2f} ms  p99 {_percentile(latencies, 99):6.2f} ms  "
+          f"locked errors {counts['locked']}")
+
+
+def main(seconds: float = 5, readers: int = 8, writers: int = 2):
+    for profile in ("default", "tuned"):
+        run(profile, seconds, readers, writers)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 5, *(int(a) for a in args[1:3]))
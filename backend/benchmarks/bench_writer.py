@@ -0,0 +1,94 @@
+"""Benchmark: per-request commits vs the group-commit writer.
+
+Usage (from ``backend/``):
+    python -m benchmarks.bench_writer [seconds] [threads]
+
+``threads`` concurrent callers insert tasks into a scratch database (tuned
+storage profile), first each committing its own session, then through
+``GroupCommitWriter``. Reported: inserts/s, commits/s and "database is
+locked" failures.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+from app.writer import GroupCommitWriter
+
+from .bench_storage import _engine
+
+
+def _mutation(i: int):
+    def insert_task(db):
+        task = Task(title=f"t{i}", urgency=i % 10 + 1, importance=5, owner_id=1)
+        task.priority_score = task.calculate_priority_score()
+        task.quadrant = task.classify_quadrant()
+        db.add(task)
+        db.flush()
+        return task.id
+    return insert_task
+
+
+def run(label: str, seconds: float, threads: int, grouped: bool):
+    engine = _engine("tuned", os.path.join(tempfile.mkdtemp(), "bench.db"))
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": 1, "email": "bench@example.com", "hashed_password": "x"}])
+    factory = sessionmaker(bind=engine)
+    writer = GroupCommitWriter(factory)
+    counts = {"ok": 0, "locked": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def direct(mutation):
+        with factory() as db:
+            result = mutation(db)
+            db.commit()
+            return result
+
+    def caller(n: int):
+        i = 0
+        while not stop.is_set():
+            mutation = _mutation(n * 1_000_000 + i)
+            try:
+                writer.execute(mutation) if grouped else direct(mutation)
+                key = "ok"
+            except OperationalError:
+                key = "locked"
+            with lock:
+                counts[key] += 1
+            i += 1
+
+    workers = [threading.Thread(target=caller, args=(n,)) for n in range(threads)]
+    for t in workers:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in workers:
+        t.join()
+    writer.shutdown()
+    engine.dispose()
+
+    commits = writer.batches if grouped else counts["ok"]
+    print(f"{label:>14}: {counts['ok'] / seconds:7.0f} inserts/s  {commits / seconds:7.0f} commits/s  "
+          f"locked errors {counts['locked']}")
+
+
+def main(seconds: float = 5, threads: int = 32):
+    run("per-request", seconds, threads, grouped=False)
+    run("group commit", seconds, threads, grouped=True)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 5, int(args[1]) if len(args) > 1 else 32)
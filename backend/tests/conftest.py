@@ -1,6 +1,30 @@
 """Pytest configuration and path setup."""
+import itertools
 import sys, os
 
+import pytest
+
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+
+_user_ids = itertools.count(1)
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a fresh user in the app database and return bearer headers for it."""
+    from app.database import SessionLocal
+    from app.models.user import User
+    from app.security import create_access_token, rate_limiter
+
+    rate_limiter.reset()
+    email = f"user{next(_user_ids)}-{os.getpid()}@example.com"
+    db = SessionLocal()
+    try:
+        db.add(User(email=email, hashed_password="unused"))
+        db.commit()
+    finally:
+        db.close()
+    return {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
@@ -35,7 +35,7 @@ def create_sample_task(urgency=5, importance=5, impact=5, value_alignment=5, eff
 def test_create_and_list_tasks():
     t1 = create_sample_task(urgency=9, importance=9)
     t2 = create_sample_task(urgency=3, importance=4)
-    r = client.get("/api/tasks/")
+    r = client.get("/api/tasks/", params={"include_total": "true"})
     assert r.status_code == 200
     data = r.json()
     assert data["total"] >= 2
@@ -63,15 +63,19 @@ def test_update_recalculates_score():
     assert updated["priority_score"] >= original
 
 
-def test_runtime_config_override_endpoint():
+def test_runtime_config_override_endpoint(auth_headers):
     r = client.get("/api/config/priority")
     assert r.status_code == 200
     base_weight = r.json()["weight_urgency"]
 
-    r2 = client.put("/api/config/priority", json={"weight_urgency": base_weight + 0.05})
+    # Changing the global config requires a logged-in user
+    assert client.put("/api/config/priority", json={"weight_urgency": 0.5}).status_code == 401
+    assert client.delete("/api/config/priority/overrides").status_code == 401
+
+    r2 = client.put("/api/config/priority", json={"weight_urgency": base_weight + 0.05}, headers=auth_headers)
     assert r2.status_code == 200
     assert abs(r2.json()["weight_urgency"] - (base_weight + 0.05)) < 1e-6
 
-    r3 = client.delete("/api/config/priority/overrides")
+    r3 = client.delete("/api/config/priority/overrides", headers=auth_headers)
     assert r3.status_code == 200
     assert r3.json()["weight_urgency"] == base_weight
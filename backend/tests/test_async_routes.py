@@ -0,0 +1,53 @@
+"""The DB_MODE=async routers serve the same API as the sync ones."""
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine, get_async_engine
+from app.hashing import password_hasher
+from app.routers import auth_async, tasks_async
+
+async_app = FastAPI()
+async_app.include_router(auth_async.router, prefix="/api")
+async_app.include_router(tasks_async.router, prefix="/api")
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def teardown_module(_):
+    asyncio.run(get_async_engine().dispose())
+
+
+def test_async_auth_and_task_crud(monkeypatch):
+    monkeypatch.setattr(password_hasher, "workers", 0)
+    monkeypatch.setattr(password_hasher, "rounds", 4)
+    creds = {"email": "async@example.com", "password": "async-pass"}
+    with TestClient(async_app) as client:
+        assert client.post("/api/auth/register", json=creds).status_code == 200
+        assert client.post("/api/auth/register", json=creds).status_code == 400
+        assert client.post("/api/auth/login", data={"username": creds["email"], "password": "nope"}).status_code == 401
+        login = client.post("/api/auth/login", data={"username": creds["email"], "password": creds["password"]})
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        assert client.get("/api/auth/me", headers=headers).json()["email"] == creds["email"]
+
+        created = client.post("/api/tasks/", json={"title": "Async", "urgency": 9, "importance": 9}, headers=headers)
+        assert created.status_code == 200
+        task_id = created.json()["id"]
+
+        updated = client.put(f"/api/tasks/{task_id}", json={"importance": 2}, headers=headers)
+        assert updated.json()["importance"] == 2
+
+        page = client.get("/api/tasks/?include_total=true", headers=headers).json()
+        assert page["total"] == 1 and page["tasks"][0]["id"] == task_id
+        matrix = client.get("/api/tasks/matrix/data", headers=headers).json()
+        assert matrix["counts"]["quadrant_3"] == 1
+
+        bulk = client.post("/api/tasks/bulk", json={"tasks": [{"title": t, "urgency": 2, "importance": 2} for t in ("b1", "b2")]}, headers=headers)
+        assert bulk.json()["succeeded"] == 2
+
+        assert client.delete(f"/api/tasks/{task_id}", headers=headers).status_code == 200
+        assert client.get(f"/api/tasks/{task_id}", headers=headers).status_code == 404
@@ -0,0 +1,116 @@
+import hashlib
+import time
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.cache import TTLCache
+from app.database import Base, SessionLocal, engine, read_engine
+from app.models.user import User
+import app.security as security
+from app.security import create_access_token, token_cache, user_cache
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _make_user(email):
+    db = SessionLocal()
+    db.add(User(email=email, hashed_password="unused"))
+    db.commit()
+    db.close()
+    return {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+
+def test_ttl_cache_expiry_and_lru():
+    now = [0.0]
+    cache = TTLCache(max_size=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts least recently used "b"
+    assert cache.get("b") is None
+    now[0] = 11
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_repeated_requests_skip_user_query():
+    headers = _make_user("cached@example.com")
+    user_queries = []
+
+    def count_user_queries(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            user_queries.append(statement)
+
+    event.listen(read_engine, "before_cursor_execute", count_user_queries)
+    try:
+        for _ in range(5):
+            assert client.get("/api/auth/me", headers=headers).status_code == 200
+    finally:
+        event.remove(read_engine, "before_cursor_execute", count_user_queries)
+    assert len(user_queries) == 1
+    assert client.get("/api/metrics").json()["user_cache"]["hits"] >= 4
+
+
+def test_deactivation_invalidates_cache():
+    headers = _make_user("deactivate@example.com")
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == "deactivate@example.com").first()
+    user.is_active = False
+    db.commit()
+    db.close()
+
+    assert user_cache.get("deactivate@example.com") is None
+    r = client.get("/api/auth/me", headers=headers)
+    assert r.status_code == 400
+
+
+def test_invalidation_waits_for_commit():
+    headers = _make_user("flushed@example.com")
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == "flushed@example.com").first()
+    user.is_active = False
+    db.flush()
+    # A concurrent request still reads the committed, active row and caches it
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+    db.commit()
+    db.close()
+
+    assert user_cache.get("flushed@example.com") is None
+    assert client.get("/api/auth/me", headers=headers).status_code == 400
+
+
+def test_verified_tokens_are_cached_until_exp(monkeypatch):
+    token = create_access_token({"sub": "token@example.com"}, expires_delta=timedelta(minutes=5))
+    decodes = []
+    # verify_token imports jose lazily, so patch it where it's looked up
+    from jose import jwt
+    real_decode = jwt.decode
+    monkeypatch.setattr(jwt, "decode", lambda *a, **kw: decodes.append(1) or real_decode(*a, **kw))
+
+    assert security.verify_token(token) == "token@example.com"
+    assert security.verify_token(token) == "token@example.com"
+    assert len(decodes) == 1
+
+    # Once the wall clock passes exp the entry is gone and jwt.decode rejects the token
+    later = time.time() + 6 * 60
+    monkeypatch.setattr(token_cache, "clock", lambda: later)
+    assert token_cache.get(hashlib.sha256(token.encode()).digest()) is None
+
+
+def test_invalid_token_not_cached():
+    r = client.get("/api/auth/me", headers={"Authorization": "Bearer not.a.jwt"})
+    assert r.status_code == 401
+    r = client.get("/api/auth/me", headers={"Authorization": "Bearer not.a.jwt"})
+    assert r.status_code == 401
@@ -0,0 +1,115 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import Base, SessionLocal, engine
+from app.models.user import User
+from app.security import create_access_token
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _task(title, urgency=5, importance=5, **extra):
+    return {"title": title, "urgency": urgency, "importance": importance, **extra}
+
+
+def test_bulk_create_reports_per_item(auth_headers):
+    payload = {"tasks": [
+        _task("first", 9, 9),
+        _task("<script>alert(1)</script>"),
+        _task("third", 2, 8),
+    ]}
+    r = client.post("/api/tasks/bulk", json=payload, headers=auth_headers)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert (data["succeeded"], data["failed"]) == (2, 1)
+    first, bad, third = data["results"]
+    assert bad["status"] == "error" and bad["id"] is None
+
+    for item, title in ((first, "first"), (third, "third")):
+        task = client.get(f"/api/tasks/{item['id']}", headers=auth_headers).json()
+        assert task["title"] == title
+        assert task["priority_score"] == item["priority_score"]
+
+
+def test_bulk_update_and_delete(auth_headers):
+    created = client.post("/api/tasks/bulk", json={"tasks": [_task("a", 3, 3), _task("b", 4, 4)]},
+                          headers=auth_headers).json()["results"]
+    a_id, b_id = created[0]["id"], created[1]["id"]
+
+    r = client.put("/api/tasks/bulk", headers=auth_headers, json={"tasks": [
+        {"id": a_id, "urgency": 10, "importance": 10},
+        {"id": 999999, "urgency": 1},
+        {"id": b_id, "title": "renamed"},
+    ]})
+    data = r.json()
+    assert [x["status"] for x in data["results"]] == ["updated", "error", "updated"]
+    a = client.get(f"/api/tasks/{a_id}", headers=auth_headers).json()
+    assert a["priority_score"] == data["results"][0]["priority_score"] > created[0]["priority_score"]
+    matrix = client.get("/api/tasks/matrix/data", headers=auth_headers).json()
+    assert a_id in [t["id"] for t in matrix["quadrant_1"]]
+    assert client.get(f"/api/tasks/{b_id}", headers=auth_headers).json()["title"] == "renamed"
+
+    r = client.request("DELETE", "/api/tasks/bulk", json={"ids": [a_id, 999999]}, headers=auth_headers)
+    assert [x["status"] for x in r.json()["results"]] == ["deleted", "error"]
+    assert client.get(f"/api/tasks/{a_id}", headers=auth_headers).status_code == 404
+
+
+def test_null_priorities_are_rejected_per_item(auth_headers):
+    created = client.post("/api/tasks/bulk", json={"tasks": [_task("a", 3, 3), _task("b", 4, 4)]},
+                          headers=auth_headers).json()["results"]
+    a_id, b_id = created[0]["id"], created[1]["id"]
+
+    r = client.put("/api/tasks/bulk", headers=auth_headers, json={"tasks": [
+        {"id": a_id, "urgency": None},
+        {"id": b_id, "importance": 9},
+    ]})
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert [x["status"] for x in results] == ["error", "updated"]
+    assert "urgency" in results[0]["error"]
+    assert client.get(f"/api/tasks/{a_id}", headers=auth_headers).json()["urgency"] == 3
+
+    r = client.put(f"/api/tasks/{a_id}", json={"importance": None}, headers=auth_headers)
+    assert r.status_code == 400
+
+
+def test_bulk_size_is_capped(auth_headers):
+    from app.schemas.task import MAX_BULK_ITEMS
+
+    payload = {"tasks": [_task(f"t{i}") for i in range(MAX_BULK_ITEMS + 1)]}
+    r = client.post("/api/tasks/bulk", json=payload, headers=auth_headers)
+    assert r.status_code == 422
+
+
+def test_other_users_tasks_are_not_touched(auth_headers):
+    created = client.post("/api/tasks/bulk", json={"tasks": [_task("mine")]}, headers=auth_headers)
+    task_id = created.json()["results"][0]["id"]
+
+    db = SessionLocal()
+    db.add(User(email="intruder@example.com", hashed_password="unused"))
+    db.commit()
+    db.close()
+    intruder = {"Authorization": f"Bearer {create_access_token({'sub': 'intruder@example.com'})}"}
+
+    r = client.request("DELETE", "/api/tasks/bulk", json={"ids": [task_id]}, headers=intruder)
+    assert r.json()["results"][0]["status"] == "error"
+    r = client.put("/api/tasks/bulk", json={"tasks": [{"id": task_id, "title": "x"}]}, headers=intruder)
+    assert r.json()["failed"] == 1
+    assert client.get(f"/api/tasks/{task_id}", headers=auth_headers).json()["title"] == "mine"
+
+
+def test_bulk_writes_go_through_the_writer(auth_headers):
+    from app.writer import task_writer
+
+    before = task_writer.stats()["mutations"]
+    created = client.post("/api/tasks/bulk", json={"tasks": [_task("w1"), _task("w2")]},
+                          headers=auth_headers).json()
+    ids = [item["id"] for item in created["results"]]
+    client.put("/api/tasks/bulk", json={"tasks": [{"id": ids[0], "urgency": 9}]}, headers=auth_headers)
+    client.request("DELETE", "/api/tasks/bulk", json={"ids": ids}, headers=auth_headers)
+    assert task_writer.stats()["mutations"] == before + 3
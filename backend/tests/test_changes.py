@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.database import Base, engine
+from app.models.task import TaskTombstone
+from app.pagination import decode_sync_cursor, encode_sync_cursor
+from app.routers import tasks as tasks_router
+from app.scheduler import TombstoneCompactor
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def no_overlap(monkeypatch):
+    # Cursors normally trail "now"; disable that so caught-up syncs are empty
+    monkeypatch.setattr(tasks_router, "CHANGES_OVERLAP", timedelta(0))
+
+
+def _create(headers, title):
+    return client.post("/api/tasks/", json={"title": title, "urgency": 5, "importance": 5},
+                       headers=headers).json()
+
+
+def _sync(headers, since=None, limit=100):
+    params = {"limit": limit}
+    if since:
+        params["since"] = since
+    response = client.get("/api/tasks/changes", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_first_sync_is_a_full_reset(auth_headers):
+    first, second = _create(auth_headers, "one"), _create(auth_headers, "two")
+    body = _sync(auth_headers)
+    assert body["reset"] is True and body["has_more"] is False and body["deleted"] == []
+    assert body["changed"] == [first, second]
+
+
+def test_incremental_sync_returns_only_changes(auth_headers):
+    kept, edited, removed = (_create(auth_headers, t) for t in ("kept", "edited", "removed"))
+    cursor = _sync(auth_headers)["next_cursor"]
+    assert _sync(auth_headers, cursor)["changed"] == []
+
+    client.put(f"/api/tasks/{edited['id']}", json={"urgency": 9}, headers=auth_headers)
+    added = _create(auth_headers, "added")
+    client.delete(f"/api/tasks/{removed['id']}", headers=auth_headers)
+    body = _sync(auth_headers, cursor)
+    assert body["reset"] is False
+    assert [t["id"] for t in body["changed"]] == [edited["id"], added["id"]]
+    assert body["changed"][0]["urgency"] == 9
+    assert body["deleted"] == [removed["id"]]
+    assert kept["id"] not in [t["id"] for t in body["changed"]]
+
+
+def test_reused_id_is_not_reported_deleted(auth_headers):
+    removed = _create(auth_headers, "removed")
+    cursor = _sync(auth_headers)["next_cursor"]
+    client.delete(f"/api/tasks/{removed['id']}", headers=auth_headers)
+    # SQLite hands the highest deleted rowid to the next insert
+    replacement = _create(auth_headers, "replacement")
+    body = _sync(auth_headers, cursor)
+    assert replacement["id"] == removed["id"]
+    assert body["deleted"] == [] and body["changed"] == [replacement]
+
+
+def test_bulk_changes_are_synced(auth_headers):
+    ids = [_create(auth_headers, f"b{n}")["id"] for n in range(3)]
+    cursor = _sync(auth_headers)["next_cursor"]
+    client.put("/api/tasks/bulk", json={"tasks": [{"id": ids[0], "importance": 1}]}, headers=auth_headers)
+    client.request("DELETE", "/api/tasks/bulk", json={"ids": ids[1:]}, headers=auth_headers)
+    body = _sync(auth_headers, cursor)
+    assert [t["id"] for t in body["changed"]] == [ids[0]]
+    assert body["deleted"] == ids[1:]
+
+
+def test_sync_pages_with_has_more(auth_headers):
+    ids = [_create(auth_headers, f"p{n}")["id"] for n in range(5)]
+    seen, cursor = [], None
+    while True:
+        body = _sync(auth_headers, cursor, limit=2)
+        seen += [t["id"] for t in body["changed"]]
+        cursor = body["next_cursor"]
+        if not body["has_more"]:
+            break
+    assert seen == ids
+
+
+def test_expired_cursor_forces_reset(auth_headers):
+    task = _create(auth_headers, "old")
+    stale = datetime.now(timezone.utc) - timedelta(days=365)
+    cursor = encode_sync_cursor((stale, 0), (stale, 0))
+    body = _sync(auth_headers, cursor)
+    assert body["reset"] is True and body["changed"] == [task]
+    assert decode_sync_cursor(body["next_cursor"])[1][0] > stale.replace(tzinfo=None)
+
+
+def test_invalid_cursor_is_rejected(auth_headers):
+    response = client.get("/api/tasks/changes", params={"since": "garbage"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_compactor_removes_expired_tombstones():
+    test_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=test_engine)
+    Session = sessionmaker(bind=test_engine)
+    now = datetime(2030, 1, 31, tzinfo=timezone.utc)
+    with Session() as db:
+        db.add_all([
+            TaskTombstone(task_id=1, owner_id=1, deleted_at=now - timedelta(days=31)),
+            TaskTombstone(task_id=2, owner_id=1, deleted_at=now - timedelta(days=1)),
+        ])
+        db.commit()
+
+    assert TombstoneCompactor(Session, retention_days=30).tick(now=now) == 1
+    with Session() as db:
+        assert db.scalars(select(TaskTombstone.task_id)).all() == [2]
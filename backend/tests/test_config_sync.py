@@ -0,0 +1,177 @@
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.config import PriorityConfig  # noqa: F401 - register table
+from app.models.task import Task
+from app.models.user import User
+from app.scheduler import PriorityConfigWatcher
+from app.scoring import score_row
+from app.settings import SharedPriorityConfig
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+# A worker process: report its starting weight, then poll until it sees the target
+WORKER = textwrap.dedent("""
+    import sys, time
+    from app.settings import get_priority_config
+
+    target = float(sys.argv[1])
+    print(get_priority_config()["weight_urgency"], flush=True)
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        if get_priority_config()["weight_urgency"] == target:
+            print("converged", flush=True)
+            sys.exit(0)
+        time.sleep(0.01)
+    sys.exit(1)
+""")
+
+
+def _shared_db(tmp_path):
+    path = tmp_path / "shared.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    return path, sessionmaker(bind=engine)
+
+
+def test_store_merges_bumps_and_clears(tmp_path):
+    _, Session = _shared_db(tmp_path)
+    writer = SharedPriorityConfig(Session, check_interval_ms=0)
+    reader = SharedPriorityConfig(Session, check_interval_ms=60_000)
+    default = reader.get()["weight_urgency"]
+
+    writer.update({"weight_urgency": 0.7, "unknown": 1})
+    cfg = writer.update({"effort_penalty": 0.4})
+    assert (cfg["weight_urgency"], cfg["effort_penalty"], writer.version) == (0.7, 0.4, 2)
+    assert "unknown" not in cfg
+
+    # Cached until the check interval elapses, then revalidated
+    assert reader.get()["weight_urgency"] == default
+    assert reader.refresh()["weight_urgency"] == 0.7 and reader.version == 2
+    assert writer.update({}, clear=True)["weight_urgency"] == default
+
+
+def test_worker_processes_converge(tmp_path):
+    path, Session = _shared_db(tmp_path)
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{path}", "PRIORITY_CONFIG_CHECK_MS": "50"}
+    workers = [
+        subprocess.Popen([sys.executable, "-c", WORKER, "0.55"], cwd=BACKEND, env=env,
+                         stdout=subprocess.PIPE, text=True)
+        for _ in range(3)
+    ]
+    try:
+        initial = SharedPriorityConfig(Session).get()["weight_urgency"]
+        for worker in workers:
+            assert float(worker.stdout.readline()) == initial
+        SharedPriorityConfig(Session).update({"weight_urgency": 0.55})
+        for worker in workers:
+            assert worker.wait(timeout=30) == 0
+            assert worker.stdout.readline().strip() == "converged"
+    finally:
+        for worker in workers:
+            worker.kill()
+            worker.stdout.close()
+
+
+def test_watcher_rescores_after_another_worker_bumps(tmp_path):
+    _, Session = _shared_db(tmp_path)
+    local = SharedPriorityConfig(Session, check_interval_ms=60_000)
+    watcher = PriorityConfigWatcher(Session, config=local)
+    with Session() as db:
+        db.add(User(id=1, email="cfg@example.com", hashed_password="x"))
+        db.add(Task(id=1, title="t", urgency=10, importance=1, owner_id=1,
+                    priority_score=score_row(10, 1, cfg=local.get())))
+        db.commit()
+    assert watcher.tick() == 0
+
+    SharedPriorityConfig(Session).update({"weight_urgency": 0.9, "weight_importance": 0.1})
+    assert watcher.tick() == 1
+    with Session() as db:
+        assert db.get(Task, 1).priority_score == score_row(10, 1, cfg=local.get())
+    assert watcher.tick() == 0
+
+
+def test_update_in_caller_transaction_applies_on_commit_only(tmp_path):
+    _, Session = _shared_db(tmp_path)
+    store = SharedPriorityConfig(Session, check_interval_ms=60_000)
+    default = store.get()["weight_urgency"]
+
+    with Session() as db:
+        assert store.update({"weight_urgency": 0.8}, db=db)["weight_urgency"] == 0.8
+        db.rollback()
+    assert store.get()["weight_urgency"] == default and store.version == 0
+
+    with Session() as db:
+        store.update({"weight_urgency": 0.8}, db=db)
+        assert store.get()["weight_urgency"] == default  # not committed yet
+        db.commit()
+    assert store.get()["weight_urgency"] == 0.8 and store.version == 1
+
+
+def test_watchers_skip_rescore_the_updating_worker_already_did(tmp_path):
+    from app.scoring import rescore_tasks
+
+    _, Session = _shared_db(tmp_path)
+    local = SharedPriorityConfig(Session, check_interval_ms=60_000)
+    other = SharedPriorityConfig(Session, check_interval_ms=60_000)
+    watchers = [PriorityConfigWatcher(Session, config=config) for config in (local, other)]
+    with Session() as db:
+        db.add(User(id=1, email="cfg@example.com", hashed_password="x"))
+        db.add(Task(id=1, title="t", urgency=10, importance=1, owner_id=1))
+        db.commit()
+
+    with Session() as db:
+        cfg = local.update({"weight_urgency": 0.9}, db=db, rescored=True)
+        rescore_tasks(db, cfg=cfg)
+    # Neither the updating worker nor any other one rescans the table
+    assert [watcher.tick() for watcher in watchers] == [0, 0]
+    assert other.get()["weight_urgency"] == 0.9
+
+
+def test_unrescored_bump_is_rescored_by_one_watcher(tmp_path):
+    _, Session = _shared_db(tmp_path)
+    configs = [SharedPriorityConfig(Session, check_interval_ms=60_000) for _ in range(3)]
+    watchers = [PriorityConfigWatcher(Session, config=config) for config in configs]
+    with Session() as db:
+        db.add(User(id=1, email="cfg@example.com", hashed_password="x"))
+        db.add(Task(id=1, title="t", urgency=10, importance=1, owner_id=1))
+        db.commit()
+
+    SharedPriorityConfig(Session).update({"weight_urgency": 0.2})
+    assert sorted(watcher.tick() for watcher in watchers) == [0, 0, 1]
+    with Session() as db:
+        assert db.get(PriorityConfig, 1).rescored is True
+
+
+def test_watched_config_is_refreshed_by_the_watcher_only(tmp_path):
+    _, Session = _shared_db(tmp_path)
+    local = SharedPriorityConfig(Session, check_interval_ms=0)
+    watcher = PriorityConfigWatcher(Session, config=local, interval_seconds=3600)
+    default = local.get()["weight_urgency"]
+    first_tick = threading.Event()
+    tick = watcher.tick
+    watcher.tick = lambda: (tick(), first_tick.set())[0]
+
+    async def scenario():
+        task = asyncio.create_task(watcher.run())
+        await asyncio.to_thread(first_tick.wait, 5)
+        assert local.watched
+        SharedPriorityConfig(Session).update({"weight_urgency": 0.9})
+        # No query from the event loop, even with an always-stale interval
+        assert local.get()["weight_urgency"] == default
+        watcher.tick()
+        assert local.get()["weight_urgency"] == 0.9
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert not local.watched
@@ -0,0 +1,50 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.database import Base, engine, read_engine
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _seed(headers):
+    specs = [(9, 9), (8, 7), (2, 9), (9, 2), (1, 1), (3, 3), (7, 8)]
+    payload = {"tasks": [{"title": f"t{i}", "urgency": u, "importance": imp} for i, (u, imp) in enumerate(specs)]}
+    assert client.post("/api/tasks/bulk", json=payload, headers=headers).json()["succeeded"] == len(specs)
+
+
+def test_dashboard_matches_separate_endpoints(auth_headers):
+    _seed(auth_headers)
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(read_engine, "before_cursor_execute", listener)
+    try:
+        dashboard = client.get("/api/dashboard/?limit=2", headers=auth_headers).json()
+    finally:
+        event.remove(read_engine, "before_cursor_execute", listener)
+    assert sum("FROM tasks" in s for s in statements) == 1
+
+    me = client.get("/api/auth/me", headers=auth_headers).json()
+    page = client.get("/api/tasks/?limit=2&include_total=true", headers=auth_headers).json()
+    matrix = client.get("/api/tasks/matrix/data?limit=2", headers=auth_headers).json()
+    assert dashboard["user"] == me
+    assert dashboard["tasks"] == page["tasks"]
+    assert dashboard["total"] == page["total"] == 7
+    assert dashboard["next_cursor"] == page["next_cursor"]
+    assert dashboard["matrix"] == matrix
+
+
+def test_dashboard_field_selection_and_etag(auth_headers):
+    _seed(auth_headers)
+    r = client.get("/api/dashboard/?fields=title,priority_score", headers=auth_headers)
+    assert all(set(t) == {"id", "title", "priority_score"} for t in r.json()["tasks"])
+    assert all(set(t) == {"id", "title", "priority_score"} for t in r.json()["matrix"]["quadrant_1"])
+    again = client.get("/api/dashboard/?fields=title,priority_score",
+                       headers={**auth_headers, "If-None-Match": r.headers["ETag"]})
+    assert again.status_code == 304
+    assert client.get("/api/dashboard/?fields=nope", headers=auth_headers).status_code == 400
@@ -0,0 +1,78 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.database import Base, SessionLocal, engine, read_engine
+from app.scoring import rescore_tasks
+from app.settings import clear_priority_overrides, set_priority_overrides
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _create(headers, title="t", urgency=7, importance=7):
+    r = client.post("/api/tasks/", json={"title": title, "urgency": urgency, "importance": importance},
+                    headers=headers)
+    assert r.status_code == 200
+    return r.json()
+
+
+def test_unchanged_list_returns_304_without_querying_tasks(auth_headers):
+    _create(auth_headers)
+    first = client.get("/api/tasks/", headers=auth_headers)
+    etag = first.headers["ETag"]
+    assert first.status_code == 200 and etag.startswith('"')
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(read_engine, "before_cursor_execute", listener)
+    try:
+        again = client.get("/api/tasks/", headers={**auth_headers, "If-None-Match": etag})
+    finally:
+        event.remove(read_engine, "before_cursor_execute", listener)
+    assert again.status_code == 304
+    assert again.headers["ETag"] == etag
+    assert not any("FROM tasks" in s for s in statements)
+
+
+def test_mutations_change_the_etag(auth_headers):
+    task = _create(auth_headers)
+    etags = {client.get("/api/tasks/", headers=auth_headers).headers["ETag"]}
+    _create(auth_headers, "second")
+    etags.add(client.get("/api/tasks/", headers=auth_headers).headers["ETag"])
+    client.put(f"/api/tasks/{task['id']}", json={"urgency": 2}, headers=auth_headers)
+    etags.add(client.get("/api/tasks/", headers=auth_headers).headers["ETag"])
+    client.delete(f"/api/tasks/{task['id']}", headers=auth_headers)
+    stale = client.get("/api/tasks/", headers={**auth_headers, "If-None-Match": ", ".join(etags)})
+    assert len(etags) == 3
+    assert stale.status_code == 200 and stale.headers["ETag"] not in etags
+
+
+def test_matrix_and_single_task_etags(auth_headers):
+    task = _create(auth_headers)
+    for path in ("/api/tasks/matrix/data", f"/api/tasks/{task['id']}"):
+        etag = client.get(path, headers=auth_headers).headers["ETag"]
+        assert client.get(path, headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+    # Different representations get different tags
+    assert (client.get("/api/tasks/?limit=1", headers=auth_headers).headers["ETag"]
+            != client.get("/api/tasks/", headers=auth_headers).headers["ETag"])
+
+
+def test_rescoring_changes_the_etag(auth_headers):
+    _create(auth_headers)
+    etag = client.get("/api/tasks/", headers=auth_headers).headers["ETag"]
+    try:
+        set_priority_overrides(weight_urgency=0.9)
+        db = SessionLocal()
+        try:
+            assert rescore_tasks(db) > 0
+        finally:
+            db.close()
+    finally:
+        clear_priority_overrides()
+    r = client.get("/api/tasks/", headers={**auth_headers, "If-None-Match": etag})
+    assert r.status_code == 200
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.main import app
+from app.database import Base, ReadSessionLocal, SessionLocal, engine
+from app.feed import OVERFLOW, ChangeHub
+from app.models.user import User
+from app.scheduler import FeedVersionWatcher
+from app.versioning import bump_data_version
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _token(headers):
+    return headers["Authorization"].split()[1]
+
+
+def test_hub_drops_slow_consumers():
+    async def scenario():
+        hub = ChangeHub(buffer_size=2)
+        slow, other = hub.subscribe(1), hub.subscribe(2)
+        for n in range(4):
+            hub.publish(1, {"n": n})
+        hub.publish(2, {"n": "other user"})
+        drained = [slow.queue.get_nowait() for _ in range(slow.queue.qsize())]
+        assert drained == [{"n": 0}, {"n": 1}, OVERFLOW]
+        assert other.queue.get_nowait() == {"n": "other user"}
+        assert hub.stats()["subscribers"] == 1 and hub.stats()["dropped"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_hub_catches_up_subscribers_behind_the_stored_version():
+    async def scenario():
+        hub = ChangeHub()
+        current, behind = hub.subscribe(1, version=5), hub.subscribe(2, version=3)
+        hub.publish(1, {"type": "updated", "version": 6})
+        assert hub.catch_up({1: 6, 2: 4}) == 1
+        assert behind.queue.get_nowait() == {"type": "resync", "version": 4}
+        assert current.queue.get_nowait() == {"type": "updated", "version": 6}
+        assert current.queue.empty()
+
+        # An event the subscriber was already caught up past is skipped
+        hub.publish(2, {"type": "updated", "version": 4})
+        assert behind.queue.empty()
+        assert hub.catch_up({1: 6, 2: 4}) == 0
+
+    asyncio.run(scenario())
+
+
+def test_feed_reports_changes_committed_elsewhere(auth_headers):
+    with client.websocket_connect(f"/api/tasks/feed?token={_token(auth_headers)}") as ws:
+        # As another worker would: committed here, never published to this hub
+        with SessionLocal() as db:
+            user_id = db.query(User.id).order_by(User.id.desc()).scalar()
+            bump_data_version(db, [user_id])
+            db.commit()
+            version = db.get(User, user_id).data_version
+        assert FeedVersionWatcher(ReadSessionLocal).tick() == 1
+        assert ws.receive_json() == {"type": "resync", "version": version}
+        assert FeedVersionWatcher(ReadSessionLocal).tick() == 0
+
+
+def test_feed_pushes_committed_changes(auth_headers):
+    with client.websocket_connect(f"/api/tasks/feed?token={_token(auth_headers)}") as ws:
+        created = client.post("/api/tasks/", json={"title": "Live", "urgency": 8, "importance": 8},
+                              headers=auth_headers).json()
+        event = ws.receive_json()
+        assert event["type"] == "created" and event["task"] == created
+        client.put(f"/api/tasks/{created['id']}", json={"urgency": 2}, headers=auth_headers)
+        updated = ws.receive_json()
+        assert updated["type"] == "updated" and updated["task"]["urgency"] == 2
+        assert updated["version"] == event["version"] + 1
+        client.delete(f"/api/tasks/{created['id']}", headers=auth_headers)
+        assert ws.receive_json() == {"type": "deleted", "ids": [created["id"]], "version": event["version"] + 2}
+
+
+def test_failed_mutation_publishes_nothing(auth_headers):
+    with client.websocket_connect(f"/api/tasks/feed?token={_token(auth_headers)}") as ws:
+        assert client.put("/api/tasks/999999", json={"urgency": 2}, headers=auth_headers).status_code == 404
+        client.post("/api/tasks/", json={"title": "After", "urgency": 3, "importance": 3}, headers=auth_headers)
+        assert ws.receive_json()["task"]["title"] == "After"
+
+
+def test_feed_rejects_bad_token():
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect("/api/tasks/feed?token=nope"):
+            pass
+    assert exc.value.code == 4401
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import Base, SessionLocal, engine
+from app import hashing
+from app.hashing import PasswordHasher, password_hasher
+from app.models.user import User
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def test_process_pool_hash_and_verify():
+    hasher = PasswordHasher(workers=1, max_pending=2, rounds=4)
+    try:
+        hashed = hasher.hash("s3cret")
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify_and_update("s3cret", hashed) == (True, None)
+        assert hasher.verify_and_update("wrong", hashed)[0] is False
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_pool_fails_fast():
+    hasher = PasswordHasher(workers=1, max_pending=1, rounds=4)
+    hasher._slots.acquire()  # simulate an operation in flight
+    with pytest.raises(HTTPException) as exc:
+        hasher.hash("pw")
+    assert exc.value.status_code == 503
+    hasher._slots.release()
+    hasher.shutdown()
+
+
+def test_timeout_is_503_and_keeps_slot_until_work_finishes(monkeypatch):
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    try:
+        hasher._run(time.sleep, 0)  # start the worker process
+        monkeypatch.setattr(hashing, "HASH_TIMEOUT_SECONDS", 0.2)
+        with pytest.raises(HTTPException) as exc:
+            hasher._run(time.sleep, 1.0)
+        assert exc.value.status_code == 503
+        # The worker is still busy, so its slot is still taken
+        with pytest.raises(HTTPException):
+            hasher._run(time.sleep, 0)
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(hasher._run_async(time.sleep, 0))
+        assert exc.value.status_code == 503
+
+        time.sleep(1.2)
+        monkeypatch.setattr(hashing, "HASH_TIMEOUT_SECONDS", 30)
+        assert hasher._run(time.sleep, 0) is None
+        assert asyncio.run(hasher._run_async(time.sleep, 0)) is None
+    finally:
+        hasher.shutdown()
+
+
+def test_login_rehashes_when_rounds_change(monkeypatch):
+    monkeypatch.setattr(password_hasher, "workers", 0)
+    monkeypatch.setattr(password_hasher, "rounds", 4)
+    r = client.post("/api/auth/register", json={"email": "rehash@example.com", "password": "pw123456"})
+    assert r.status_code == 200, r.text
+
+    monkeypatch.setattr(password_hasher, "rounds", 5)
+    r = client.post("/api/auth/login", data={"username": "rehash@example.com", "password": "pw123456"})
+    assert r.status_code == 200, r.text
+
+    db = SessionLocal()
+    stored = db.query(User).filter(User.email == "rehash@example.com").first().hashed_password
+    db.close()
+    assert stored.startswith("$2b$05$")
+
+    r = client.post("/api/auth/login", data={"username": "rehash@example.com", "password": "nope"})
+    assert r.status_code == 401
+
+
+def test_register_and_login_await_the_pool(monkeypatch):
+    # The sync helpers would block a threadpool thread for the whole hash
+    def blocking(*_):
+        raise AssertionError("hashed on a threadpool thread")
+
+    monkeypatch.setattr(password_hasher, "hash", blocking)
+    monkeypatch.setattr(password_hasher, "verify_and_update", blocking)
+    monkeypatch.setattr(password_hasher, "rounds", 4)
+    r = client.post("/api/auth/register", json={"email": "awaited@example.com", "password": "pw123456"})
+    assert r.status_code == 200, r.text
+    r = client.post("/api/auth/login", data={"username": "awaited@example.com", "password": "pw123456"})
+    assert r.status_code == 200, r.text
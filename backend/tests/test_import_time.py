@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds a cold ``import app.main`` may take (best of a few runs); about
+# 0.7 s on a developer laptop. Override locally for slow machines.
+IMPORT_TIME_BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", 1.5))
+
+DEFERRED = ("jose", "passlib", "bcrypt", "cryptography", "numpy")
+
+_PROBE = """
+import sys, time
+t = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - t
+print(elapsed)
+print(",".join(m for m in sys.argv[1:] if m in sys.modules))
+"""
+
+
+def _cold_import() -> tuple[float, list[str]]:
+    out = subprocess.run([sys.executable, "-c", _PROBE, *DEFERRED], cwd=BACKEND,
+                         env=dict(os.environ, PYTHONPATH=BACKEND), capture_output=True, text=True, check=True)
+    elapsed, loaded = out.stdout.splitlines()[-2:]
+    return float(elapsed), [m for m in loaded.split(",") if m]
+
+
+def test_heavy_dependencies_are_deferred():
+    _, loaded = _cold_import()
+    assert loaded == []
+
+
+@pytest.mark.skipif(bool(os.getenv("CI")), reason="wall-clock budget is for local runs; shared CI runners are too noisy")
+def test_cold_import_within_budget():
+    best = min(_cold_import()[0] for _ in range(3))
+    assert best < IMPORT_TIME_BUDGET_SECONDS, f"import app.main took {best:.2f}s"
@@ -0,0 +1,50 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import Base, engine
+from app.models.task import quadrant_for
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _create(headers, urgency, importance):
+    r = client.post("/api/tasks/", json={"title": "t", "urgency": urgency, "importance": importance},
+                    headers=headers)
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_quadrant_for():
+    assert quadrant_for(9, 9) == 1
+    assert quadrant_for(2, 9) == 2
+    assert quadrant_for(9, 2) == 3
+    assert quadrant_for(2, 1) == 4
+
+
+def test_matrix_counts_and_limits(auth_headers):
+    for u in (6, 7, 8, 9, 10):
+        _create(auth_headers, u, 9)  # Q1
+    _create(auth_headers, 2, 9)  # Q2
+    _create(auth_headers, 9, 2)  # Q3
+
+    r = client.get("/api/tasks/matrix/data", params={"limit": 2}, headers=auth_headers)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["counts"] == {"quadrant_1": 5, "quadrant_2": 1, "quadrant_3": 1, "quadrant_4": 0}
+    assert len(data["quadrant_1"]) == 2
+    assert data["quadrant_1"][0]["urgency"] == 10
+    assert data["quadrant_4"] == []
+
+
+def test_update_moves_task_between_quadrants(auth_headers):
+    task = _create(auth_headers, 9, 9)
+    r = client.put(f"/api/tasks/{task['id']}", json={"importance": 1}, headers=auth_headers)
+    assert r.status_code == 200
+    data = client.get("/api/tasks/matrix/data", headers=auth_headers).json()
+    assert [t["id"] for t in data["quadrant_3"]] == [task["id"]]
+    assert data["counts"]["quadrant_1"] == 0
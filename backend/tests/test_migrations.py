@@ -0,0 +1,86 @@
+import threading
+
+from sqlalchemy import create_engine, inspect
+
+from app.database import Base
+from app.migrations import MIGRATIONS, run_migrations
+from app.models.task import Task  # noqa: F401 - register models
+from app.models.user import User  # noqa: F401
+
+
+def _legacy_engine(path):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR)")
+        conn.exec_driver_sql(
+            "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR, description TEXT, "
+            "urgency INTEGER, importance INTEGER, owner_id INTEGER, created_at TIMESTAMP, updated_at TIMESTAMP)"
+        )
+    return engine
+
+
+def test_migrations_upgrade_legacy_schema(tmp_path):
+    engine = _legacy_engine(tmp_path / "legacy.db")
+    applied = run_migrations(engine)
+    assert applied == sorted(m.version for m in MIGRATIONS)
+
+    inspector = inspect(engine)
+    cols = {c["name"] for c in inspector.get_columns("tasks")}
+    assert {"impact", "value_alignment", "effort", "due_date", "priority_score"} <= cols
+    assert "ix_tasks_due_date" in {ix["name"] for ix in inspector.get_indexes("tasks")}
+
+    # Second run is a no-op
+    assert run_migrations(engine) == []
+
+
+def test_migrations_idempotent_on_fresh_schema(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    Base.metadata.create_all(bind=engine)
+    assert run_migrations(engine) == sorted(m.version for m in MIGRATIONS)
+
+
+def test_concurrent_runners_apply_each_migration_once(tmp_path):
+    path = tmp_path / "concurrent.db"
+    _legacy_engine(path).dispose()
+    results = []
+
+    def worker():
+        results.append(run_migrations(create_engine(f"sqlite:///{path}")))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    applied = [v for r in results for v in r]
+    assert sorted(applied) == sorted(m.version for m in MIGRATIONS)
+
+
+def test_concurrent_boot_on_fresh_database(tmp_path):
+    path = tmp_path / "boot.db"
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(run_migrations(create_engine(f"sqlite:///{path}"), metadata=Base.metadata))
+        except Exception as exc:  # pragma: no cover - the failure being tested for
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert sorted(v for r in results for v in r) == sorted(m.version for m in MIGRATIONS)
+
+
+def test_search_index_backfills_existing_tasks(tmp_path):
+    engine = _legacy_engine(tmp_path / "search.db")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO tasks (id, title, owner_id) VALUES (1, 'Legacy budget task', 1)")
+    run_migrations(engine)
+    with engine.begin() as conn:
+        assert conn.exec_driver_sql("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'budget'").all() == [(1,)]
+        conn.exec_driver_sql("UPDATE tasks SET title = 'Legacy invoice task' WHERE id = 1")
+        assert conn.exec_driver_sql("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'budget'").all() == []
@@ -0,0 +1,58 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import Base, engine
+from app.pagination import decode_cursor, encode_cursor
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _create(headers, urgency, importance):
+    r = client.post("/api/tasks/", json={"title": f"u{urgency}i{importance}", "urgency": urgency,
+                                         "importance": importance}, headers=headers)
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_cursor_roundtrip():
+    assert decode_cursor(encode_cursor(42.5, 7)) == (42.5, 7)
+    r = client.get("/api/tasks/?cursor=not-a-cursor", headers={})
+    assert r.status_code in (400, 401)
+
+
+def test_pages_cover_all_tasks_in_rank_order(auth_headers):
+    created = [_create(auth_headers, u, i) for u in range(1, 8) for i in (3, 8)]
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 4, "include_total": "false"}
+        if cursor:
+            params["cursor"] = cursor
+        r = client.get("/api/tasks/", params=params, headers=auth_headers)
+        assert r.status_code == 200, r.text
+        page = r.json()
+        assert page["total"] is None
+        assert len(page["tasks"]) <= 4
+        seen.extend(page["tasks"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert sorted(t["id"] for t in seen) == sorted(t["id"] for t in created)
+    keys = [(t["priority_score"], t["id"]) for t in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_total_is_counted_separately(auth_headers):
+    for u in (2, 9):
+        _create(auth_headers, u, 5)
+    assert client.get("/api/tasks/", params={"limit": 1}, headers=auth_headers).json()["total"] is None
+    r = client.get("/api/tasks/", params={"limit": 1, "include_total": "true"}, headers=auth_headers)
+    data = r.json()
+    assert data["total"] == 2
+    assert len(data["tasks"]) == 1
+    assert data["next_cursor"]
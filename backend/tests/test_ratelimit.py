@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.ratelimit import (DEFAULT_RULES, MemoryStore, RateLimit, RateLimiter, SQLiteStore, StoreUnavailable,
+                           parse_rules)
+from app.security import rate_limiter
+
+client = TestClient(app)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _exhaust(limiter, client_key="1.2.3.4", path="/api/tasks/"):
+    results = []
+    for _ in range(12):
+        results.append(limiter.check(client_key, path)[0])
+    return results
+
+
+def test_sliding_window_limits_and_recovers():
+    clock = FakeClock()
+    limiter = RateLimiter(MemoryStore(), {"/api/tasks": RateLimit(10, 60)}, clock=clock)
+    assert _exhaust(limiter) == [True] * 10 + [False] * 2
+
+    allowed, retry_after = limiter.check("1.2.3.4", "/api/tasks/")
+    assert not allowed and 0 < retry_after <= 60
+
+    # Halfway through the next window half of the previous window still counts
+    clock.now = (clock.now // 60 + 1) * 60 + 30
+    assert _exhaust(limiter) == [True] * 5 + [False] * 7
+
+    # After two idle windows the client starts fresh
+    clock.now += 120
+    assert limiter.check("1.2.3.4", "/api/tasks/")[0]
+
+
+def test_rules_are_per_route_and_longest_prefix():
+    rules = parse_rules("/api=100/60; /api/auth=2/60")
+    limiter = RateLimiter(MemoryStore(), rules, clock=FakeClock())
+    assert [limiter.check("c", "/api/auth/login")[0] for _ in range(3)] == [True, True, False]
+    assert limiter.check("c", "/api/tasks/")[0]
+    assert limiter.check("c", "/unlimited")[0]
+
+
+def test_default_rules_cover_config_updates():
+    limiter = RateLimiter(MemoryStore(), parse_rules(DEFAULT_RULES), clock=FakeClock())
+    assert limiter.rule_for("/api/config/priority") is not None
+    assert limiter.rule_for("/api/tasks/") is not None
+
+
+def test_memory_store_evicts_idle_clients():
+    store = MemoryStore(max_keys=3)
+    limiter = RateLimiter(store, {"/": RateLimit(5, 60)}, clock=FakeClock())
+    for ip in ("a", "b", "c", "d"):
+        limiter.check(ip, "/")
+    assert len(store) == 3
+    assert "/|a" not in store._data
+
+
+def test_sqlite_store_shared_between_limiters(tmp_path):
+    path = str(tmp_path / "limits.db")
+    clock = FakeClock()
+    rules = {"/api/tasks": RateLimit(10, 60)}
+    first = RateLimiter(SQLiteStore(path), rules, clock=clock)
+    second = RateLimiter(SQLiteStore(path), rules, clock=clock)
+    for _ in range(6):
+        assert first.check("ip", "/api/tasks/")[0]
+    assert [second.check("ip", "/api/tasks/")[0] for _ in range(5)] == [True] * 4 + [False]
+
+
+def test_middleware_returns_429_with_retry_after(monkeypatch):
+    limited = RateLimiter(MemoryStore(), {"/api/health": RateLimit(1, 60)})
+    monkeypatch.setattr(rate_limiter, "store", limited.store)
+    monkeypatch.setattr(rate_limiter, "rules", limited.rules)
+    assert client.get("/api/health").status_code == 200
+    r = client.get("/api/health")
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+
+
+class BrokenStore:
+    blocking = True
+
+    def __init__(self):
+        self.on_event_loop = []
+
+    def hit(self, key, rule, now):
+        self.on_event_loop.append(asyncio._get_running_loop() is not None)
+        raise ConnectionError("store down")
+
+    def clear(self):
+        pass
+
+
+def test_store_failure_fails_open_or_closed():
+    rules = {"/api/tasks": RateLimit(1, 60)}
+    assert RateLimiter(BrokenStore(), rules).check("ip", "/api/tasks/") == (True, 0.0)
+    with pytest.raises(StoreUnavailable):
+        RateLimiter(BrokenStore(), rules, fail_open=False).check("ip", "/api/tasks/")
+
+
+def test_middleware_runs_blocking_store_off_the_event_loop(monkeypatch):
+    store = BrokenStore()
+    monkeypatch.setattr(rate_limiter, "store", store)
+    monkeypatch.setattr(rate_limiter, "rules", [("/api/health", RateLimit(1, 60))])
+    monkeypatch.setattr(rate_limiter, "fail_open", True)
+    assert client.get("/api/health").status_code == 200
+    assert store.on_event_loop == [False]
+
+    monkeypatch.setattr(rate_limiter, "fail_open", False)
+    r = client.get("/api/health")
+    assert r.status_code == 503
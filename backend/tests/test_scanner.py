@@ -0,0 +1,66 @@
+import re
+
+import pytest
+
+from app.scanner import DANGEROUS_RULES, ContentScanner, Finding, Rule, content_scanner
+
+SAMPLES = [
+    ("Plan the sprint", "Nothing to see here"),
+    ("Read <SCRIPT src=x>alert(1)</script>", None),
+    ("Docs", "see JavaScript:void(0) for details"),
+    ("Click", "<img onerror = 'x'>"),
+    ("Embed", "an <iframe src=x> and an <object data=y>"),
+    ("Formula a=b", "ratio: 3 < 4"),
+    ("Note: onboarding", "<embed src=z>"),
+    ("Multi-line <script>", "\n</script>"),
+]
+
+
+def _reference(title, description):
+    """The original per-rule, per-field checks."""
+    for rule in DANGEROUS_RULES:
+        for text in (title, description):
+            if text and re.search(rule.pattern, text, re.IGNORECASE):
+                return True
+    return False
+
+
+@pytest.mark.parametrize("title,description", SAMPLES)
+def test_scan_agrees_with_per_rule_search(title, description):
+    assert (content_scanner.scan(title, description) is not None) == _reference(title, description)
+
+
+def test_scan_reports_rule_field_and_offset():
+    assert content_scanner.scan("ok", "x <iframe src=1>") == Finding("iframe_tag", "description", 2)
+    assert content_scanner.scan("go javascript:", None) == Finding("javascript_url", "title", 3)
+    assert content_scanner.scan("onclick=1", "<embed>") == Finding("event_handler", "title", 0)
+
+
+def test_matches_never_span_fields():
+    # Each half is harmless on its own
+    assert content_scanner.scan("<script>", "</script>") is None
+    assert content_scanner.scan("hover onload", "= 1") is None
+
+
+def test_scan_many_matches_scan():
+    payloads = SAMPLES * 3
+    assert content_scanner.scan_many(payloads) == [content_scanner.scan(t, d) for t, d in payloads]
+    assert content_scanner.scan_many([]) == []
+
+
+def test_custom_rules():
+    scanner = ContentScanner([Rule("secret", r"password\s*=", "=")])
+    assert scanner.scan("PASSWORD = hunter2") == Finding("secret", "title", 0)
+    assert scanner.scan("no equals sign password") is None
+
+
+def test_non_ascii_text_uses_ignorecase_patterns():
+    # U+017F (long s) matches "s" under IGNORECASE but is not lowercased to it
+    assert content_scanner.scan("café <ſcript>x</script>") == Finding("script_tag", "title", 5)
+    assert content_scanner.scan("été", "JAVASCRIPT:x") == Finding("javascript_url", "description", 0)
+
+
+def test_rules_must_be_lowercase():
+    with pytest.raises(ValueError):
+        ContentScanner([Rule("shout", r"ALERT\(", "(")])
+    ContentScanner([Rule("escapes", r"on\S+=", "=")])  # escape sequences may be uppercase
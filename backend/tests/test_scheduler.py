@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.lease import SchedulerLease  # noqa: F401 - register table
+from app.models.task import Task
+from app.models.user import User
+from app.scheduler import DueDateRescorer, JobLease, _leased
+from app.scoring import score_row
+
+
+def _session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def _add_task(db, owner_id, due_date, now):
+    task = Task(title="t", urgency=5, importance=5, due_date=due_date, owner_id=owner_id)
+    # Score as of creation time so drift is visible later
+    task.priority_score = score_row(5, 5, None, None, None, due_date, now=now)
+    db.add(task)
+    return task
+
+
+def test_tick_rescores_only_window_tasks():
+    Session = _session_factory()
+    start = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    db = Session()
+    user = User(email="sched@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    in_window = _add_task(db, user.id, start + timedelta(days=2), start)
+    leaving = _add_task(db, user.id, start + timedelta(hours=1), start)
+    far = _add_task(db, user.id, start + timedelta(days=60), start)
+    no_due = _add_task(db, user.id, None, start)
+    db.commit()
+    ids = {t.id: t.priority_score for t in (in_window, leaving, far, no_due)}
+    db.close()
+
+    rescorer = DueDateRescorer(Session, interval_seconds=60)
+    rescorer.last_tick = start
+    later = start + timedelta(hours=6)
+    assert rescorer.tick(now=later) == 2
+
+    db = Session()
+    scores = {t.id: t.priority_score for t in db.query(Task).all()}
+    db.close()
+    assert scores[in_window.id] > ids[in_window.id]
+    assert scores[leaving.id] < ids[leaving.id]
+    assert scores[far.id] == ids[far.id]
+    assert scores[no_due.id] == ids[no_due.id]
+
+    # Nothing changed since the last tick -> no writes
+    assert rescorer.tick(now=later) == 0
+
+
+def test_lease_elects_one_holder_until_it_expires():
+    Session = _session_factory()
+    now = [1000.0]
+    first, second = (JobLease(Session, "job", ttl_seconds=60, holder=name, clock=lambda: now[0])
+                     for name in ("worker-1", "worker-2"))
+    assert first.acquire() and not second.acquire()
+
+    now[0] += 50
+    assert first.acquire()  # renewed for another 60 s
+    now[0] += 50
+    assert not second.acquire()
+
+    # The holder stopped renewing: the other worker takes over
+    now[0] += 61
+    assert second.acquire() and not first.acquire()
+
+    second.release()
+    assert first.acquire()
+
+
+def test_leased_tick_runs_only_in_the_holder():
+    Session = _session_factory()
+    ticks = []
+
+    def tick():
+        ticks.append(1)
+        return 1
+
+    holders = [_leased(JobLease(Session, "job", ttl_seconds=60, holder=f"worker-{n}"), tick) for n in range(3)]
+    assert [leased() for leased in holders] == [1, 0, 0]
+    assert len(ticks) == 1
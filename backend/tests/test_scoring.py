@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+from app.scoring import score_columns, score_row, rescore_tasks
+from app.settings import set_priority_overrides, clear_priority_overrides
+
+
+def _sample_rows(now):
+    return [
+        (1, 1, None, None, None, None),
+        (10, 10, 10, 10, 1, now + timedelta(hours=3)),
+        (7, 3, 5, None, 9, now + timedelta(days=2)),
+        (5, 5, 5, 5, 5, now + timedelta(days=30)),
+        (6, 8, 2, 4, 3, now - timedelta(hours=1)),
+        (4, 9, 5, 5, 5, (now + timedelta(days=1)).replace(tzinfo=None)),
+    ]
+
+
+def test_batch_scores_match_per_row_scores():
+    now = datetime.now(timezone.utc)
+    rows = _sample_rows(now)
+    batch = score_columns(*zip(*rows), now=now)
+    single = [score_row(*row, now=now) for row in rows]
+    assert len(batch) == len(single)
+    for b, s in zip(batch, single):
+        assert abs(b - s) <= 0.01
+
+
+def test_model_uses_shared_scoring():
+    due = datetime.now(timezone.utc) + timedelta(days=1)
+    task = Task(urgency=8, importance=6, impact=5, value_alignment=5, effort=3, due_date=due)
+    assert abs(task.calculate_priority_score() - score_row(8, 6, 5, 5, 3, due)) <= 0.01
+
+
+def test_rescore_tasks_updates_stale_scores():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    try:
+        user = User(email="rescore@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        for u in range(1, 11):
+            task = Task(title=f"t{u}", urgency=u, importance=5, owner_id=user.id)
+            task.priority_score = task.calculate_priority_score()
+            db.add(task)
+        db.commit()
+
+        set_priority_overrides(weight_urgency=1.0)
+        try:
+            updated = rescore_tasks(db, chunk_size=3)
+            assert updated > 0
+            for task in db.query(Task).all():
+                db.refresh(task)
+                assert task.priority_score == task.calculate_priority_score()
+            assert rescore_tasks(db, chunk_size=3) == 0
+        finally:
+            clear_priority_overrides()
+    finally:
+        db.close()
@@ -0,0 +1,102 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import Base, SessionLocal, engine
+from app.models.user import User
+from app.search import match_expression
+from app.security import create_access_token
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _create(headers, title, description=None, urgency=5, importance=5):
+    payload = {"title": title, "description": description, "urgency": urgency, "importance": importance}
+    return client.post("/api/tasks/", json=payload, headers=headers).json()
+
+
+def _search(headers, q, **params):
+    response = client.get("/api/tasks/search", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _ids(body):
+    return [t["id"] for t in body["tasks"]]
+
+
+def test_match_expression_quotes_input():
+    assert match_expression('budget "report" OR rep*') == '"budget" "report" "OR" "rep"*'
+    with pytest.raises(HTTPException):
+        match_expression("*** ---")
+
+
+def test_search_matches_title_and_description(auth_headers):
+    title = _create(auth_headers, "Quarterly budget review")
+    body = _create(auth_headers, "Call accountant", "discuss the budget numbers")
+    _create(auth_headers, "Water plants")
+    result = _search(auth_headers, "budget")
+    assert set(_ids(result)) == {title["id"], body["id"]}
+    # Title matches outrank description matches at equal priority
+    assert _ids(result)[0] == title["id"]
+    assert result["tasks"][0] == title
+
+
+def test_search_prefix_and_all_words(auth_headers):
+    report = _create(auth_headers, "Draft migration report")
+    repair = _create(auth_headers, "Repair migration script")
+    assert set(_ids(_search(auth_headers, "rep*"))) == {report["id"], repair["id"]}
+    assert _ids(_search(auth_headers, "migration draft")) == [report["id"]]
+    assert _ids(_search(auth_headers, "rep")) == []
+
+
+def test_priority_breaks_relevance_ties(auth_headers):
+    low = _create(auth_headers, "Invoice supplier", urgency=1, importance=1)
+    high = _create(auth_headers, "Invoice customer", urgency=10, importance=10)
+    assert _ids(_search(auth_headers, "invoice")) == [high["id"], low["id"]]
+
+
+def test_index_follows_updates_and_deletes(auth_headers):
+    task = _create(auth_headers, "Renew passport")
+    client.put(f"/api/tasks/{task['id']}", json={"title": "Renew visa"}, headers=auth_headers)
+    assert _ids(_search(auth_headers, "passport")) == []
+    assert _ids(_search(auth_headers, "visa")) == [task["id"]]
+    client.delete(f"/api/tasks/{task['id']}", headers=auth_headers)
+    assert _ids(_search(auth_headers, "visa")) == []
+
+
+def test_search_is_scoped_to_owner(auth_headers):
+    _create(auth_headers, "Secret zebra project")
+    db = SessionLocal()
+    try:
+        db.add(User(email="search-stranger@example.com", hashed_password="unused"))
+        db.commit()
+    finally:
+        db.close()
+    stranger = {"Authorization": f"Bearer {create_access_token({'sub': 'search-stranger@example.com'})}"}
+    assert _ids(_search(auth_headers, "zebra"))
+    assert _ids(_search(stranger, "zebra")) == []
+
+
+def test_search_paginates_with_cursor(auth_headers):
+    ids = {_create(auth_headers, f"Batch item {n}", urgency=n + 1)["id"] for n in range(5)}
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = _search(auth_headers, "batch", **params)
+        seen += _ids(body)
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert len(seen) == len(set(seen)) == 5 and set(seen) == ids
+
+
+def test_search_rejects_empty_query(auth_headers):
+    response = client.get("/api/tasks/search", params={"q": "!!"}, headers=auth_headers)
+    assert response.status_code == 400
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+import app.serialization as serialization
+from app.main import app
+from app.database import Base, engine
+from app.schemas.task import TaskResponse
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def test_fast_path_matches_pydantic_wire_format(auth_headers):
+    due = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    for payload in (
+        {"title": "full", "description": "d", "urgency": 7, "importance": 9, "due_date": due},
+        {"title": "sparse", "urgency": 1, "importance": 1, "impact": None, "effort": None},
+    ):
+        assert client.post("/api/tasks/", json=payload, headers=auth_headers).status_code == 200
+
+    listed = client.get("/api/tasks/", headers=auth_headers).json()["tasks"]
+    for item in listed:
+        single = client.get(f"/api/tasks/{item['id']}", headers=auth_headers).json()
+        assert item == single
+        assert item == jsonable_encoder(TaskResponse.model_validate(item))
+
+
+def test_stdlib_fallback_encodes_like_orjson(monkeypatch):
+    row = (1, "t", None, 5, 5, 5, 5, 5, datetime(2030, 1, 2, 3, 4, 5, 600), 42.5,
+           datetime(2030, 1, 1), None)
+    payload = {"tasks": serialization.rows_to_dicts([row])}
+    fast = serialization.dumps(payload)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.dumps(payload) == fast
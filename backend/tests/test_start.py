@@ -0,0 +1,131 @@
+import os
+
+import pytest
+
+from app import start
+from app.start import sanitize_py, uvicorn_options
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    # main() sets RATE_LIMIT_BACKEND in os.environ for the workers it starts
+    monkeypatch.setattr(os, "environ", dict(os.environ))
+
+
+def test_sanitize_fixes_encoding_damage(tmp_path):
+    (tmp_path / "bom.py").write_bytes(b"\xef\xbb\xbfx = 1\n")
+    (tmp_path / "utf16.py").write_bytes(b"\xff\xfe" + "y = 2\n".encode("utf-16-le"))
+    (tmp_path / "nul.py").write_bytes(b"z = 3\x00\n")
+    (tmp_path / "clean.py").write_bytes(b"w = 4\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "skipped.py").write_bytes(b"\xef\xbb\xbfv = 5\n")
+
+    fixed = sanitize_py(tmp_path)
+
+    assert sorted(p.name for p in fixed) == ["bom.py", "nul.py", "utf16.py"]
+    assert (tmp_path / "bom.py").read_bytes() == b"x = 1\n"
+    assert (tmp_path / "utf16.py").read_bytes() == b"y = 2\n"
+    assert (tmp_path / "nul.py").read_bytes() == b"z = 3\n"
+    assert (tmp_path / "node_modules" / "skipped.py").read_bytes().startswith(b"\xef\xbb\xbf")
+
+
+def test_sanitize_cache_skips_unchanged_files(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    module = src / "module.py"
+    module.write_bytes(b"abc = 1\n")
+    cache = tmp_path / "cache.json"
+    assert sanitize_py(src, cache) == []
+    assert cache.exists()
+
+    # Same size and mtime: taken from the cache, so the damage isn't seen
+    stat = module.stat()
+    module.write_bytes(b"\xef\xbb\xbfab=1\n")
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert sanitize_py(src, cache) == []
+
+    # A newer mtime makes it re-read
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert sanitize_py(src, cache) == [module]
+    assert module.read_bytes() == b"ab=1\n"
+
+
+def test_development_options_reload():
+    options = uvicorn_options(production=False)
+    assert options["reload"] is True
+    assert "workers" not in options
+
+
+def test_production_options(monkeypatch):
+    monkeypatch.setenv("WEB_WORKERS", "3")
+    monkeypatch.setenv("WORKER_MAX_REQUESTS", "5000")
+    monkeypatch.setenv("PORT", "9000")
+    options = uvicorn_options(production=True)
+    assert options["workers"] == 3
+    assert options["limit_max_requests"] == 5000
+    assert options["reload"] is False
+    assert options["port"] == 9000
+    assert options["loop"] in ("uvloop", "asyncio")
+    assert options["http"] in ("httptools", "h11")
+
+    monkeypatch.delenv("WEB_WORKERS")
+    monkeypatch.delenv("WORKER_MAX_REQUESTS")
+    options = uvicorn_options(production=True)
+    assert options["workers"] == start._cpu_count()
+    assert options["limit_max_requests"] is None
+
+
+def test_production_skips_sanitization(monkeypatch):
+    calls = []
+    monkeypatch.delenv("SANITIZE_SOURCES", raising=False)
+    monkeypatch.setattr(start, "sanitize_py", lambda *args: calls.append(args))
+    monkeypatch.setattr("uvicorn.run", lambda app, **options: calls.append(options))
+    start.main(["--production"])
+    assert len(calls) == 1 and calls[0]["reload"] is False
+
+    calls.clear()
+    start.main([])
+    assert len(calls) == 2 and calls[1]["reload"] is True
+
+
+def test_several_workers_share_rate_limits(monkeypatch):
+    calls = []
+    monkeypatch.setenv("WEB_WORKERS", "4")
+    monkeypatch.delenv("RATE_LIMIT_BACKEND", raising=False)
+    monkeypatch.setattr("uvicorn.run", lambda app, **options: calls.append(os.environ["RATE_LIMIT_BACKEND"]))
+    start.main(["--production"])
+    assert calls == ["sqlite"]
+
+    monkeypatch.setenv("RATE_LIMIT_BACKEND", "redis")
+    start.main(["--production"])
+    assert calls == ["sqlite", "redis"]
+
+
+def test_single_worker_keeps_memory_rate_limits(monkeypatch):
+    monkeypatch.setenv("WEB_WORKERS", "1")
+    monkeypatch.delenv("WORKER_MAX_REQUESTS", raising=False)
+    monkeypatch.delenv("RATE_LIMIT_BACKEND", raising=False)
+    monkeypatch.setattr("uvicorn.run", lambda app, **options: None)
+    start.main(["--production"])
+    assert "RATE_LIMIT_BACKEND" not in os.environ
+
+
+def test_recycled_single_worker_is_supervised(monkeypatch):
+    started = []
+
+    class FakeSupervisor:
+        def __init__(self, config, target, sockets):
+            started.append((config.workers, config.limit_max_requests, len(sockets)))
+            sockets[0].close()
+
+        def run(self):
+            pass
+
+    monkeypatch.setenv("WEB_WORKERS", "1")
+    monkeypatch.setenv("WORKER_MAX_REQUESTS", "100")
+    monkeypatch.setenv("PORT", "0")
+    monkeypatch.setattr("uvicorn.supervisors.Multiprocess", FakeSupervisor)
+    monkeypatch.setattr("uvicorn.run", lambda app, **options: started.append("unsupervised"))
+    start.main(["--production"])
+    assert started == [(1, 100, 1)]
+
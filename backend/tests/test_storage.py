@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+
+from app.storage import StorageSettings, TimedQueuePool, apply_pragmas, effective_settings, pool_stats
+
+
+def _settings(monkeypatch, path, **env):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{path}")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return StorageSettings.from_env()
+
+
+def _engine(settings):
+    engine = create_engine(settings.url, **settings.engine_kwargs())
+    apply_pragmas(engine, settings)
+    return engine
+
+
+def test_tuned_profile_applies_pragmas(monkeypatch, tmp_path):
+    settings = _settings(monkeypatch, tmp_path / "tuned.db", SQLITE_BUSY_TIMEOUT_MS="1234", DB_POOL_SIZE="3")
+    engine = _engine(settings)
+    report = effective_settings(engine, settings)
+    assert report["profile"] == "tuned"
+    assert report["pragmas"]["journal_mode"] == "wal"
+    assert report["pragmas"]["synchronous"] == 1  # NORMAL
+    assert report["pragmas"]["busy_timeout"] == 1234
+    assert report["pragmas"]["temp_store"] == 2  # MEMORY
+    assert engine.pool.size() == 3
+
+
+def test_default_profile_keeps_sqlite_defaults(monkeypatch, tmp_path):
+    settings = _settings(monkeypatch, tmp_path / "plain.db", DB_PROFILE="default")
+    report = effective_settings(_engine(settings), settings)
+    assert settings.pragmas == {}
+    assert report["pragmas"]["journal_mode"] == "delete"
+    assert report["pragmas"]["synchronous"] == 2  # FULL
+
+
+def test_memory_database_keeps_single_connection_pool(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    settings = StorageSettings.from_env()
+    assert settings.is_memory
+    assert "pool_size" not in settings.engine_kwargs()
+
+
+def test_read_only_engine_rejects_writes(monkeypatch, tmp_path):
+    settings = _settings(monkeypatch, tmp_path / "split.db")
+    writer = _engine(settings)
+    reader = create_engine(settings.url, **settings.engine_kwargs(read_only=True), poolclass=TimedQueuePool)
+    apply_pragmas(reader, settings, read_only=True)
+    with writer.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (x INTEGER)")
+        conn.exec_driver_sql("INSERT INTO t VALUES (1)")
+    with reader.connect() as conn:
+        assert conn.exec_driver_sql("SELECT x FROM t").scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.exec_driver_sql("INSERT INTO t VALUES (2)")
+    stats = pool_stats(reader)
+    assert stats["checkouts"] == 1 and stats["size"] == settings.read_pool_size
+
+
+def test_metrics_report_pool_waits_per_side():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    pools = TestClient(app).get("/api/metrics").json()["db_pool"]
+    assert {"checkouts", "wait_avg_ms", "wait_max_ms"} <= set(pools["read"])
+    assert {"checkouts", "wait_avg_ms", "wait_max_ms"} <= set(pools["write"])
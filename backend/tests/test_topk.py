@@ -0,0 +1,89 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.database import Base, engine
+from app.models.task import Task, quadrant_for
+from app.models.user import User
+from app.scoring import score_row
+from app.topk import top_tasks, top_tasks_as_of
+
+client = TestClient(app)
+
+
+def setup_module(_):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def _create(headers, title, urgency, importance, **extra):
+    payload = {"title": title, "urgency": urgency, "importance": importance, **extra}
+    return client.post("/api/tasks/", json=payload, headers=headers).json()
+
+
+def test_top_endpoint_ranks_and_filters(auth_headers):
+    low = _create(auth_headers, "low", 2, 2)
+    high = _create(auth_headers, "high", 10, 10)
+    mid = _create(auth_headers, "mid", 9, 3, due_date="2030-01-01T00:00:00Z")
+    _create(auth_headers, "later", 8, 2, due_date="2031-01-01T00:00:00Z")
+
+    top = client.get("/api/tasks/top", params={"k": 2}, headers=auth_headers)
+    assert top.status_code == 200 and "etag" in top.headers
+    assert [t["id"] for t in top.json()["tasks"]] == [high["id"], mid["id"]]
+    assert top.json()["tasks"][0] == high
+
+    quadrant = client.get("/api/tasks/top", params={"k": 5, "quadrant": 4}, headers=auth_headers).json()
+    assert [t["id"] for t in quadrant["tasks"]] == [low["id"]]
+
+    due = client.get("/api/tasks/top", params={"k": 5, "due_before": "2030-06-01T02:00:00+02:00"},
+                     headers=auth_headers).json()
+    assert [t["id"] for t in due["tasks"]] == [mid["id"]]
+
+    fresh = client.get("/api/tasks/top", params={"k": 2, "as_of_now": True}, headers=auth_headers)
+    assert [t["id"] for t in fresh.json()["tasks"]] == [high["id"], mid["id"]]
+    assert "etag" not in fresh.headers
+
+
+def _seed(db, owner_id, rng, count, scored_at):
+    for n in range(count):
+        urgency, importance = rng.randint(1, 10), rng.randint(1, 10)
+        due = None
+        if rng.random() < 0.5:
+            due = scored_at + timedelta(hours=rng.uniform(-48, 24 * 12))
+        db.add(Task(title=f"t{n}", urgency=urgency, importance=importance, impact=5, value_alignment=5,
+                    effort=5, due_date=due, owner_id=owner_id, quadrant=quadrant_for(urgency, importance),
+                    priority_score=score_row(urgency, importance, 5, 5, 5, due, now=scored_at)))
+    db.commit()
+
+
+def test_as_of_now_matches_full_rescore():
+    test_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=test_engine)
+    db = sessionmaker(bind=test_engine)()
+    user = User(email="topk@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    scored_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    _seed(db, user.id, random.Random(3), 400, scored_at)
+
+    for days in (0, 1, 3, 7):
+        now = scored_at + timedelta(days=days)
+        expected = sorted(
+            ((score_row(t.urgency, t.importance, t.impact, t.value_alignment, t.effort, t.due_date, now=now), t.id)
+             for t in db.query(Task).all()),
+            reverse=True,
+        )
+        for k in (1, 5, 40):
+            got = top_tasks_as_of(db, user.id, k, now=now)
+            assert [(t["priority_score"], t["id"]) for t in got] == expected[:k]
+
+    # Stored ranking is unchanged by the as-of-now mode
+    stored = top_tasks(db, user.id, 5)
+    assert [t["priority_score"] for t in stored] == sorted(
+        (t.priority_score for t in db.query(Task).all()), reverse=True)[:5]
+    db.close()
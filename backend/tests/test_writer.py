@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.task import Task
+from app.models.user import User
+from app import writer as writer_module
+from app.writer import GroupCommitWriter
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'writer.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add(User(id=1, email="w@example.com", hashed_password="x"))
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+def _insert(title):
+    def mutation(db):
+        task = Task(title=title, urgency=5, importance=5, owner_id=1)
+        db.add(task)
+        db.flush()
+        return task.id
+    return mutation
+
+
+def _count(factory):
+    with factory() as db:
+        return db.scalar(select(func.count(Task.id)))
+
+
+def test_concurrent_mutations_share_commits(session_factory):
+    writer = GroupCommitWriter(session_factory, max_batch=50, window_ms=20)
+    ids = []
+    threads = [threading.Thread(target=lambda i=i: ids.append(writer.execute(_insert(f"t{i}")))) for i in range(40)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.shutdown()
+    assert len(set(ids)) == 40
+    assert _count(session_factory) == 40
+    assert writer.mutations == 40
+    assert writer.batches < 40
+
+
+def test_failing_mutation_does_not_affect_its_batch(session_factory):
+    writer = GroupCommitWriter(session_factory, max_batch=10, window_ms=50)
+
+    def fail(db):
+        db.add(Task(title="doomed", urgency=5, importance=5, owner_id=1))
+        db.flush()
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    futures = [writer.submit(_insert("a")), writer.submit(fail), writer.submit(_insert("b"))]
+    assert futures[0].result(timeout=5) and futures[2].result(timeout=5)
+    with pytest.raises(HTTPException):
+        futures[1].result(timeout=5)
+    writer.shutdown()
+    with session_factory() as db:
+        assert sorted(db.scalars(select(Task.title))) == ["a", "b"]
+
+
+def test_timed_out_mutation_is_not_applied_later(session_factory, monkeypatch):
+    writer = GroupCommitWriter(session_factory, max_batch=1, window_ms=0)
+    release = threading.Event()
+
+    def slow(db):
+        release.wait(5)
+        return _insert("slow")(db)
+
+    blocking = writer.submit(slow)
+    monkeypatch.setattr(writer_module, "WRITE_TIMEOUT_SECONDS", 0.1)
+    with pytest.raises(HTTPException) as exc:
+        writer.execute(_insert("timed out"))
+    assert exc.value.status_code == 503
+
+    release.set()
+    blocking.result(timeout=5)
+    monkeypatch.setattr(writer_module, "WRITE_TIMEOUT_SECONDS", 30)
+    writer.execute(_insert("after"))
+    writer.shutdown()
+    with session_factory() as db:
+        assert sorted(db.scalars(select(Task.title))) == ["after", "slow"]
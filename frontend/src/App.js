@@ -4,7 +4,48 @@ import TaskForm from "./components/TaskForm";
 import TaskList from "./components/TaskList";
 import EisenhowerMatrix from "./components/EisenhowerMatrix";
 import AuthPanel from "./components/AuthPanel";
-import { taskService, authService } from "./services/api";
+import { taskService, authService, feedService } from "./services/api";
+
+// Mirrors QUADRANT_THRESHOLD in backend/app/models/task.py
+const QUADRANT_THRESHOLD = 6;
+const quadrantKey = (task) => {
+  const important = task.importance >= QUADRANT_THRESHOLD;
+  const urgent = task.urgency >= QUADRANT_THRESHOLD;
+  return `quadrant_${important ? (urgent ? 1 : 2) : urgent ? 3 : 4}`;
+};
+const QUADRANT_KEYS = ["quadrant_1", "quadrant_2", "quadrant_3", "quadrant_4"];
+const byRank = (a, b) => b.priority_score - a.priority_score || b.id - a.id;
+
+// Insert or replace tasks in a ranked list
+const upsertTasks = (list, changed) => {
+  const ids = new Set(changed.map((task) => task.id));
+  return [...list.filter((task) => !ids.has(task.id)), ...changed].sort(byRank);
+};
+
+// Apply upserts/removals to matrix data. Returns null when the result can't be
+// derived locally: the API only returns the top tasks of each quadrant, so a
+// change may involve a task we don't hold while a quadrant is truncated.
+const patchMatrix = (matrix, changed, removedIds) => {
+  if (!matrix) return matrix;
+  const gone = new Set([...removedIds, ...changed.map((task) => task.id)]);
+  const truncated = QUADRANT_KEYS.some((key) => matrix.counts[key] > matrix[key].length);
+  const held = new Set(QUADRANT_KEYS.flatMap((key) => matrix[key].map((task) => task.id)));
+  if (truncated && [...gone].some((id) => !held.has(id))) return null;
+  const next = { ...matrix, counts: { ...matrix.counts } };
+  for (const key of QUADRANT_KEYS) {
+    const kept = matrix[key].filter((task) => !gone.has(task.id));
+    const removed = matrix[key].length - kept.length;
+    if (removed && matrix.counts[key] > matrix[key].length) return null;
+    next[key] = kept;
+    next.counts[key] -= removed;
+  }
+  for (const task of changed) {
+    const key = quadrantKey(task);
+    next[key] = [...next[key], task].sort(byRank);
+    next.counts[key] += 1;
+  }
+  return next;
+};
 
 function App() {
   const [tasks, setTasks] = useState([]);
@@ -22,25 +63,62 @@ function App() {
     return !!token;
   };
 
+  // Patch local state from the change feed instead of refetching everything
+  useEffect(() => {
+    if (!isAuthenticated) return undefined;
+    const resync = () => {
+      fetchTasks();
+      fetchMatrixData();
+    };
+    return feedService.connect((event) => {
+      if (event.type === "created" || event.type === "updated") {
+        applyChanges([event.task], []);
+      } else if (event.type === "deleted") {
+        applyChanges([], event.ids);
+      } else {
+        resync(); // bulk changes, rescoring, changes made elsewhere: refetch (cheap thanks to ETags)
+      }
+    }, resync);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [isAuthenticated]);
+
+  const applyChanges = (changed, removedIds) => {
+    const removed = new Set(removedIds);
+    setTasks((prev) => upsertTasks(prev.filter((task) => !removed.has(task.id)), changed));
+    setMatrixData((prev) => {
+      const next = patchMatrix(prev, changed, removedIds);
+      if (next !== null) return next;
+      queueMicrotask(fetchMatrixData);
+      return prev;
+    });
+  };
+
   useEffect(() => {
     const token = localStorage.getItem('access_token');
     if (token) {
       setIsAuthenticated(true);
-      fetchUserInfo();
-      fetchTasks();
-      fetchMatrixData();
+      fetchDashboard();
     } else {
       setLoading(false);
     }
   }, []);
 
-  const fetchUserInfo = async () => {
+  // Initial load: user, tasks and matrix in one round trip
+  const fetchDashboard = async () => {
     try {
-      const userData = await authService.getCurrentUser();
-      setUser(userData);
+      const data = await taskService.getDashboard();
+      setUser(data.user);
+      setTasks(data.tasks);
+      setMatrixData(data.matrix);
+      setError("");
     } catch (err) {
-      console.error("Failed to fetch user info:", err);
-      handleLogout();
+      if (err.response?.status === 401) {
+        handleLogout();
+      } else {
+        setError("Failed to fetch tasks. Please check if the backend is running.");
+      }
+    } finally {
+      setLoading(false);
     }
   };
 
@@ -75,10 +153,7 @@ function App() {
 
   const handleLogin = async () => {
     setIsAuthenticated(true);
-    await fetchUserInfo();
-    await fetchTasks();
-    await fetchMatrixData();
-    setLoading(false);
+    await fetchDashboard();
   };
 
   const handleLogout = () => {
@@ -92,18 +167,14 @@ function App() {
     setError("");
   };
 
+  // Applying the change here and again from the feed is harmless (upserts by id)
   const handleTaskCreated = (newTask) => {
-    setTasks((prev) => [newTask, ...prev].sort((a, b) => b.priority_score - a.priority_score));
-    fetchMatrixData(); // Refresh matrix data
+    applyChanges([newTask], []);
   };
 
   const handleTaskUpdated = (updatedTask) => {
-    setTasks((prev) =>
-      prev.map((task) => (task.id === updatedTask.id ? updatedTask : task))
-        .sort((a, b) => b.priority_score - a.priority_score)
-    );
+    applyChanges([updatedTask], []);
     setEditingTask(null);
-    fetchMatrixData(); // Refresh matrix data
   };
 
   const handleTasksUpdated = () => {
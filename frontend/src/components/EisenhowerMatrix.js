@@ -30,7 +30,11 @@ const EisenhowerMatrix = ({ matrixData }) => {
       color: "#4caf50",
       tasks: matrixData?.quadrant_4 || [],
     },
-  ];
+  ].map((quadrant) => ({
+    ...quadrant,
+    // The API returns the top tasks per quadrant plus the full counts
+    count: matrixData?.counts?.[quadrant.key] ?? quadrant.tasks.length,
+  }));
 
   return (
     <div className="eisenhower-matrix">
@@ -54,7 +58,7 @@ const EisenhowerMatrix = ({ matrixData }) => {
             >
               <h4>{quadrant.title}</h4>
               <p>{quadrant.subtitle}</p>
-              <span className="task-count">({quadrant.tasks.length} tasks)</span>
+              <span className="task-count">({quadrant.count} tasks)</span>
             </div>
             
             <div className="quadrant-tasks">
@@ -89,10 +89,32 @@ export const authService = {
 };
 
 export const taskService = {
-  // Get all tasks
-  getAllTasks: async () => {
-    const response = await api.get("/tasks/");
-    return response.data;
+  // Get all tasks (follows the cursor across pages, optionally starting from one)
+  // Pass includeTotal to also count all tasks (an extra query on the first page)
+  getAllTasks: async (startCursor = null, { includeTotal = false } = {}) => {
+    const tasks = [];
+    let cursor = startCursor;
+    let total = null;
+    do {
+      const params = { limit: 500, include_total: includeTotal && cursor === null };
+      if (cursor) params.cursor = cursor;
+      const response = await api.get("/tasks/", { params });
+      tasks.push(...response.data.tasks);
+      if (response.data.total !== null) total = response.data.total;
+      cursor = response.data.next_cursor;
+    } while (cursor);
+    return { tasks, total };
+  },
+
+  // User, first page of the ranked list and matrix in one request
+  getDashboard: async () => {
+    const response = await api.get("/dashboard/", { params: { limit: 500 } });
+    const data = response.data;
+    if (data.next_cursor) {
+      const rest = await taskService.getAllTasks(data.next_cursor);
+      data.tasks = [...data.tasks, ...rest.tasks];
+    }
+    return data;
   },
 
   // Create a new task
@@ -119,3 +141,51 @@ export const taskService = {
     return response.data;
   },
 };
+
+// Change feed: pushes committed task changes over a WebSocket (see backend
+// app/routers/feed.py). Reconnects with backoff; onResync is called whenever
+// events may have been missed so the caller can refetch.
+export const feedService = {
+  connect: (onEvent, onResync) => {
+    const base = new URL(API_BASE_URL, window.location.href);
+    base.protocol = base.protocol === "https:" ? "wss:" : "ws:";
+    let socket = null;
+    let closed = false;
+    let connectedBefore = false;
+    let retryDelay = 1000;
+    let lastVersion = null;
+
+    const open = () => {
+      const token = getAccessToken();
+      if (closed || !token) return;
+      socket = new WebSocket(`${base.href.replace(/\/$/, "")}/tasks/feed?token=${encodeURIComponent(token)}`);
+      socket.onopen = () => {
+        retryDelay = 1000;
+        lastVersion = null;
+        if (connectedBefore) onResync(); // changes may have happened while disconnected
+        connectedBefore = true;
+      };
+      socket.onmessage = (message) => {
+        const event = JSON.parse(message.data);
+        const gap = lastVersion !== null && event.version !== lastVersion + 1;
+        lastVersion = event.version;
+        if (gap) {
+          onResync(); // missed events (e.g. committed by another server worker)
+        } else {
+          onEvent(event);
+        }
+      };
+      socket.onclose = () => {
+        if (closed) return;
+        setTimeout(open, retryDelay);
+        retryDelay = Math.min(retryDelay * 2, 30000);
+      };
+    };
+
+    open();
+    return () => {
+      closed = true;
+      if (socket) socket.close();
+    };
+  },
+};